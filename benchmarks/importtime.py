@@ -0,0 +1,163 @@
+"""benchmarks.importtime"""
+
+import argparse
+import json
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from statistics import median
+
+DEFAULT_RUNS = 10
+
+# statement to time -> modules that must not be imported by it
+CASES = {
+    "import scrapli": (
+        "scrapli.cli",
+        "scrapli.netconf",
+    ),
+    "from scrapli import Cli": (
+        "scrapli.netconf",
+        "scrapli.ffi_mapping_netconf",
+        "urllib.request",
+        "xml.etree.ElementTree",
+    ),
+    "from scrapli import Netconf": ("urllib.request",),
+}
+
+
+@dataclass
+class ImportTime:
+    """
+    ImportTime holds the import time of a statement as reported by `python -X importtime`.
+
+    Args:
+        statement: the timed import statement
+        runs: count of (cold interpreter) runs
+        median_us: median cumulative us spent on the imports triggered by the statement
+        min_us: min cumulative us spent on the imports triggered by the statement
+        imported: count of modules imported by the statement
+        forbidden: modules imported that the statement should not import
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    statement: str
+    runs: int
+    median_us: float
+    min_us: int
+    imported: int
+    forbidden: list[str]
+
+
+def _import_times(statement: str) -> list[tuple[int, str, int]]:
+    """
+    Run the statement in a fresh interpreter and return the imports it triggered.
+
+    Args:
+        statement: the import statement to run
+
+    Returns:
+        list[tuple[int, str, int]]: nesting depth, module name and cumulative us of each import
+
+    Raises:
+        N/A
+
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    imports = []
+
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or line.endswith("imported package"):
+            continue
+
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+
+        imports.append((depth, name.strip(), int(cumulative)))
+
+    # everything up to the first scrapli import is interpreter startup (site and friends)
+    first = next(idx for idx, (_, name, _) in enumerate(imports) if name.startswith("scrapli"))
+
+    # nested imports are listed before their parent, so start at the first top level parent
+    while first > 0 and imports[first - 1][0] > 0:
+        first -= 1
+
+    return imports[first:]
+
+
+def time_statement(statement: str, forbidden: tuple[str, ...], runs: int) -> ImportTime:
+    """
+    Time an import statement over a number of cold interpreter runs.
+
+    Args:
+        statement: the import statement to time
+        forbidden: modules the statement must not import
+        runs: count of runs
+
+    Returns:
+        ImportTime: the timings
+
+    Raises:
+        N/A
+
+    """
+    times = []
+    imported: set[str] = set()
+
+    for _ in range(runs):
+        imports = _import_times(statement)
+        imported = {name for _, name, _ in imports}
+
+        # only top level imports count, their cumulative time includes the nested imports
+        times.append(sum(us for depth, _, us in imports if depth == 0))
+
+    return ImportTime(
+        statement=statement,
+        runs=runs,
+        median_us=median(times),
+        min_us=min(times),
+        imported=len(imported),
+        forbidden=sorted(imported.intersection(forbidden)),
+    )
+
+
+def main() -> None:
+    """Time the scrapli imports and fail if any statement imports a module it should not."""
+    parser = argparse.ArgumentParser(description="scrapli import time benchmark")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument(
+        "--max-us",
+        type=float,
+        default=None,
+        help="fail if the median import time of any statement exceeds this",
+    )
+    args = parser.parse_args()
+
+    results = [
+        time_statement(statement=statement, forbidden=forbidden, runs=args.runs)
+        for statement, forbidden in CASES.items()
+    ]
+
+    print(json.dumps([asdict(result) for result in results], indent=2))
+
+    failed = [result for result in results if result.forbidden]
+    if args.max_us is not None:
+        failed.extend(result for result in results if result.median_us > args.max_us)
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+"""benchmarks.main"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import tempfile
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from statistics import quantiles
+from time import perf_counter_ns
+from typing import Any
+
+from scrapli import AuthOptions, Cli, LookupKeyValue, Netconf, ReadCallback, __version__
+from scrapli.ffi import LIBSCRAPLI_VERSION
+from scrapli.replay import Replay
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "tests" / "unit" / "fixtures"
+CLI_FIXTURES_DIR = FIXTURES_DIR / "cli"
+NETCONF_FIXTURES_DIR = FIXTURES_DIR / "netconf"
+
+DEFAULT_ITERATIONS = 25
+DEFAULT_SEND_INPUTS_COUNTS = (1, 10, 100, 1_000, 5_000)
+
+SEND_INPUTS_INPUT = "show version | i Kern"
+SEND_INPUTS_PROMPT = "eos1#"
+
+Driver = Cli | Netconf
+
+
+@dataclass
+class Case:
+    """
+    Case is a single benchmark -- a fixture replayed through a driver and an operation to time.
+
+    Args:
+        name: name of the case
+        kind: driver kind, "cli" or "netconf"
+        fixture: path to the recorded fixture to replay
+        operation: the operation to time for sync runs
+        operation_async: the operation to time for async runs
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    name: str
+    kind: str
+    fixture: Path
+    operation: Callable[[Any], object]
+    operation_async: Callable[[Any], Awaitable[object]]
+
+
+@dataclass
+class Stats:
+    """
+    Stats holds the latency stats of a timed phase of a case.
+
+    Args:
+        samples: count of samples
+        ops_per_s: operations per second
+        p50_ms: median latency in ms
+        p99_ms: 99th percentile latency in ms
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    samples: int
+    ops_per_s: float
+    p50_ms: float
+    p99_ms: float
+
+
+@dataclass
+class CaseResult:
+    """
+    CaseResult holds the result of a case run in a given mode.
+
+    Args:
+        name: name of the case
+        mode: "sync" or "async"
+        phases: stats of the open, operation and close phases
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    name: str
+    mode: str
+    phases: dict[str, Stats] = field(default_factory=dict)
+
+
+def _stats(samples_ns: list[int]) -> Stats:
+    total_s = sum(samples_ns) / 1_000_000_000
+
+    if len(samples_ns) > 1:
+        cuts = quantiles(samples_ns, n=100, method="inclusive")
+        p50, p99 = cuts[49], cuts[98]
+    else:
+        p50 = p99 = samples_ns[0]
+
+    return Stats(
+        samples=len(samples_ns),
+        ops_per_s=round(len(samples_ns) / total_s, 3) if total_s else 0.0,
+        p50_ms=round(p50 / 1_000_000, 3),
+        p99_ms=round(p99 / 1_000_000, 3),
+    )
+
+
+def _driver(case: Case) -> Driver:
+    replay = Replay(path=str(case.fixture))
+
+    if case.kind == "cli":
+        return Cli(
+            definition_file_or_name="arista_eos",
+            host="localhost",
+            auth_options=AuthOptions(
+                username="admin",
+                password="admin",
+                lookups=[LookupKeyValue(key="enable", value="libscrapli")],
+            ),
+            session_options=replay.session_options(),
+            transport_options=replay.transport_options(),
+        )
+
+    return Netconf(
+        host="localhost",
+        auth_options=AuthOptions(username="root", password="password"),
+        session_options=replay.session_options(operation_max_search_depth=32),
+        transport_options=replay.transport_options(),
+    )
+
+
+def _run_sync(case: Case, iterations: int) -> CaseResult:
+    timings: dict[str, list[int]] = {"open": [], "operation": [], "close": []}
+
+    for _ in range(iterations):
+        driver = _driver(case)
+
+        start = perf_counter_ns()
+        driver.open()
+        timings["open"].append(perf_counter_ns() - start)
+
+        start = perf_counter_ns()
+        case.operation(driver)
+        timings["operation"].append(perf_counter_ns() - start)
+
+        start = perf_counter_ns()
+        driver.close()
+        timings["close"].append(perf_counter_ns() - start)
+
+    return CaseResult(
+        name=case.name,
+        mode="sync",
+        phases={phase: _stats(samples) for phase, samples in timings.items()},
+    )
+
+
+async def _run_async(case: Case, iterations: int) -> CaseResult:
+    timings: dict[str, list[int]] = {"open": [], "operation": [], "close": []}
+
+    for _ in range(iterations):
+        driver = _driver(case)
+
+        start = perf_counter_ns()
+        await driver.open_async()
+        timings["open"].append(perf_counter_ns() - start)
+
+        start = perf_counter_ns()
+        await case.operation_async(driver)
+        timings["operation"].append(perf_counter_ns() - start)
+
+        start = perf_counter_ns()
+        await driver.close_async()
+        timings["close"].append(perf_counter_ns() - start)
+
+    return CaseResult(
+        name=case.name,
+        mode="async",
+        phases={phase: _stats(samples) for phase, samples in timings.items()},
+    )
+
+
+def _synthesize_send_inputs_fixture(count: int, directory: Path) -> Path:
+    """
+    Extend the single input send_inputs fixture to `count` (identical) inputs.
+
+    Args:
+        count: count of inputs the fixture should answer
+        directory: directory to write the fixture to
+
+    Returns:
+        Path: the path of the fixture
+
+    Raises:
+        N/A
+
+    """
+    recorded = (CLI_FIXTURES_DIR / "send-inputs-send-single-input").read_bytes()
+
+    head, _, answer = recorded.rpartition(f"{SEND_INPUTS_PROMPT}{SEND_INPUTS_INPUT}".encode())
+
+    # the answer is everything the device sent after the input, up to and including the prompt,
+    # so repeating "input + answer" yields a session answering the input `count` times
+    f = directory / f"send-inputs-{count}"
+    f.write_bytes(
+        head + SEND_INPUTS_PROMPT.encode() + (SEND_INPUTS_INPUT.encode() + answer) * count
+    )
+
+    return f
+
+
+def _read_with_callbacks_callbacks(*, is_async: bool) -> list[ReadCallback]:
+    def cb1(c: Cli, _: str, __: str) -> None:
+        c.write_and_return("show version")
+
+    def cb2(_: Cli, __: str, ___: str) -> None:
+        return
+
+    async def a_cb1(c: Cli, _: str, __: str) -> None:
+        c.write_and_return("show version")
+
+    async def a_cb2(_: Cli, __: str, ___: str) -> None:
+        return
+
+    if is_async:
+        return [
+            ReadCallback(name="cb1", contains="eos1#", callback_async=a_cb1, once=True),
+            ReadCallback(name="cb2", contains="eos1#", callback_async=a_cb2, completes=True),
+        ]
+
+    return [
+        ReadCallback(name="cb1", contains="eos1#", callback=cb1, once=True),
+        ReadCallback(name="cb2", contains="eos1#", callback=cb2, completes=True),
+    ]
+
+
+def _send_inputs_operations(
+    inputs: list[str],
+) -> tuple[Callable[[Cli], object], Callable[[Cli], Awaitable[object]]]:
+    def operation(c: Cli) -> object:
+        return c.send_inputs(inputs=inputs)
+
+    async def operation_async(c: Cli) -> object:
+        return await c.send_inputs_async(inputs=inputs)
+
+    return operation, operation_async
+
+
+def _cases(send_inputs_counts: list[int], directory: Path) -> list[Case]:
+    cases = [
+        Case(
+            name="cli-send-input",
+            kind="cli",
+            fixture=CLI_FIXTURES_DIR / "send-input-simple",
+            operation=lambda c: c.send_input(input_="show version"),
+            operation_async=lambda c: c.send_input_async(input_="show version"),
+        ),
+        Case(
+            name="cli-read-with-callbacks",
+            kind="cli",
+            fixture=CLI_FIXTURES_DIR / "read-with-callbacks-simple",
+            operation=lambda c: c.read_with_callbacks(
+                initial_input="show version",
+                callbacks=_read_with_callbacks_callbacks(is_async=False),
+            ),
+            operation_async=lambda c: c.read_with_callbacks_async(
+                initial_input="show version",
+                callbacks=_read_with_callbacks_callbacks(is_async=True),
+            ),
+        ),
+        Case(
+            name="netconf-get-config",
+            kind="netconf",
+            fixture=NETCONF_FIXTURES_DIR / "get-config",
+            operation=lambda n: n.get_config(),
+            operation_async=lambda n: n.get_config_async(),
+        ),
+    ]
+
+    for count in send_inputs_counts:
+        operation, operation_async = _send_inputs_operations(inputs=[SEND_INPUTS_INPUT] * count)
+
+        cases.append(
+            Case(
+                name=f"cli-send-inputs-{count}",
+                kind="cli",
+                fixture=_synthesize_send_inputs_fixture(count=count, directory=directory),
+                operation=operation,
+                operation_async=operation_async,
+            )
+        )
+
+    return cases
+
+
+def main() -> None:
+    """Run the benchmark suite and write the results as json."""
+    parser = argparse.ArgumentParser(description="scrapli benchmarks")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument(
+        "--send-inputs-counts",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SEND_INPUTS_COUNTS),
+    )
+    parser.add_argument("--mode", choices=("sync", "async", "both"), default="both")
+    parser.add_argument("--filter", default="", help="only run cases containing this string")
+    parser.add_argument("--output", default="-", help="file to write json results to")
+    args = parser.parse_args()
+
+    results = []
+
+    with tempfile.TemporaryDirectory(prefix="scrapli-benchmarks") as tmp:
+        for case in _cases(send_inputs_counts=args.send_inputs_counts, directory=Path(tmp)):
+            if args.filter not in case.name:
+                continue
+
+            if args.mode in {"sync", "both"}:
+                results.append(_run_sync(case=case, iterations=args.iterations))
+
+            if args.mode in {"async", "both"}:
+                results.append(asyncio.run(_run_async(case=case, iterations=args.iterations)))
+
+    report = {
+        "metadata": {
+            "scrapli_version": __version__,
+            "libscrapli_version": LIBSCRAPLI_VERSION,
+            "python_version": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(tz=timezone.utc).isoformat(),
+            "iterations": args.iterations,
+        },
+        "results": [asdict(result) for result in results],
+    }
+
+    out = json.dumps(report, indent=2)
+
+    if args.output == "-":
+        sys.stdout.write(f"{out}\n")
+
+        return
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write(out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,466 @@
+"""benchmarks.prompts"""
+
+import argparse
+import importlib.resources
+import json
+import re
+import sys
+from dataclasses import asdict, dataclass, field
+from glob import glob
+from pathlib import Path
+from time import perf_counter_ns
+
+import yaml
+
+from scrapli.helper import without_possessive_quantifiers
+from scrapli.replay import Replay
+
+DEFAULT_RUNS = 3
+DEFAULT_READ_SIZE = 1_024
+DEFAULT_SEARCH_DEPTH = 512
+DEFAULT_MAX_SEARCH_DEPTH = 4_096
+
+# definition -> recordings (glob) to replay against it, the recorded unit test fixtures by default
+DEFAULT_CASES = ("arista_eos=tests/unit/fixtures/cli/[!_]*",)
+
+# python only supports possessive quantifiers and atomic groups from 3.11
+_POSSESSIVE_SUPPORTED = sys.version_info >= (3, 11)
+
+
+@dataclass
+class PromptPattern:
+    """
+    PromptPattern is a prompt pattern of a definition, either the definition or a mode pattern.
+
+    Args:
+        platform: name of the platform of the definition
+        mode: name of the mode, empty for the definition prompt pattern
+        pattern: the prompt pattern
+        excludes: strings that disqualify a prompt matching the pattern
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: if the pattern can not be compiled by this python
+
+    """
+
+    platform: str
+    mode: str
+    pattern: str
+    excludes: tuple[bytes, ...] = ()
+    regex: re.Pattern[bytes] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        pattern = (
+            self.pattern if _POSSESSIVE_SUPPORTED else without_possessive_quantifiers(self.pattern)
+        )
+
+        try:
+            self.regex = re.compile(pattern.encode(), flags=re.MULTILINE)
+        except re.error as exc:
+            raise ValueError(
+                f"{self.platform} {self.mode or 'definition'} prompt pattern {self.pattern!r} is "
+                f"not supported by python {sys.version_info.major}.{sys.version_info.minor}: {exc}"
+            ) from exc
+
+    def search(self, window: bytes) -> bytes | None:
+        """
+        Search the window for a (not excluded) prompt trailing the window.
+
+        Prompt like lines followed by more output are not prompts, the device sends the prompt
+        last, once the input is done.
+
+        Args:
+            window: the bytes to search
+
+        Returns:
+            bytes | None: the matched prompt or None
+
+        Raises:
+            N/A
+
+        """
+        for match in self.regex.finditer(window):
+            if window[match.end() :].strip():
+                continue
+
+            prompt = match.group()
+
+            if not any(exclude in prompt for exclude in self.excludes):
+                return prompt
+
+        return None
+
+
+@dataclass
+class PatternProfile:
+    """
+    PatternProfile holds the prompt search profile of a single prompt pattern.
+
+    Args:
+        mode: name of the mode, empty for the definition prompt pattern
+        pattern: the prompt pattern
+        searches: count of searches
+        matches: count of searches finding a prompt
+        total_us: us spent searching (fastest of the runs)
+        mean_ns: mean ns per search
+        min_safe_depth: smallest search depth finding the same prompts as an unbounded search,
+            None if no depth up to the max search depth does
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    mode: str
+    pattern: str
+    searches: int
+    matches: int
+    total_us: float
+    mean_ns: float
+    min_safe_depth: int | None
+
+
+@dataclass
+class PlatformProfile:
+    """
+    PlatformProfile holds the prompt search profile of a definition over a set of recordings.
+
+    Args:
+        platform: name of the platform of the definition
+        recordings: count of recordings replayed
+        search_depth: search depth the searches were timed at
+        total_us: us spent searching across all patterns
+        min_safe_depth: smallest search depth safe for all patterns, None if there is none up to
+            the max search depth
+        patterns: the per pattern profiles
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    platform: str
+    recordings: int
+    search_depth: int
+    total_us: float
+    min_safe_depth: int | None
+    patterns: list[PatternProfile] = field(default_factory=list)
+
+
+def load_prompt_patterns(definition_file_or_name: str) -> list[PromptPattern]:
+    """
+    Load the prompt patterns of a definition (shipped platform name or a path).
+
+    Args:
+        definition_file_or_name: shipped definition name, i.e. "arista_eos", or path
+
+    Returns:
+        list[PromptPattern]: the definition prompt pattern followed by the mode prompt patterns
+
+    Raises:
+        ValueError: if a prompt pattern can not be compiled by this python
+
+    """
+    definition_path = Path(
+        f"{importlib.resources.files('scrapli.definitions')}/{definition_file_or_name}.yaml"
+    )
+    if not definition_path.exists():
+        definition_path = Path(definition_file_or_name)
+
+    platform = definition_path.name.removesuffix(definition_path.suffix)
+    definition = yaml.safe_load(definition_path.read_text(encoding="utf-8"))
+
+    patterns = [PromptPattern(platform=platform, mode="", pattern=definition["prompt_pattern"])]
+
+    patterns.extend(
+        PromptPattern(
+            platform=platform,
+            mode=mode["name"],
+            pattern=mode["prompt_pattern"],
+            excludes=tuple(e.encode() for e in mode.get("prompt_excludes") or []),
+        )
+        for mode in definition.get("modes") or []
+    )
+
+    return patterns
+
+
+def search_buffers(
+    replay: Replay, prompt: PromptPattern, read_size: int
+) -> list[tuple[bytes, int, int]]:
+    """
+    Split a recording into the buffers searched for a prompt, one per read.
+
+    Reads are the recorded chunks if the recording has a timings sidecar, otherwise `read_size`
+    chunks. The buffer searched after a read holds everything read since the end of the last
+    operation, which is taken to be the last read the (unbounded) definition prompt matched.
+
+    Args:
+        replay: the recording
+        prompt: the definition prompt pattern
+        read_size: size of reads without a timings sidecar
+
+    Returns:
+        list[tuple[bytes, int, int]]: the recording, start and end offset of each buffer
+
+    Raises:
+        N/A
+
+    """
+    data = replay.data
+    timings = replay.timings
+
+    if timings:
+        ends = [*(offset for offset, _ in timings[1:]), len(data)]
+    else:
+        ends = [*range(read_size, len(data), read_size), len(data)]
+
+    buffers = []
+    start = 0
+
+    for end in ends:
+        if end <= start:
+            continue
+
+        buffers.append((data, start, end))
+
+        if prompt.search(data[start:end]) is not None:
+            start = end
+
+    return buffers
+
+
+def _search_depth_safe(
+    prompt: PromptPattern,
+    buffers: list[tuple[bytes, int, int]],
+    expected: list[bytes | None],
+    depth: int,
+) -> bool:
+    for (data, start, end), prompt_ in zip(buffers, expected, strict=True):
+        # buffers that fit the depth are searched in full anyway
+        if end - start > depth and prompt.search(data[end - depth : end]) != prompt_:
+            return False
+
+    return True
+
+
+def min_safe_search_depth(
+    prompt: PromptPattern,
+    buffers: list[tuple[bytes, int, int]],
+    max_depth: int,
+) -> int | None:
+    """
+    Find the smallest search depth at which every search finds what an unbounded search finds.
+
+    Too shallow a depth either misses prompts or, worse, matches the tail of a prompt or of
+    output (where "^" now matches mid line) as a prompt.
+
+    Args:
+        prompt: the prompt pattern
+        buffers: the searched buffers, see `search_buffers`
+        max_depth: the largest depth to consider
+
+    Returns:
+        int | None: the smallest safe depth, None if no depth up to max_depth is safe
+
+    Raises:
+        N/A
+
+    """
+    expected = [prompt.search(data[start:end]) for data, start, end in buffers]
+
+    # the depth has to at least cover every prompt found (including the rest of its line)
+    depth = 1
+
+    for (data, start, end), prompt_ in zip(buffers, expected, strict=True):
+        if prompt_ is not None:
+            depth = max(depth, end - data.rindex(prompt_, start, end))
+
+    while depth <= max_depth:
+        if _search_depth_safe(prompt=prompt, buffers=buffers, expected=expected, depth=depth):
+            return depth
+
+        depth += 1
+
+    return None
+
+
+def time_searches(
+    prompt: PromptPattern,
+    buffers: list[tuple[bytes, int, int]],
+    depth: int,
+    runs: int,
+) -> tuple[int, int]:
+    """
+    Time searching every buffer for the prompt at the given search depth.
+
+    Args:
+        prompt: the prompt pattern
+        buffers: the searched buffers, see `search_buffers`
+        depth: the search depth
+        runs: count of runs, the fastest is reported
+
+    Returns:
+        tuple[int, int]: count of matches and the ns spent searching
+
+    Raises:
+        N/A
+
+    """
+    windows = [data[max(start, end - depth) : end] for data, start, end in buffers]
+
+    matches = 0
+    fastest = 0
+
+    for run in range(runs):
+        matches = 0
+        elapsed = 0
+
+        for window in windows:
+            search_start = perf_counter_ns()
+            found = prompt.search(window)
+            elapsed += perf_counter_ns() - search_start
+
+            matches += found is not None
+
+        fastest = elapsed if run == 0 else min(fastest, elapsed)
+
+    return matches, fastest
+
+
+def profile_platform(  # noqa: PLR0913
+    definition_file_or_name: str,
+    recordings: list[str],
+    *,
+    read_size: int = DEFAULT_READ_SIZE,
+    search_depth: int = DEFAULT_SEARCH_DEPTH,
+    max_search_depth: int = DEFAULT_MAX_SEARCH_DEPTH,
+    runs: int = DEFAULT_RUNS,
+) -> PlatformProfile:
+    """
+    Replay recordings against the prompt patterns of a definition.
+
+    Args:
+        definition_file_or_name: shipped definition name, i.e. "arista_eos", or path
+        recordings: paths of the recordings (`SessionOptions.recorder_path` output) to replay
+        read_size: size of reads for recordings without a timings sidecar
+        search_depth: search depth to time the searches at
+        max_search_depth: the largest depth to consider when finding the smallest safe depth
+        runs: count of timing runs, the fastest is reported
+
+    Returns:
+        PlatformProfile: the profile
+
+    Raises:
+        N/A
+
+    """
+    patterns = load_prompt_patterns(definition_file_or_name=definition_file_or_name)
+
+    buffers = []
+
+    for recording in recordings:
+        buffers.extend(
+            search_buffers(replay=Replay(path=recording), prompt=patterns[0], read_size=read_size)
+        )
+
+    profiles = []
+
+    for prompt in patterns:
+        matches, elapsed_ns = time_searches(
+            prompt=prompt, buffers=buffers, depth=search_depth, runs=runs
+        )
+
+        profiles.append(
+            PatternProfile(
+                mode=prompt.mode,
+                pattern=prompt.pattern,
+                searches=len(buffers),
+                matches=matches,
+                total_us=round(elapsed_ns / 1_000, 3),
+                mean_ns=round(elapsed_ns / len(buffers), 3) if buffers else 0.0,
+                min_safe_depth=min_safe_search_depth(
+                    prompt=prompt, buffers=buffers, max_depth=max_search_depth
+                ),
+            )
+        )
+
+    safe_depths = [profile.min_safe_depth for profile in profiles]
+
+    return PlatformProfile(
+        platform=patterns[0].platform,
+        recordings=len(recordings),
+        search_depth=search_depth,
+        total_us=round(sum(profile.total_us for profile in profiles), 3),
+        min_safe_depth=(
+            None if None in safe_depths else max(d for d in safe_depths if d is not None)
+        ),
+        patterns=sorted(profiles, key=lambda profile: profile.total_us, reverse=True),
+    )
+
+
+def _parse_case(case: str) -> tuple[str, list[str]]:
+    definition_file_or_name, _, recordings = case.partition("=")
+
+    paths = sorted(path for path in glob(recordings) if Path(path).is_file())
+    if not paths:
+        raise argparse.ArgumentTypeError(f"no recordings matching '{recordings}'")
+
+    return definition_file_or_name, paths
+
+
+def main() -> None:
+    """Profile prompt searches of definitions over recorded sessions and write the results."""
+    parser = argparse.ArgumentParser(description="scrapli definition prompt pattern profiler")
+    parser.add_argument(
+        "cases",
+        nargs="*",
+        type=_parse_case,
+        help="definition name or path and a glob of its recordings, i.e. arista_eos=logs/*.log",
+    )
+    parser.add_argument("--read-size", type=int, default=DEFAULT_READ_SIZE)
+    parser.add_argument("--search-depth", type=int, default=DEFAULT_SEARCH_DEPTH)
+    parser.add_argument("--max-search-depth", type=int, default=DEFAULT_MAX_SEARCH_DEPTH)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    args = parser.parse_args()
+
+    try:
+        results = [
+            profile_platform(
+                definition_file_or_name=definition_file_or_name,
+                recordings=recordings,
+                read_size=args.read_size,
+                search_depth=args.search_depth,
+                max_search_depth=args.max_search_depth,
+                runs=args.runs,
+            )
+            for definition_file_or_name, recordings in (
+                args.cases or [_parse_case(case) for case in DEFAULT_CASES]
+            )
+        ]
+    except ValueError as exc:
+        # i.e. a prompt pattern python can not compile
+        print(f"error: {exc}", file=sys.stderr)
+        sys.exit(2)
+
+    print(json.dumps([asdict(result) for result in results], indent=2))
+
+    # a depth below the (safe) minimum risks missing or mismatching prompts
+    if any(
+        result.min_safe_depth is None or result.min_safe_depth > result.search_depth
+        for result in results
+    ):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,19 @@
 """scrapli"""
 
-from scrapli.auth import LookupKeyValue
-from scrapli.auth import Options as AuthOptions
-from scrapli.cli import Cli, ReadCallback
-from scrapli.netconf import Netconf
-from scrapli.netconf import Options as NetconfOptions
-from scrapli.session import Options as SessionOptions
-from scrapli.transport import BinOptions as TransportBinOptions
-from scrapli.transport import Ssh2Options as TransportSsh2Options
-from scrapli.transport import TelnetOptions as TransportTelnetOptions
-from scrapli.transport import TestOptions as TransportTestOptions
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from scrapli.auth import LookupKeyValue
+    from scrapli.auth import Options as AuthOptions
+    from scrapli.cli import Cli, ReadCallback
+    from scrapli.netconf import Netconf
+    from scrapli.netconf import Options as NetconfOptions
+    from scrapli.session import Options as SessionOptions
+    from scrapli.transport import BinOptions as TransportBinOptions
+    from scrapli.transport import Ssh2Options as TransportSsh2Options
+    from scrapli.transport import TelnetOptions as TransportTelnetOptions
+    from scrapli.transport import TestOptions as TransportTestOptions
 
 # set in ci on release
 __version__ = "0.0.0"
@@ -31,3 +35,61 @@ __all__ = (
     "TransportTelnetOptions",
     "TransportTestOptions",
 )
+
+# exports are resolved on first access so that i.e. a cli only script never pays for importing
+# the netconf driver (and its xml handling)
+_LAZY_EXPORTS = {
+    "AuthOptions": ("scrapli.auth", "Options"),
+    "Cli": ("scrapli.cli", "Cli"),
+    "LookupKeyValue": ("scrapli.auth", "LookupKeyValue"),
+    "Netconf": ("scrapli.netconf", "Netconf"),
+    "NetconfOptions": ("scrapli.netconf", "Options"),
+    "ReadCallback": ("scrapli.cli", "ReadCallback"),
+    "SessionOptions": ("scrapli.session", "Options"),
+    "TransportBinOptions": ("scrapli.transport", "BinOptions"),
+    "TransportSsh2Options": ("scrapli.transport", "Ssh2Options"),
+    "TransportTelnetOptions": ("scrapli.transport", "TelnetOptions"),
+    "TransportTestOptions": ("scrapli.transport", "TestOptions"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve (and cache) a lazily imported export.
+
+    Args:
+        name: name of the attribute being accessed
+
+    Returns:
+        Any: the export
+
+    Raises:
+        AttributeError: if the name is not an export of scrapli
+
+    """
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(module_name), attr)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    """
+    List the module attributes including the not yet resolved exports.
+
+    Args:
+        N/A
+
+    Returns:
+        list[str]: the attribute names
+
+    Raises:
+        N/A
+
+    """
+    return sorted({*globals(), *__all__})
@@ -1,7 +1,15 @@
 """scrapli.cli"""
 
 import importlib.resources
-from collections.abc import Awaitable, Callable
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Sequence,
+)
 from ctypes import (
     POINTER,
     c_bool,
@@ -17,13 +25,27 @@ from ctypes import (
 from dataclasses import dataclass
 from enum import Enum
 from importlib import import_module
-from logging import getLogger
+from itertools import islice
+from logging import LogRecord, getLogger
 from os import environ
 from pathlib import Path
+from queue import Queue
 from time import time_ns
 from types import TracebackType
+from typing import BinaryIO
 
 from scrapli.auth import Options as AuthOptions
+from scrapli.cli_config import (
+    DEFAULT_DIFF_IGNORE_PATTERNS,
+    DEFAULT_EXIT_COMMAND,
+    DEFAULT_NEGATE_PREFIX,
+    DEFAULT_ORDERED_PATTERNS,
+    DEFAULT_PUSHED_CONFIG_CACHE,
+    ConfigPushResult,
+    PushedConfigCache,
+    config_digest,
+    diff_config,
+)
 from scrapli.cli_decorators import handle_operation_timeout, handle_operation_timeout_async
 from scrapli.cli_result import Result
 from scrapli.exceptions import (
@@ -41,6 +63,7 @@ from scrapli.ffi_types import (
     OperationIdPointer,
     U8Pointer,
     ZigSlice,
+    ZigSlicePointer,
     ZigU64Slice,
     ffi_logger_callback_wrapper,
     ffi_logger_level,
@@ -51,6 +74,8 @@ from scrapli.helper import (
     wait_for_available_operation_result,
     wait_for_available_operation_result_async,
 )
+from scrapli.instrumentation import OperationTimingsCallback, start_operation_timer
+from scrapli.session import DEFAULT_OPERATION_TIMEOUT_NS
 from scrapli.session import Options as SessionOptions
 from scrapli.transport import BinOptions as TransportBinOptions
 from scrapli.transport import Options as TransportOptions
@@ -59,6 +84,132 @@ from scrapli.transport import TelnetOptions as TransportTelnetOptions
 CLI_DEFINITIONS_PATH_OVERRIDE_ENV = "SCRAPLI_DEFINITIONS_PATH"
 CLI_DEFINITIONS_PATH_OVERRIDE = environ.get(CLI_DEFINITIONS_PATH_OVERRIDE_ENV)
 
+SEND_INPUTS_FROM_FILE_INITIAL_CHUNK_SIZE = 64
+SEND_INPUTS_FROM_FILE_MAX_CHUNK_SIZE = 4_096
+SEND_INPUTS_FROM_FILE_TARGET_CHUNK_DURATION_S = 2.0
+
+
+def _spool_results(
+    spool_to: str | BinaryIO | None, results_slice: ZigSlicePointer
+) -> tuple[str | BinaryIO | None, int]:
+    """
+    Write fetched (packed) results to the spool destination, if any.
+
+    Args:
+        spool_to: path or (binary) file object to spool to, or None to not spool
+        results_slice: the fetched packed results
+
+    Returns:
+        tuple[str | BinaryIO | None, int]: the spool and offset the results were written at
+
+    Raises:
+        N/A
+
+    """
+    if spool_to is None:
+        return None, 0
+
+    if isinstance(spool_to, str):
+        with open(spool_to, "wb") as f:
+            results_slice.contents.write_contents_to(f)
+
+        return spool_to, 0
+
+    offset = spool_to.tell()
+
+    results_slice.contents.write_contents_to(spool_to)
+    spool_to.flush()
+
+    return spool_to, offset
+
+
+async def _aiter_inputs(inputs: Iterable[str] | AsyncIterable[str]) -> AsyncIterator[str]:
+    """
+    Iterate over plain or async iterable inputs alike.
+
+    Args:
+        inputs: the (async) iterable inputs
+
+    Yields:
+        str: each input
+
+    Raises:
+        N/A
+
+    """
+    if isinstance(inputs, AsyncIterable):
+        async for input_ in inputs:
+            yield input_
+
+        return
+
+    for input_ in inputs:
+        yield input_
+
+
+class _AdaptiveChunkSize:
+    """
+    _AdaptiveChunkSize sizes chunks of inputs so each chunk takes about the target duration.
+
+    Args:
+        size: the initial (or, if not adaptive, the fixed) chunk size
+        adaptive: adapt the chunk size to the observed per input latency
+        target_duration_s: the duration each chunk should take
+        max_size: the maximum chunk size
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    def __init__(
+        self,
+        size: int,
+        *,
+        adaptive: bool,
+        target_duration_s: float = SEND_INPUTS_FROM_FILE_TARGET_CHUNK_DURATION_S,
+        max_size: int = SEND_INPUTS_FROM_FILE_MAX_CHUNK_SIZE,
+    ) -> None:
+        self.size = max(size, 1)
+        self.adaptive = adaptive
+        self.target_duration_s = target_duration_s
+        self.max_size = max_size
+
+        self._per_input_s: float | None = None
+
+    def observe(self, inputs: int, elapsed_s: float) -> None:
+        """
+        Adapt the chunk size to the duration of a completed chunk.
+
+        Args:
+            inputs: count of inputs of the chunk
+            elapsed_s: seconds the chunk took
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        if not self.adaptive or inputs <= 0 or elapsed_s <= 0:
+            return
+
+        per_input_s = elapsed_s / inputs
+
+        # smooth out single slow/fast inputs (i.e. a slow "write mem") skewing the size
+        self._per_input_s = (
+            per_input_s if self._per_input_s is None else (self._per_input_s + per_input_s) / 2
+        )
+
+        # at most double per chunk so a burst of fast inputs does not balloon the next chunk
+        self.size = max(
+            min(int(self.target_duration_s / self._per_input_s), self.size * 2, self.max_size), 1
+        )
+
 
 @dataclass
 class LoadedDefinition:
@@ -196,6 +347,9 @@ class Options:
     Args:
         normalize_line_feeds: disable normalizing \r\n -> \n.
         normalize_trailing_whitespace: disable trimming trailing whitespace on lines.
+        fetch_results_raw: copy result raw journals out of the fetched results, when False
+            results_raw can not be reconstructed for results of this driver; python side only,
+            can be overridden per operation
 
     Returns:
         None
@@ -207,6 +361,7 @@ class Options:
 
     normalize_line_feeds: bool | None = None
     normalize_trailing_whitespace: bool | None = None
+    fetch_results_raw: bool = True
 
     def apply(self, *, options: DriverOptionsPointer) -> None:
         """
@@ -253,7 +408,8 @@ class Options:
             # the repr do that too
             f"Cli{self.__class__.__name__}("
             f"normalize_line_feeds={self.normalize_line_feeds!r}, "
-            f"normalize_trailing_whitespace={self.normalize_trailing_whitespace!r})"
+            f"normalize_trailing_whitespace={self.normalize_trailing_whitespace!r}, "
+            f"fetch_results_raw={self.fetch_results_raw!r})"
         )
 
 
@@ -283,6 +439,8 @@ class Cli:
         session_options: SessionOptions | None = None,
         transport_options: TransportOptions | None = None,
         logging_uid: str | None = None,
+        logging_queue: "Queue[LogRecord] | None" = None,
+        operation_timings_callback: OperationTimingsCallback | None = None,
         skip_static_options: bool = False,
     ) -> None:
         logger_name = f"{__name__}.{host}:{port}"
@@ -290,9 +448,13 @@ class Cli:
             logger_name += f":{logging_uid}"
 
         self.logger = getLogger(logger_name)
-        self.logger_callback = ffi_logger_callback_wrapper(logger=self.logger)
+        self.logger_callback = ffi_logger_callback_wrapper(logger=self.logger, queue=logging_queue)
 
         self._logging_uid = logging_uid
+        self._logging_queue = logging_queue
+
+        # opt-in per operation phase timings, see scrapli.instrumentation
+        self.operation_timings_callback = operation_timings_callback
 
         self.ffi_mapping = LibScrapliMapping()
 
@@ -315,6 +477,11 @@ class Cli:
         self.session_options = session_options or SessionOptions()
         self.transport_options = transport_options or TransportBinOptions()
 
+        # the operation timeout currently applied in libscrapli, see handle_operation_timeout
+        self._operation_timeout_ns = (
+            self.session_options.operation_timeout_ns or DEFAULT_OPERATION_TIMEOUT_NS
+        )
+
         self.ptr: DriverPointer | None = None
         self.poll_fd: int = 0
 
@@ -482,6 +649,8 @@ class Cli:
             session_options=self.session_options,
             transport_options=self.transport_options,
             logging_uid=self._logging_uid,
+            logging_queue=self._logging_queue,
+            operation_timings_callback=self.operation_timings_callback,
         )
 
     def _process_definition_file_or_name(
@@ -560,11 +729,20 @@ class Cli:
 
         self.poll_fd = poll_fd
 
+        # alloc applied the session options, so the session operation timeout
+        self._operation_timeout_ns = (
+            self.session_options.operation_timeout_ns or DEFAULT_OPERATION_TIMEOUT_NS
+        )
+
     def _free(
         self,
     ) -> None:
         self.ffi_mapping.shared_mapping.free(ptr=self._ptr_or_exception())
 
+        self._operation_timeout_ns = (
+            self.session_options.operation_timeout_ns or DEFAULT_OPERATION_TIMEOUT_NS
+        )
+
     def _get_options(self) -> str:
         """
         Returns the options provided as a json string.
@@ -977,7 +1155,12 @@ class Cli:
         self,
         operation_id_ptr: OperationIdPointer,
         cancel: Cancel,
+        spool_to: str | BinaryIO | None = None,
+        inputs: list[str] | None = None,
+        fetch_results_raw: bool | None = None,
     ) -> Result:
+        timer = start_operation_timer()
+
         wait_for_available_operation_result(
             self.poll_fd,
             cancel=cancel,
@@ -986,6 +1169,9 @@ class Cli:
 
         operation_id_value = c_uint32(operation_id_ptr.contents.value)
 
+        if timer is not None:
+            timer.waited(operation_id=operation_id_value.value)
+
         operation_count = pointer(c_uint32())
         inputs_size = pointer(c_size_t())
         results_raw_size = pointer(c_size_t())
@@ -1006,6 +1192,9 @@ class Cli:
             last_err_str_size=last_err_str_size,
         )
 
+        if timer is not None:
+            timer.fetched_sizes()
+
         start_time = pointer(c_uint64())
         splits = pointer(ZigU64Slice(size=c_uint64(operation_count.contents.value)))
 
@@ -1038,34 +1227,79 @@ class Cli:
             last_err_string=last_err_string,
         )
 
+        if timer is not None:
+            timer.fetched()
+
         err_contents = err_slice.contents.get_decoded_contents()
         if err_contents:
             if last_err_string:
                 err_contents += f": {last_err_string.contents.get_decoded_contents()}"
 
+            if timer is not None:
+                timer.finish(failed=True)
+
             raise OperationException(err_contents)
 
-        return Result(
-            inputs=inputs_slice.contents.get_contents(),
+        if fetch_results_raw is None:
+            fetch_results_raw = self.cli_options.fetch_results_raw
+
+        results_spool, results_spool_offset = _spool_results(
+            spool_to=spool_to, results_slice=results_slice
+        )
+
+        # decode everything out of the ffi buffers first so instrumentation can tell copying and
+        # decoding apart from building the Result
+        decoded_inputs = (
+            # the operation may have stopped early (stop_on_indicated_failure)
+            inputs[: operation_count.contents.value]
+            if inputs is not None
+            else inputs_slice.contents.get_contents()
+        )
+        results_raw = results_raw_slice.contents.get_contents() if fetch_results_raw else None
+        results = b"" if results_spool is not None else results_slice.contents.get_contents()
+        failed_indicator = results_failed_indicator_slice.contents.get_decoded_contents()
+
+        if timer is not None:
+            timer.decoded()
+
+        result = Result(
+            inputs=decoded_inputs,
             input_lens=inputs_lens_slice.contents.get_contents(),
             host=self.host,
             port=self.port,
             start_time=start_time.contents.value,
             splits=splits.contents.get_contents(),
-            result_raw_journals=results_raw_slice.contents.get_contents(),
+            result_raw_journals=results_raw,
             result_raw_journal_lens=results_raw_lens_slice.contents.get_contents(),
-            results=results_slice.contents.get_contents(),
+            results=results,
             result_lens=results_lens_slice.contents.get_contents(),
-            results_failed_indicator=results_failed_indicator_slice.contents.get_decoded_contents(),
+            results_failed_indicator=failed_indicator,
             textfsm_platform=self.ntc_templates_platform,
             genie_platform=self.genie_platform,
+            results_spool=results_spool,
+            results_spool_offset=results_spool_offset,
         )
 
+        if timer is not None:
+            timer.finish(
+                bytes_written=inputs_size.contents.value,
+                # the raw journals alone leave out the (processed) results fetched alongside them
+                bytes_read=results_size.contents.value + results_raw_size.contents.value,
+                failed_indicator=bool(failed_indicator),
+            )
+
+        return result
+
     async def _get_result_async(
         self,
         operation_id_ptr: OperationIdPointer,
         cancel: Cancel,
+        spool_to: str | BinaryIO | None = None,
+        inputs: list[str] | None = None,
+        fetch_results_raw: bool | None = None,
     ) -> Result:
+        timer = start_operation_timer()
+
         await wait_for_available_operation_result_async(
             self.poll_fd,
             cancel=cancel,
@@ -1074,6 +1308,9 @@ class Cli:
 
         operation_id_value = c_uint32(operation_id_ptr.contents.value)
 
+        if timer is not None:
+            timer.waited(operation_id=operation_id_value.value)
+
         operation_count = pointer(c_uint32())
         inputs_size = pointer(c_size_t())
         results_raw_size = pointer(c_size_t())
@@ -1094,6 +1331,9 @@ class Cli:
             last_err_str_size=last_err_str_size,
         )
 
+        if timer is not None:
+            timer.fetched_sizes()
+
         start_time = pointer(c_uint64())
         splits = pointer(ZigU64Slice(size=c_uint64(operation_count.contents.value)))
 
@@ -1126,31 +1366,69 @@ class Cli:
             last_err_string=last_err_string,
         )
 
+        if timer is not None:
+            timer.fetched()
+
         err_contents = err_slice.contents.get_decoded_contents()
         if err_contents:
             if last_err_string:
                 err_contents += f": {last_err_string.contents.get_decoded_contents()}"
 
+            if timer is not None:
+                timer.finish(failed=True)
+
             raise OperationException(err_contents)
 
+        if fetch_results_raw is None:
+            fetch_results_raw = self.cli_options.fetch_results_raw
+
+        results_spool, results_spool_offset = _spool_results(
+            spool_to=spool_to, results_slice=results_slice
+        )
+
+        # decode everything out of the ffi buffers first so instrumentation can tell copying and
+        # decoding apart from building the Result
+        decoded_inputs = (
+            # the operation may have stopped early (stop_on_indicated_failure)
+            inputs[: operation_count.contents.value]
+            if inputs is not None
+            else inputs_slice.contents.get_contents()
+        )
+        results_raw = results_raw_slice.contents.get_contents() if fetch_results_raw else None
+        results = b"" if results_spool is not None else results_slice.contents.get_contents()
         failed_indicator = results_failed_indicator_slice.contents.get_decoded_contents()
 
-        return Result(
-            inputs=inputs_slice.contents.get_contents(),
+        if timer is not None:
+            timer.decoded()
+
+        result = Result(
+            inputs=decoded_inputs,
             input_lens=inputs_lens_slice.contents.get_contents(),
             host=self.host,
             port=self.port,
             start_time=start_time.contents.value,
             splits=splits.contents.get_contents(),
-            result_raw_journals=results_raw_slice.contents.get_contents(),
+            result_raw_journals=results_raw,
             result_raw_journal_lens=results_raw_lens_slice.contents.get_contents(),
-            results=results_slice.contents.get_contents(),
+            results=results,
             result_lens=results_lens_slice.contents.get_contents(),
             results_failed_indicator=failed_indicator,
             textfsm_platform=self.ntc_templates_platform,
             genie_platform=self.genie_platform,
+            results_spool=results_spool,
+            results_spool_offset=results_spool_offset,
         )
 
+        if timer is not None:
+            timer.finish(
+                bytes_written=inputs_size.contents.value,
+                # the raw journals alone leave out the (processed) results fetched alongside them
+                bytes_read=results_size.contents.value + results_raw_size.contents.value,
+                failed_indicator=bool(failed_indicator),
+            )
+
+        return result
+
     @handle_operation_timeout
     def enter_mode(
         self,
@@ -1324,6 +1602,8 @@ class Cli:
         retain_trailing_prompt: bool = False,
         operation_timeout_ns: int | None = None,
         cancel: Cancel | None = None,
+        spool_to: str | BinaryIO | None = None,
+        fetch_results_raw: bool | None = None,
     ) -> Result:
         """
         Send an input on the cli connection.
@@ -1336,6 +1616,11 @@ class Cli:
             retain_trailing_prompt: retain the trailing prompt in the final "result"
             operation_timeout_ns: operation timeout in ns for this operation
             cancel: cancellation context for this operation
+            spool_to: optional path or (binary) file object to write the result to rather than
+                holding it in memory, useful for very large outputs (i.e. "show tech"); the
+                returned Result then reads the output lazily from the spool
+            fetch_results_raw: override the driver's (cli options) fetch_results_raw for this
+                operation, when False results_raw can not be reconstructed for the result
 
         Returns:
             Result: a Result object representing the operation
@@ -1367,7 +1652,13 @@ class Cli:
             retain_trailing_prompt=c_bool(retain_trailing_prompt),
         )
 
-        return self._get_result(operation_id_ptr=operation_id_ptr, cancel=cancel)
+        return self._get_result(
+            operation_id_ptr=operation_id_ptr,
+            cancel=cancel,
+            spool_to=spool_to,
+            inputs=[input_],
+            fetch_results_raw=fetch_results_raw,
+        )
 
     @handle_operation_timeout_async
     async def send_input_async(  # noqa: PLR0913
@@ -1380,6 +1671,8 @@ class Cli:
         retain_trailing_prompt: bool = False,
         operation_timeout_ns: int | None = None,
         cancel: Cancel | None = None,
+        spool_to: str | BinaryIO | None = None,
+        fetch_results_raw: bool | None = None,
     ) -> Result:
         """
         Send an input on the cli connection.
@@ -1392,6 +1685,11 @@ class Cli:
             retain_trailing_prompt: retain the trailing prompt in the final "result"
             operation_timeout_ns: operation timeout in ns for this operation
             cancel: cancellation context for this operation
+            spool_to: optional path or (binary) file object to write the result to rather than
+                holding it in memory, useful for very large outputs (i.e. "show tech"); the
+                returned Result then reads the output lazily from the spool
+            fetch_results_raw: override the driver's (cli options) fetch_results_raw for this
+                operation, when False results_raw can not be reconstructed for the result
 
         Returns:
             Result: a Result object representing the operation
@@ -1423,7 +1721,13 @@ class Cli:
             retain_trailing_prompt=c_bool(retain_trailing_prompt),
         )
 
-        return await self._get_result_async(operation_id_ptr=operation_id_ptr, cancel=cancel)
+        return await self._get_result_async(
+            operation_id_ptr=operation_id_ptr,
+            cancel=cancel,
+            spool_to=spool_to,
+            inputs=[input_],
+            fetch_results_raw=fetch_results_raw,
+        )
 
     @handle_operation_timeout
     def send_inputs(  # noqa: PLR0913
@@ -1437,6 +1741,7 @@ class Cli:
         stop_on_indicated_failure: bool = True,
         operation_timeout_ns: int | None = None,
         cancel: Cancel | None = None,
+        fetch_results_raw: bool | None = None,
     ) -> Result:
         """
         Send inputs (plural!) on the cli connection.
@@ -1450,6 +1755,8 @@ class Cli:
             stop_on_indicated_failure: stops sending inputs at first indicated failure
             operation_timeout_ns: operation timeout in ns for this operation
             cancel: cancellation context for this operation
+            fetch_results_raw: override the driver's (cli options) fetch_results_raw for this
+                operation, when False results_raw can not be reconstructed for the result
 
         Returns:
             Result: a Result object representing the operation
@@ -1492,7 +1799,12 @@ class Cli:
             stop_on_indicated_failure=c_bool(stop_on_indicated_failure),
         )
 
-        return self._get_result(operation_id_ptr=operation_id_ptr, cancel=cancel)
+        return self._get_result(
+            operation_id_ptr=operation_id_ptr,
+            cancel=cancel,
+            inputs=inputs,
+            fetch_results_raw=fetch_results_raw,
+        )
 
     @handle_operation_timeout_async
     async def send_inputs_async(  # noqa: PLR0913
@@ -1506,6 +1818,7 @@ class Cli:
         stop_on_indicated_failure: bool = True,
         operation_timeout_ns: int | None = None,
         cancel: Cancel | None = None,
+        fetch_results_raw: bool | None = None,
     ) -> Result:
         """
         Send inputs (plural!) on the cli connection.
@@ -1519,6 +1832,8 @@ class Cli:
             stop_on_indicated_failure: stops sending inputs at first indicated failure
             operation_timeout_ns: operation timeout in ns for this operation
             cancel: cancellation context for this operation
+            fetch_results_raw: override the driver's (cli options) fetch_results_raw for this
+                operation, when False results_raw can not be reconstructed for the result
 
         Returns:
             MultiResult: a MultiResult object representing the operations
@@ -1563,7 +1878,262 @@ class Cli:
             stop_on_indicated_failure=c_bool(stop_on_indicated_failure),
         )
 
-        return await self._get_result_async(operation_id_ptr=operation_id_ptr, cancel=cancel)
+        return await self._get_result_async(
+            operation_id_ptr=operation_id_ptr,
+            cancel=cancel,
+            inputs=inputs,
+            fetch_results_raw=fetch_results_raw,
+        )
+
+    def iter_send_inputs(  # noqa: PLR0913
+        self,
+        inputs: Iterable[str],
+        *,
+        requested_mode: str = "",
+        input_handling: InputHandling = InputHandling.FUZZY,
+        retain_input: bool = False,
+        retain_trailing_prompt: bool = False,
+        stop_on_indicated_failure: bool = True,
+        operation_timeout_ns: int | None = None,
+        cancel: Cancel | None = None,
+        fetch_results_raw: bool | None = None,
+    ) -> Iterator[Result]:
+        """
+        Send inputs (plural!) on the cli connection, yielding the result of each input once done.
+
+        Unlike `send_inputs` each input is its own operation, so its result (and failed indicator)
+        is available as soon as the input completes rather than once every input completed. Inputs
+        are only taken from the given iterable as they are sent, so this works equally well with a
+        lazily produced iterable (i.e. lines read from a file). Stop iterating at any point to not
+        send any further inputs.
+
+        Args:
+            inputs: the inputs to send
+            requested_mode: name of the mode to send the input at
+            input_handling: how to handle the input
+            retain_input: retain the input in the final "result"
+            retain_trailing_prompt: retain the trailing prompt in the final "result"
+            stop_on_indicated_failure: stops sending inputs after the first indicated failure
+            operation_timeout_ns: operation timeout in ns for each input
+            cancel: cancellation context for all inputs
+            fetch_results_raw: override the driver's (cli options) fetch_results_raw for this
+                operation, when False results_raw can not be reconstructed for the result
+
+        Yields:
+            Result: a Result object for each input
+
+        Raises:
+            NotOpenedException: if the ptr to the cli object is None (via _ptr_or_exception)
+            FFIException: if the operation fails
+
+        """
+        for input_ in inputs:
+            result = self.send_input(
+                input_,
+                requested_mode=requested_mode,
+                input_handling=input_handling,
+                retain_input=retain_input,
+                retain_trailing_prompt=retain_trailing_prompt,
+                operation_timeout_ns=operation_timeout_ns,
+                cancel=cancel,
+                fetch_results_raw=fetch_results_raw,
+            )
+
+            yield result
+
+            if stop_on_indicated_failure and result.failed:
+                return
+
+    async def iter_send_inputs_async(  # noqa: PLR0913
+        self,
+        inputs: Iterable[str] | AsyncIterable[str],
+        *,
+        requested_mode: str = "",
+        input_handling: InputHandling = InputHandling.FUZZY,
+        retain_input: bool = False,
+        retain_trailing_prompt: bool = False,
+        stop_on_indicated_failure: bool = True,
+        operation_timeout_ns: int | None = None,
+        cancel: Cancel | None = None,
+        fetch_results_raw: bool | None = None,
+    ) -> AsyncIterator[Result]:
+        """
+        Send inputs (plural!) on the cli connection, yielding the result of each input once done.
+
+        Unlike `send_inputs` each input is its own operation, so its result (and failed indicator)
+        is available as soon as the input completes rather than once every input completed. Inputs
+        are only taken from the given (async) iterable as they are sent, so this works equally
+        well with a lazily produced iterable (i.e. lines read from a file). Stop iterating at any
+        point to not send any further inputs.
+
+        Args:
+            inputs: the inputs to send
+            requested_mode: name of the mode to send the input at
+            input_handling: how to handle the input
+            retain_input: retain the input in the final "result"
+            retain_trailing_prompt: retain the trailing prompt in the final "result"
+            stop_on_indicated_failure: stops sending inputs after the first indicated failure
+            operation_timeout_ns: operation timeout in ns for each input
+            cancel: cancellation context for all inputs
+            fetch_results_raw: override the driver's (cli options) fetch_results_raw for this
+                operation, when False results_raw can not be reconstructed for the result
+
+        Yields:
+            Result: a Result object for each input
+
+        Raises:
+            NotOpenedException: if the ptr to the cli object is None (via _ptr_or_exception)
+            FFIException: if the operation fails
+
+        """
+        async for input_ in _aiter_inputs(inputs):
+            result = await self.send_input_async(
+                input_,
+                requested_mode=requested_mode,
+                input_handling=input_handling,
+                retain_input=retain_input,
+                retain_trailing_prompt=retain_trailing_prompt,
+                operation_timeout_ns=operation_timeout_ns,
+                cancel=cancel,
+                fetch_results_raw=fetch_results_raw,
+            )
+
+            yield result
+
+            if stop_on_indicated_failure and result.failed:
+                return
+
+    def iter_send_inputs_from_file(  # noqa: PLR0913
+        self,
+        f: str,
+        *,
+        requested_mode: str = "",
+        input_handling: InputHandling = InputHandling.FUZZY,
+        retain_input: bool = False,
+        retain_trailing_prompt: bool = False,
+        stop_on_indicated_failure: bool = True,
+        operation_timeout_ns: int | None = None,
+        cancel: Cancel | None = None,
+        chunk_size: int | None = None,
+    ) -> Iterator[Result]:
+        """
+        Send inputs (plural! from a file, line-by-line) on the cli connection, chunk by chunk.
+
+        The file is read lazily and sent in chunks (each a `send_inputs` operation), so memory
+        stays flat for even very large files and the result of each chunk is yielded as soon as
+        the chunk completes.
+
+        Args:
+            f: the file to load -- each line will be sent, trailing newlines ignored
+            requested_mode: name of the mode to send the input at`
+            input_handling: how to handle the input
+            retain_input: retain the input in the final "result"
+            retain_trailing_prompt: retain the trailing prompt in the final "result"
+            stop_on_indicated_failure: stops sending inputs at first indicated failure
+            operation_timeout_ns: operation timeout in ns for each chunk of inputs
+            cancel: cancellation context for this operation
+            chunk_size: send the file in chunks of this many lines, by default the chunk size
+                adapts to the observed per line latency so each chunk takes a couple of seconds
+
+        Yields:
+            Result: a Result object for each chunk of inputs
+
+        Raises:
+            NotOpenedException: if the ptr to the cli object is None (via _ptr_or_exception)
+            FFIException: if the operation fails
+
+        """
+        chunk = _AdaptiveChunkSize(
+            chunk_size or SEND_INPUTS_FROM_FILE_INITIAL_CHUNK_SIZE, adaptive=chunk_size is None
+        )
+
+        with open(resolve_file(f), encoding="utf-8", mode="r") as _f:
+            lines = (line.removesuffix("\n") for line in _f)
+
+            while inputs := list(islice(lines, chunk.size)):
+                result = self.send_inputs(
+                    inputs=inputs,
+                    requested_mode=requested_mode,
+                    input_handling=input_handling,
+                    retain_input=retain_input,
+                    retain_trailing_prompt=retain_trailing_prompt,
+                    stop_on_indicated_failure=stop_on_indicated_failure,
+                    operation_timeout_ns=operation_timeout_ns,
+                    cancel=cancel,
+                )
+
+                yield result
+
+                if stop_on_indicated_failure and result.failed:
+                    return
+
+                chunk.observe(inputs=len(inputs), elapsed_s=result.elapsed_time_seconds)
+
+    async def iter_send_inputs_from_file_async(  # noqa: PLR0913
+        self,
+        f: str,
+        *,
+        requested_mode: str = "",
+        input_handling: InputHandling = InputHandling.FUZZY,
+        retain_input: bool = False,
+        retain_trailing_prompt: bool = False,
+        stop_on_indicated_failure: bool = True,
+        operation_timeout_ns: int | None = None,
+        cancel: Cancel | None = None,
+        chunk_size: int | None = None,
+    ) -> AsyncIterator[Result]:
+        """
+        Send inputs (plural! from a file, line-by-line) on the cli connection, chunk by chunk.
+
+        The file is read lazily and sent in chunks (each a `send_inputs` operation), so memory
+        stays flat for even very large files and the result of each chunk is yielded as soon as
+        the chunk completes.
+
+        Args:
+            f: the file to load -- each line will be sent, trailing newlines ignored
+            requested_mode: name of the mode to send the input at`
+            input_handling: how to handle the input
+            retain_input: retain the input in the final "result"
+            retain_trailing_prompt: retain the trailing prompt in the final "result"
+            stop_on_indicated_failure: stops sending inputs at first indicated failure
+            operation_timeout_ns: operation timeout in ns for each chunk of inputs
+            cancel: cancellation context for this operation
+            chunk_size: send the file in chunks of this many lines, by default the chunk size
+                adapts to the observed per line latency so each chunk takes a couple of seconds
+
+        Yields:
+            Result: a Result object for each chunk of inputs
+
+        Raises:
+            NotOpenedException: if the ptr to the cli object is None (via _ptr_or_exception)
+            FFIException: if the operation fails
+
+        """
+        chunk = _AdaptiveChunkSize(
+            chunk_size or SEND_INPUTS_FROM_FILE_INITIAL_CHUNK_SIZE, adaptive=chunk_size is None
+        )
+
+        with open(resolve_file(f), encoding="utf-8", mode="r") as _f:
+            lines = (line.removesuffix("\n") for line in _f)
+
+            while inputs := list(islice(lines, chunk.size)):
+                result = await self.send_inputs_async(
+                    inputs=inputs,
+                    requested_mode=requested_mode,
+                    input_handling=input_handling,
+                    retain_input=retain_input,
+                    retain_trailing_prompt=retain_trailing_prompt,
+                    stop_on_indicated_failure=stop_on_indicated_failure,
+                    operation_timeout_ns=operation_timeout_ns,
+                    cancel=cancel,
+                )
+
+                yield result
+
+                if stop_on_indicated_failure and result.failed:
+                    return
+
+                chunk.observe(inputs=len(inputs), elapsed_s=result.elapsed_time_seconds)
 
     def send_inputs_from_file(  # noqa: PLR0913
         self,
@@ -1576,33 +2146,38 @@ class Cli:
         stop_on_indicated_failure: bool = True,
         operation_timeout_ns: int | None = None,
         cancel: Cancel | None = None,
+        chunk_size: int | None = None,
     ) -> Result:
         """
         Send inputs (plural! from a file, line-by-line) on the cli connection.
 
+        The file is sent in chunks, see `iter_send_inputs_from_file`, with the result of each
+        chunk combined into a single result.
+
         Args:
-            f: the file to load -- each line will be sent, tralining newlines ignored
+            f: the file to load -- each line will be sent, trailing newlines ignored
             requested_mode: name of the mode to send the input at`
             input_handling: how to handle the input
             retain_input: retain the input in the final "result"
             retain_trailing_prompt: retain the trailing prompt in the final "result"
             stop_on_indicated_failure: stops sending inputs at first indicated failure
-            operation_timeout_ns: operation timeout in ns for this operation
+            operation_timeout_ns: operation timeout in ns for each chunk of inputs
             cancel: cancellation context for this operation
+            chunk_size: send the file in chunks of this many lines, by default the chunk size
+                adapts to the observed per line latency so each chunk takes a couple of seconds
 
         Returns:
-            MultiResult: a MultiResult object representing the operations
+            Result: a Result object representing the operation
 
         Raises:
             NotOpenedException: if the ptr to the cli object is None (via _ptr_or_exception)
             FFIException: if the operation fails
 
         """
-        with open(resolve_file(f), encoding="utf-8", mode="r") as _f:
-            inputs = _f.read().splitlines()
+        result: Result | None = None
 
-        return self.send_inputs(
-            inputs=inputs,
+        for chunk_result in self.iter_send_inputs_from_file(
+            f,
             requested_mode=requested_mode,
             input_handling=input_handling,
             retain_input=retain_input,
@@ -1610,7 +2185,27 @@ class Cli:
             stop_on_indicated_failure=stop_on_indicated_failure,
             operation_timeout_ns=operation_timeout_ns,
             cancel=cancel,
-        )
+            chunk_size=chunk_size,
+        ):
+            if result is None:
+                result = chunk_result
+            else:
+                result.extend(chunk_result)
+
+        if result is None:
+            # empty file, still an (empty) result like sending no inputs at all
+            result = self.send_inputs(
+                inputs=[],
+                requested_mode=requested_mode,
+                input_handling=input_handling,
+                retain_input=retain_input,
+                retain_trailing_prompt=retain_trailing_prompt,
+                stop_on_indicated_failure=stop_on_indicated_failure,
+                operation_timeout_ns=operation_timeout_ns,
+                cancel=cancel,
+            )
+
+        return result
 
     async def send_inputs_from_file_async(  # noqa: PLR0913
         self,
@@ -1623,33 +2218,38 @@ class Cli:
         stop_on_indicated_failure: bool = True,
         operation_timeout_ns: int | None = None,
         cancel: Cancel | None = None,
+        chunk_size: int | None = None,
     ) -> Result:
         """
         Send inputs (plural! from a file, line-by-line) on the cli connection.
 
+        The file is sent in chunks, see `iter_send_inputs_from_file_async`, with the result of
+        each chunk combined into a single result.
+
         Args:
-            f: the file to load -- each line will be sent, tralining newlines ignored
+            f: the file to load -- each line will be sent, trailing newlines ignored
             requested_mode: name of the mode to send the input at`
             input_handling: how to handle the input
             retain_input: retain the input in the final "result"
             retain_trailing_prompt: retain the trailing prompt in the final "result"
             stop_on_indicated_failure: stops sending inputs at first indicated failure
-            operation_timeout_ns: operation timeout in ns for this operation
+            operation_timeout_ns: operation timeout in ns for each chunk of inputs
             cancel: cancellation context for this operation
+            chunk_size: send the file in chunks of this many lines, by default the chunk size
+                adapts to the observed per line latency so each chunk takes a couple of seconds
 
         Returns:
-            MultiResult: a MultiResult object representing the operations
+            Result: a Result object representing the operation
 
         Raises:
             NotOpenedException: if the ptr to the cli object is None (via _ptr_or_exception)
             FFIException: if the operation fails
 
         """
-        with open(resolve_file(f), encoding="utf-8", mode="r") as _f:
-            inputs = _f.read().splitlines()
+        result: Result | None = None
 
-        return await self.send_inputs_async(
-            inputs=inputs,
+        async for chunk_result in self.iter_send_inputs_from_file_async(
+            f,
             requested_mode=requested_mode,
             input_handling=input_handling,
             retain_input=retain_input,
@@ -1657,8 +2257,228 @@ class Cli:
             stop_on_indicated_failure=stop_on_indicated_failure,
             operation_timeout_ns=operation_timeout_ns,
             cancel=cancel,
+            chunk_size=chunk_size,
+        ):
+            if result is None:
+                result = chunk_result
+            else:
+                result.extend(chunk_result)
+
+        if result is None:
+            # empty file, still an (empty) result like sending no inputs at all
+            result = await self.send_inputs_async(
+                inputs=[],
+                requested_mode=requested_mode,
+                input_handling=input_handling,
+                retain_input=retain_input,
+                retain_trailing_prompt=retain_trailing_prompt,
+                stop_on_indicated_failure=stop_on_indicated_failure,
+                operation_timeout_ns=operation_timeout_ns,
+                cancel=cancel,
+            )
+
+        return result
+
+    def push_config(  # noqa: PLR0913
+        self,
+        config: str,
+        *,
+        running_config: str | None = None,
+        running_config_input: str = "show running-config",
+        requested_mode: str = "configuration",
+        negate_prefix: str = DEFAULT_NEGATE_PREFIX,
+        exit_command: str = DEFAULT_EXIT_COMMAND,
+        ignore: Sequence[str] = DEFAULT_DIFF_IGNORE_PATTERNS,
+        scope: Sequence[str] | None = None,
+        ordered: Sequence[str] = DEFAULT_ORDERED_PATTERNS,
+        force: bool = False,
+        cache: PushedConfigCache | None = None,
+        stop_on_indicated_failure: bool = True,
+        operation_timeout_ns: int | None = None,
+        cancel: Cancel | None = None,
+    ) -> ConfigPushResult:
+        """
+        Push a config, sending only the lines that differ from the running config.
+
+        The inputs are the hierarchical diff of the running config and the desired config (see
+        `scrapli.cli_config.diff_config`), sent with `send_inputs` in the configuration mode. If
+        the config is the last config successfully pushed to this host (per the cache) nothing is
+        done at all, not even fetching the running config, unless `force` is set.
+
+        Args:
+            config: the desired config
+            running_config: the (cached) running config to diff against, fetched by sending
+                `running_config_input` if not provided
+            running_config_input: input fetching the running config
+            requested_mode: name of the mode to send the config at
+            negate_prefix: prefix negating a config line
+            exit_command: input that exits a level of the config hierarchy
+            ignore: patterns of lines (and their children) left out of the diff
+            scope: patterns of the top level lines to diff, all of them if None
+            ordered: patterns of parents whose children are evaluated in order
+            force: diff and push even if the config is the last config pushed to this host
+            cache: cache of the last config pushed per host, by default a cache shared by all
+                Cli instances
+            stop_on_indicated_failure: stops sending inputs at first indicated failure
+            operation_timeout_ns: operation timeout in ns for each operation
+            cancel: cancellation context for this operation
+
+        Returns:
+            ConfigPushResult: the outcome of the push
+
+        Raises:
+            NotOpenedException: if the ptr to the cli object is None (via _ptr_or_exception)
+            FFIException: if the operation fails
+
+        """
+        if cache is None:
+            cache = DEFAULT_PUSHED_CONFIG_CACHE
+
+        # the same config diffed differently is not the same push
+        digest = config_digest(
+            config=config, context=repr((negate_prefix, exit_command, ignore, scope, ordered))
+        )
+
+        if not force and cache.get(host=self.host, port=self.port) == digest:
+            return ConfigPushResult(host=self.host, port=self.port, cached=True)
+
+        # until the push succeeds the state of the device is unknown
+        cache.invalidate(host=self.host, port=self.port)
+
+        if running_config is None:
+            running_config = self.send_input(
+                input_=running_config_input,
+                operation_timeout_ns=operation_timeout_ns,
+                cancel=cancel,
+            ).result
+
+        inputs = diff_config(
+            desired=config,
+            running=running_config,
+            negate_prefix=negate_prefix,
+            exit_command=exit_command,
+            ignore=ignore,
+            scope=scope,
+            ordered=ordered,
         )
 
+        push_result = ConfigPushResult(host=self.host, port=self.port, inputs=inputs)
+
+        if inputs:
+            push_result.result = self.send_inputs(
+                inputs=inputs,
+                requested_mode=requested_mode,
+                stop_on_indicated_failure=stop_on_indicated_failure,
+                operation_timeout_ns=operation_timeout_ns,
+                cancel=cancel,
+            )
+
+        if not push_result.failed:
+            cache.set(host=self.host, port=self.port, digest=digest)
+
+        return push_result
+
+    async def push_config_async(  # noqa: PLR0913
+        self,
+        config: str,
+        *,
+        running_config: str | None = None,
+        running_config_input: str = "show running-config",
+        requested_mode: str = "configuration",
+        negate_prefix: str = DEFAULT_NEGATE_PREFIX,
+        exit_command: str = DEFAULT_EXIT_COMMAND,
+        ignore: Sequence[str] = DEFAULT_DIFF_IGNORE_PATTERNS,
+        scope: Sequence[str] | None = None,
+        ordered: Sequence[str] = DEFAULT_ORDERED_PATTERNS,
+        force: bool = False,
+        cache: PushedConfigCache | None = None,
+        stop_on_indicated_failure: bool = True,
+        operation_timeout_ns: int | None = None,
+        cancel: Cancel | None = None,
+    ) -> ConfigPushResult:
+        """
+        Push a config, sending only the lines that differ from the running config.
+
+        The inputs are the hierarchical diff of the running config and the desired config (see
+        `scrapli.cli_config.diff_config`), sent with `send_inputs_async` in the configuration
+        mode. If the config is the last config successfully pushed to this host (per the cache)
+        nothing is done at all, not even fetching the running config, unless `force` is set.
+
+        Args:
+            config: the desired config
+            running_config: the (cached) running config to diff against, fetched by sending
+                `running_config_input` if not provided
+            running_config_input: input fetching the running config
+            requested_mode: name of the mode to send the config at
+            negate_prefix: prefix negating a config line
+            exit_command: input that exits a level of the config hierarchy
+            ignore: patterns of lines (and their children) left out of the diff
+            scope: patterns of the top level lines to diff, all of them if None
+            ordered: patterns of parents whose children are evaluated in order
+            force: diff and push even if the config is the last config pushed to this host
+            cache: cache of the last config pushed per host, by default a cache shared by all
+                Cli instances
+            stop_on_indicated_failure: stops sending inputs at first indicated failure
+            operation_timeout_ns: operation timeout in ns for each operation
+            cancel: cancellation context for this operation
+
+        Returns:
+            ConfigPushResult: the outcome of the push
+
+        Raises:
+            NotOpenedException: if the ptr to the cli object is None (via _ptr_or_exception)
+            FFIException: if the operation fails
+
+        """
+        if cache is None:
+            cache = DEFAULT_PUSHED_CONFIG_CACHE
+
+        # the same config diffed differently is not the same push
+        digest = config_digest(
+            config=config, context=repr((negate_prefix, exit_command, ignore, scope, ordered))
+        )
+
+        if not force and cache.get(host=self.host, port=self.port) == digest:
+            return ConfigPushResult(host=self.host, port=self.port, cached=True)
+
+        # until the push succeeds the state of the device is unknown
+        cache.invalidate(host=self.host, port=self.port)
+
+        if running_config is None:
+            running_config = (
+                await self.send_input_async(
+                    input_=running_config_input,
+                    operation_timeout_ns=operation_timeout_ns,
+                    cancel=cancel,
+                )
+            ).result
+
+        inputs = diff_config(
+            desired=config,
+            running=running_config,
+            negate_prefix=negate_prefix,
+            exit_command=exit_command,
+            ignore=ignore,
+            scope=scope,
+            ordered=ordered,
+        )
+
+        push_result = ConfigPushResult(host=self.host, port=self.port, inputs=inputs)
+
+        if inputs:
+            push_result.result = await self.send_inputs_async(
+                inputs=inputs,
+                requested_mode=requested_mode,
+                stop_on_indicated_failure=stop_on_indicated_failure,
+                operation_timeout_ns=operation_timeout_ns,
+                cancel=cancel,
+            )
+
+        if not push_result.failed:
+            cache.set(host=self.host, port=self.port, digest=digest)
+
+        return push_result
+
     @handle_operation_timeout
     def send_prompted_input(  # noqa: PLR0913
         self,
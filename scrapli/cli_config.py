@@ -0,0 +1,606 @@
+"""scrapli.cli_config"""
+
+import re
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from hashlib import blake2b
+from threading import Lock
+
+from scrapli.cli_result import Result
+
+DEFAULT_PUSHED_CONFIG_CACHE_MAX_ENTRIES = 16_384
+
+DEFAULT_NEGATE_PREFIX = "no "
+DEFAULT_EXIT_COMMAND = "exit"
+
+# lines (and so their whole block) the diff leaves alone by default -- lines the device manages
+# itself and opaque multiline bodies that can not be negated line by line
+DEFAULT_DIFF_IGNORE_PATTERNS = (
+    r"version ",
+    r"boot-(?:start|end)-marker$",
+    r"banner ",
+    r"crypto pki certificate ",
+    r"certificate ",
+)
+
+# parents whose children are evaluated in order, i.e. access list entries
+DEFAULT_ORDERED_PATTERNS = (r"(?:ip|ipv4|ipv6|mac) access-list ",)
+
+# lines that are not config -- comments, the "end" marker and the header some platforms print
+# before the running config
+_IGNORED_LINE_PATTERN = re.compile(
+    r"^(?:!.*|end|Building configuration\.\.\.|Current configuration\s*:.*)$"
+)
+
+# "banner motd ^C" (ios style, body ends at the delimiter) or "banner motd" (eos style, body ends
+# at "EOF")
+_BANNER_PATTERN = re.compile(r"^banner\s+\S+(?:\s+(?P<delimiter>\^C|\S))?")
+_BANNER_EOF = "EOF"
+
+
+class ConfigLine:
+    """
+    ConfigLine is a line of a (hierarchical, indentation based) config and its child lines.
+
+    Children are keyed on their (stripped) text, so duplicate lines at the same level of the
+    hierarchy are treated as a single line (with their children merged).
+
+    Args:
+        text: the (stripped) line
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    __slots__ = ("children", "text")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.children: dict[str, ConfigLine] = {}
+
+    def __repr__(self) -> str:
+        """
+        Magic repr method for ConfigLine object
+
+        Args:
+            N/A
+
+        Returns:
+            str: repr for ConfigLine object
+
+        Raises:
+            N/A
+
+        """
+        return f"{self.__class__.__name__}(text={self.text!r}, children={len(self.children)})"
+
+    def child(self, text: str) -> "ConfigLine":
+        """
+        Returns the child line with the given text, adding it if it does not exist yet.
+
+        Args:
+            text: the (stripped) child line
+
+        Returns:
+            ConfigLine: the child line
+
+        Raises:
+            N/A
+
+        """
+        line = self.children.get(text)
+
+        if line is None:
+            line = self.children[text] = ConfigLine(text=text)
+
+        return line
+
+
+def _banner_body(banner: str, raw_lines: Iterator[str]) -> Iterator[str]:
+    match = _BANNER_PATTERN.match(banner)
+    if match is None:
+        return
+
+    delimiter = match.group("delimiter")
+
+    if delimiter is not None and delimiter in banner[match.end() :]:
+        # the whole banner is on the one line
+        return
+
+    for raw_line in raw_lines:
+        text = raw_line.strip()
+
+        if text:
+            yield text
+
+        if (delimiter is None and text == _BANNER_EOF) or (delimiter and delimiter in text):
+            return
+
+
+def _config_lines(config: str) -> list[tuple[int, str]]:
+    lines = []
+    raw_lines = iter(config.splitlines())
+
+    for raw_line in raw_lines:
+        line = raw_line.expandtabs().rstrip()
+        text = line.lstrip()
+
+        if not text or _IGNORED_LINE_PATTERN.match(text):
+            continue
+
+        indent = len(line) - len(text)
+        lines.append((indent, text))
+
+        # banner bodies are not indented, they are held as children of the banner line instead
+        lines.extend((indent + 1, body) for body in _banner_body(banner=text, raw_lines=raw_lines))
+
+    return lines
+
+
+def parse_config(config: str) -> ConfigLine:
+    """
+    Parse a config into a tree of lines based on the indentation of each line.
+
+    Blank lines, "!" comments, "end" and running config headers (i.e. "Building
+    configuration...") are ignored. The (unindented) body of a banner is parsed as the children
+    of the banner line.
+
+    Args:
+        config: the config to parse
+
+    Returns:
+        ConfigLine: the (textless) root line of the config
+
+    Raises:
+        N/A
+
+    """
+    root = ConfigLine(text="")
+
+    # (indent, line) of the current line and its parents
+    stack: list[tuple[int, ConfigLine]] = [(-1, root)]
+
+    for indent, text in _config_lines(config):
+        while stack[-1][0] >= indent:
+            stack.pop()
+
+        stack.append((indent, stack[-1][1].child(text=text)))
+
+    return root
+
+
+def config_digest(config: str, *, context: str = "") -> str:
+    """
+    Returns a digest of a config that ignores whitespace/comment only differences.
+
+    Args:
+        config: the config to digest
+        context: anything else the digest depends on, i.e. the options the config is diffed with
+
+    Returns:
+        str: the config digest
+
+    Raises:
+        N/A
+
+    """
+    h = blake2b(digest_size=16)
+    h.update(f"{context}\n".encode())
+
+    for indent, text in _config_lines(config):
+        h.update(f"{indent} {text}\n".encode())
+
+    return h.hexdigest()
+
+
+def _negate(text: str, negate_prefix: str) -> str:
+    if text.startswith(negate_prefix):
+        return text.removeprefix(negate_prefix)
+
+    return f"{negate_prefix}{text}"
+
+
+class _DiffEmitter:
+    """
+    _DiffEmitter builds the (flat) list of inputs of a config diff.
+
+    Parent lines are only sent when the context changes and the emitter "exits" back up to the
+    common parent before moving to a different context.
+
+    Args:
+        exit_command: input that exits a level of the hierarchy
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    __slots__ = ("_context", "exit_command", "inputs")
+
+    def __init__(self, exit_command: str) -> None:
+        self.exit_command = exit_command
+        self.inputs: list[str] = []
+
+        self._context: list[str] = []
+
+    def emit(self, path: list[str], text: str) -> None:
+        common = 0
+
+        for current, wanted in zip(self._context, path, strict=False):
+            if current != wanted:
+                break
+
+            common += 1
+
+        self.exit_to(depth=common)
+
+        for parent in path[common:]:
+            self.inputs.append(parent)
+            self._context.append(parent)
+
+        self.inputs.append(text)
+
+    def emit_block(self, path: list[str], line: ConfigLine) -> None:
+        self.emit(path=path, text=line.text)
+
+        if not line.children:
+            return
+
+        # the line just sent is now the context for its children
+        self._context.append(line.text)
+
+        child_path = [*path, line.text]
+
+        for child in line.children.values():
+            self.emit_block(path=child_path, line=child)
+
+    def exit_to(self, depth: int) -> None:
+        while len(self._context) > depth:
+            self._context.pop()
+            self.inputs.append(self.exit_command)
+
+
+def _compile_patterns(patterns: Sequence[str] | None) -> re.Pattern[str] | None:
+    if not patterns:
+        return None
+
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+
+
+def _prune(
+    line: ConfigLine,
+    ignore: re.Pattern[str] | None,
+    scope: re.Pattern[str] | None = None,
+) -> None:
+    for text in list(line.children):
+        if (ignore is not None and ignore.match(text)) or (
+            scope is not None and not scope.match(text)
+        ):
+            del line.children[text]
+        else:
+            _prune(line=line.children[text], ignore=ignore)
+
+
+def _order_changed(desired: ConfigLine, running: ConfigLine) -> bool:
+    # children kept have to stay in the same order, and added children can only be appended
+    kept = [text for text in running.children if text in desired.children]
+
+    return list(desired.children)[: len(kept)] != kept
+
+
+def _diff_lines(  # noqa: PLR0913
+    desired: ConfigLine,
+    running: ConfigLine,
+    *,
+    path: list[str],
+    emitter: _DiffEmitter,
+    negate_prefix: str,
+    ordered: re.Pattern[str] | None,
+) -> None:
+    for text in running.children:
+        if text in desired.children:
+            continue
+
+        negated = _negate(text=text, negate_prefix=negate_prefix)
+
+        # i.e. "shutdown" -> "no shutdown", the added line already takes care of the removal
+        if negated in desired.children:
+            continue
+
+        # removing a parent removes its whole block
+        emitter.emit(path=path, text=negated)
+
+    for text, line in desired.children.items():
+        running_line = running.children.get(text)
+
+        if running_line is None:
+            emitter.emit_block(path=path, line=line)
+        elif (
+            ordered is not None
+            and ordered.match(text)
+            and _order_changed(desired=line, running=running_line)
+        ):
+            # entries can not be moved (or inserted) in place, replace the whole block
+            emitter.emit(path=path, text=_negate(text=text, negate_prefix=negate_prefix))
+            emitter.emit_block(path=path, line=line)
+        elif line.children or running_line.children:
+            _diff_lines(
+                desired=line,
+                running=running_line,
+                path=[*path, text],
+                emitter=emitter,
+                negate_prefix=negate_prefix,
+                ordered=ordered,
+            )
+
+
+def diff_config(  # noqa: PLR0913
+    desired: str,
+    running: str,
+    *,
+    negate_prefix: str = DEFAULT_NEGATE_PREFIX,
+    exit_command: str = DEFAULT_EXIT_COMMAND,
+    ignore: Sequence[str] = DEFAULT_DIFF_IGNORE_PATTERNS,
+    scope: Sequence[str] | None = None,
+    ordered: Sequence[str] = DEFAULT_ORDERED_PATTERNS,
+) -> list[str]:
+    """
+    Compute the inputs that turn the running config into the desired config.
+
+    The desired config is the *full* config (of the scope), anything only in the running config
+    is removed -- use `scope` to only diff some top level blocks, and `ignore` for lines to leave
+    alone wherever they are.
+
+    The diff is hierarchical (indentation aware): within each parent, lines only in the running
+    config are negated (removing a parent removes its whole block, negating a "no ..." line drops
+    the "no") before lines only in the desired config are added, in desired config order. Parents
+    are sent as context for changed children, with `exit_command` used to step back up the
+    hierarchy when moving between contexts. Unchanged lines are never sent.
+
+    Order is ignored, lines are added after the existing lines of their parent, except for the
+    children of `ordered` parents (i.e. access list entries): if their order changes, or lines are
+    added anywhere but after the existing ones, the parent is negated and its whole block sent.
+
+    Patterns are regular expressions matched against the start of (stripped) lines.
+
+    Args:
+        desired: the desired config
+        running: the running config
+        negate_prefix: prefix negating a line
+        exit_command: input that exits a level of the hierarchy
+        ignore: patterns of lines (and their children) left out of the diff at any level, by
+            default the version, boot markers, banners and certificates
+        scope: patterns of the top level lines to diff, all of them if None
+        ordered: patterns of parents whose children are evaluated in order
+
+    Returns:
+        list[str]: the inputs to send, empty if the configs do not differ
+
+    Raises:
+        N/A
+
+    """
+    desired_root = parse_config(desired)
+    running_root = parse_config(running)
+
+    ignore_pattern = _compile_patterns(ignore)
+    scope_pattern = _compile_patterns(scope)
+
+    _prune(line=desired_root, ignore=ignore_pattern, scope=scope_pattern)
+    _prune(line=running_root, ignore=ignore_pattern, scope=scope_pattern)
+
+    emitter = _DiffEmitter(exit_command=exit_command)
+
+    _diff_lines(
+        desired=desired_root,
+        running=running_root,
+        path=[],
+        emitter=emitter,
+        negate_prefix=negate_prefix,
+        ordered=_compile_patterns(ordered),
+    )
+
+    # leave the device at the top level of the config mode
+    emitter.exit_to(depth=0)
+
+    return emitter.inputs
+
+
+@dataclass
+class ConfigPushResult:
+    """
+    ConfigPushResult holds the outcome of a (diff based) config push.
+
+    Args:
+        host: host the config was pushed to
+        port: port the config was pushed to
+        inputs: the inputs sent, empty if nothing had to be sent
+        result: the result of sending the inputs, None if nothing was sent
+        cached: True if the push was skipped as the config was the last config pushed to the host
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    host: str
+    port: int
+    inputs: list[str] = field(default_factory=list)
+    result: Result | None = None
+    cached: bool = False
+
+    @property
+    def changed(self) -> bool:
+        """
+        Returns True if any inputs were sent.
+
+        Args:
+            N/A
+
+        Returns:
+            bool: True if inputs were sent
+
+        Raises:
+            N/A
+
+        """
+        return self.result is not None
+
+    @property
+    def failed(self) -> bool:
+        """
+        Returns True if sending the inputs indicated a failure.
+
+        Args:
+            N/A
+
+        Returns:
+            bool: True if sending the inputs failed
+
+        Raises:
+            N/A
+
+        """
+        return self.result is not None and self.result.failed
+
+
+class PushedConfigCache:
+    """
+    PushedConfigCache holds a digest of the last config successfully pushed to each host.
+
+    Pushing a config whose digest matches the last pushed config is skipped entirely, without
+    even fetching the running config, so re-pushing an unchanged config is (nearly) free. Only
+    the digest is stored, so holding an entry per host of a large fleet is cheap. Changes made out
+    of band are not seen, use `invalidate` (or `force` when pushing) to push regardless.
+
+    Args:
+        max_entries: maximum number of entries, least recently used are evicted first
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    def __init__(self, *, max_entries: int = DEFAULT_PUSHED_CONFIG_CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+
+        self._entries: OrderedDict[tuple[str, int], str] = OrderedDict()
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        """
+        Magic repr method for PushedConfigCache object
+
+        Args:
+            N/A
+
+        Returns:
+            str: repr for PushedConfigCache object
+
+        Raises:
+            N/A
+
+        """
+        return f"{self.__class__.__name__}(max_entries={self.max_entries!r})"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, host: str, port: int) -> str | None:
+        """
+        Return the digest of the last config pushed to the host, or None if unknown.
+
+        Args:
+            host: the host
+            port: the port
+
+        Returns:
+            str | None: the config digest (see config_digest) or None
+
+        Raises:
+            N/A
+
+        """
+        with self._lock:
+            digest = self._entries.get((host, port))
+
+            if digest is not None:
+                self._entries.move_to_end((host, port))
+
+            return digest
+
+    def set(self, host: str, port: int, digest: str) -> None:
+        """
+        Store the digest of the config pushed to the host.
+
+        Args:
+            host: the host
+            port: the port
+            digest: the config digest (see config_digest)
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        with self._lock:
+            self._entries[(host, port)] = digest
+            self._entries.move_to_end((host, port))
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, host: str, port: int) -> None:
+        """
+        Forget the last config pushed to the host.
+
+        Args:
+            host: the host
+            port: the port
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        with self._lock:
+            self._entries.pop((host, port), None)
+
+    def clear(self) -> None:
+        """
+        Forget the last config pushed to every host.
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+# shared by every Cli that is not given a cache of its own
+DEFAULT_PUSHED_CONFIG_CACHE = PushedConfigCache()
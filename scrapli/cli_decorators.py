@@ -1,11 +1,14 @@
 """scrapli.cli_decorators"""
 
 from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
 from ctypes import c_uint64
 from functools import update_wrapper
 from typing import TYPE_CHECKING, Concatenate, ParamSpec
 
 from scrapli.cli_result import Result
+from scrapli.ffi_types import CancelScope
+from scrapli.instrumentation import instrument_operation, instrument_operation_async
 from scrapli.session import DEFAULT_OPERATION_TIMEOUT_NS
 
 if TYPE_CHECKING:
@@ -13,12 +16,18 @@ if TYPE_CHECKING:
 
 P = ParamSpec("P")
 
+# the timeout applied by the enclosing operation, if any -- an operation run from within another
+# without a timeout of its own keeps it rather than resetting to the session timeout
+_enclosing_operation_timeout_ns: ContextVar[int | None] = ContextVar(
+    "scrapli_cli_enclosing_operation_timeout_ns", default=None
+)
+
 
 def handle_operation_timeout(
     wrapped: Callable[Concatenate["Cli", P], Result],
 ) -> Callable[Concatenate["Cli", P], Result]:
     """
-    Wraps a Cli operation and sets the timeout value for the duration of the operation.
+    Wraps a Cli operation and applies the timeout value (and cancel scope) for the operation.
 
     Args:
         wrapped: the operation function
@@ -30,6 +39,7 @@ def handle_operation_timeout(
         N/A
 
     """
+    wrapped = instrument_operation(wrapped)
 
     def wrapper(inst: "Cli", /, *args: P.args, **kwargs: P.kwargs) -> Result:
         """
@@ -47,34 +57,38 @@ def handle_operation_timeout(
             OptionsException: if the operation timeout failed to set
 
         """
-        operation_timeout_ns = kwargs.get("operation_timeout_ns")
-        if operation_timeout_ns is None:
-            return wrapped(inst, *args, **kwargs)
-
-        if operation_timeout_ns == inst.session_options.operation_timeout_ns:
-            return wrapped(inst, *args, **kwargs)
+        cancel = kwargs.get("cancel")
+        if isinstance(cancel, CancelScope):
+            # a scope is shared, each operation gets its own child cancellation of it
+            kwargs["cancel"] = cancel.child()
 
+        operation_timeout_ns = kwargs.get("operation_timeout_ns")
         if not isinstance(operation_timeout_ns, int):
-            # ignore an invalid type for the timeout
-            return wrapped(inst, *args, **kwargs)
-
-        inst.ffi_mapping.session_mapping.set_operation_timeout_ns(
-            inst._ptr_or_exception(),
-            c_uint64(operation_timeout_ns),
-        )
+            # unset (or an invalid type for) the timeout means the enclosing operation timeout or
+            # otherwise the session timeout
+            operation_timeout_ns = (
+                _enclosing_operation_timeout_ns.get()
+                or inst.session_options.operation_timeout_ns
+                or DEFAULT_OPERATION_TIMEOUT_NS
+            )
 
-        try:
-            res = wrapped(inst, *args, **kwargs)
-        except Exception:
-            raise
-        finally:
-            # unconditionally reset the timeout
+        # the timeout is only set when it differs from the one currently applied and is never
+        # reset after the operation, so consecutive operations (with the same timeout) do not
+        # pay any ffi calls for it
+        if operation_timeout_ns != inst._operation_timeout_ns:
             inst.ffi_mapping.session_mapping.set_operation_timeout_ns(
                 inst._ptr_or_exception(),
-                c_uint64(inst.session_options.operation_timeout_ns or DEFAULT_OPERATION_TIMEOUT_NS),
+                c_uint64(operation_timeout_ns),
             )
 
-        return res
+            inst._operation_timeout_ns = operation_timeout_ns
+
+        token = _enclosing_operation_timeout_ns.set(operation_timeout_ns)
+
+        try:
+            return wrapped(inst, *args, **kwargs)
+        finally:
+            _enclosing_operation_timeout_ns.reset(token)
 
     update_wrapper(wrapper=wrapper, wrapped=wrapped)
 
@@ -85,7 +99,7 @@ def handle_operation_timeout_async(
     wrapped: Callable[Concatenate["Cli", P], Awaitable[Result]],
 ) -> Callable[Concatenate["Cli", P], Awaitable[Result]]:
     """
-    Wraps a Cli operation and sets the timeout value for the duration of the operation.
+    Wraps a Cli operation and applies the timeout value (and cancel scope) for the operation.
 
     Args:
         wrapped: the operation function
@@ -97,6 +111,7 @@ def handle_operation_timeout_async(
         N/A
 
     """
+    wrapped = instrument_operation_async(wrapped)
 
     async def wrapper(inst: "Cli", /, *args: P.args, **kwargs: P.kwargs) -> Result:
         """
@@ -114,34 +129,38 @@ def handle_operation_timeout_async(
             OptionsException: if the operation timeout failed to set
 
         """
-        operation_timeout_ns = kwargs.get("operation_timeout_ns")
-        if operation_timeout_ns is None:
-            return await wrapped(inst, *args, **kwargs)
-
-        if operation_timeout_ns == inst.session_options.operation_timeout_ns:
-            return await wrapped(inst, *args, **kwargs)
+        cancel = kwargs.get("cancel")
+        if isinstance(cancel, CancelScope):
+            # a scope is shared, each operation gets its own child cancellation of it
+            kwargs["cancel"] = cancel.child()
 
+        operation_timeout_ns = kwargs.get("operation_timeout_ns")
         if not isinstance(operation_timeout_ns, int):
-            # ignore an invalid type for the timeout
-            return await wrapped(inst, *args, **kwargs)
-
-        inst.ffi_mapping.session_mapping.set_operation_timeout_ns(
-            inst._ptr_or_exception(),
-            c_uint64(operation_timeout_ns),
-        )
+            # unset (or an invalid type for) the timeout means the enclosing operation timeout or
+            # otherwise the session timeout
+            operation_timeout_ns = (
+                _enclosing_operation_timeout_ns.get()
+                or inst.session_options.operation_timeout_ns
+                or DEFAULT_OPERATION_TIMEOUT_NS
+            )
 
-        try:
-            res = await wrapped(inst, *args, **kwargs)
-        except Exception:
-            raise
-        finally:
-            # unconditionally reset the timeout
+        # the timeout is only set when it differs from the one currently applied and is never
+        # reset after the operation, so consecutive operations (with the same timeout) do not
+        # pay any ffi calls for it
+        if operation_timeout_ns != inst._operation_timeout_ns:
             inst.ffi_mapping.session_mapping.set_operation_timeout_ns(
                 inst._ptr_or_exception(),
-                c_uint64(inst.session_options.operation_timeout_ns or DEFAULT_OPERATION_TIMEOUT_NS),
+                c_uint64(operation_timeout_ns),
             )
 
-        return res
+            inst._operation_timeout_ns = operation_timeout_ns
+
+        token = _enclosing_operation_timeout_ns.set(operation_timeout_ns)
+
+        try:
+            return await wrapped(inst, *args, **kwargs)
+        finally:
+            _enclosing_operation_timeout_ns.reset(token)
 
     update_wrapper(wrapper=wrapper, wrapped=wrapped)
 
@@ -1,9 +1,12 @@
 """cli_parse"""
 
-import urllib.request
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from functools import cache
 from importlib import import_module, resources
 from io import BytesIO, TextIOWrapper
 from logging import getLogger
+from threading import Lock
 from typing import Any, TextIO
 
 from scrapli.exceptions import ParsingException
@@ -73,6 +76,40 @@ def _textfsm_to_dict(
     return structured_output
 
 
+def _textfsm_load_template(template: str | TextIO) -> Any:
+    """
+    Load a TextFSM state machine from the given template
+
+    Args:
+        template: TextIO or string of URL or filesystem path to template to load
+
+    Returns:
+        Any: the loaded textfsm.TextFSM object
+
+    Raises:
+        N/A
+
+    """
+    import textfsm  # noqa: PLC0415
+
+    if isinstance(template, str):
+        if template.startswith("http://") or template.startswith("https://"):
+            # deferred, urllib (and the http/email machinery behind it) is slow to import
+            import urllib.request  # noqa: PLC0415
+
+            with urllib.request.urlopen(template) as response:
+                return textfsm.TextFSM(
+                    TextIOWrapper(
+                        BytesIO(response.read()),
+                        encoding=response.headers.get_content_charset(),
+                    )
+                )
+
+        return textfsm.TextFSM(open(template, mode="rb"))
+
+    return textfsm.TextFSM(template)
+
+
 def textfsm_parse(
     template: str | TextIO, output: str, to_dict: bool = True
 ) -> list[Any] | dict[str, Any]:
@@ -95,19 +132,7 @@ def textfsm_parse(
     """
     import textfsm  # noqa: PLC0415
 
-    if isinstance(template, str):
-        if template.startswith("http://") or template.startswith("https://"):
-            with urllib.request.urlopen(template) as response:
-                re_table = textfsm.TextFSM(
-                    TextIOWrapper(
-                        BytesIO(response.read()),
-                        encoding=response.headers.get_content_charset(),
-                    )
-                )
-        else:
-            re_table = textfsm.TextFSM(open(template, mode="rb"))
-    else:
-        re_table = textfsm.TextFSM(template)
+    re_table = _textfsm_load_template(template=template)
 
     try:
         structured_output: list[Any] | dict[str, Any] = re_table.ParseText(output)
@@ -124,21 +149,197 @@ def textfsm_parse(
     return []
 
 
-def genie_parse(platform: str, command: str, output: str) -> list[Any] | dict[str, Any]:
+class TextFSMStreamParser:
     """
-    Parse output with Cisco genie parsers, try to return structured output
+    TextFSMStreamParser incrementally parses output with TextFSM as it is fed in chunks.
+
+    Complete lines are pushed through the TextFSM state machine as soon as they are fed, and the
+    records completed so far are handed back (and released) from each `feed` call, so large
+    outputs never need to be held as one string alongside the full parsed table. Templates using
+    the `Fillup` option may rewrite already completed records, so for those templates records are
+    only handed back from `close`.
 
     Args:
-        platform: genie device type; i.e. iosxe, iosxr, etc.
-        command: string of command that was executed (to find appropriate parser)
-        output: unstructured output from device to parse
+        template: TextIO or string of URL or filesystem path to template to use to parse data
+        to_dict: convert textfsm records from lists to dicts keyed on the (lower cased) header
 
     Returns:
-        output: structured data
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    def __init__(self, template: str | TextIO, to_dict: bool = True) -> None:
+        self._re_table = _textfsm_load_template(template=template)
+        self._to_dict = to_dict
+
+        self._header_lower = [h.lower() for h in self._re_table.header]
+        self._hold_records = any("Fillup" in v.OptionNames() for v in self._re_table.values)
+
+        self._partial_line = ""
+        self._closed = False
+
+    @property
+    def header(self) -> list[str]:
+        """
+        Returns the header (value names) of the template.
+
+        Args:
+            N/A
+
+        Returns:
+            list[str]: the template header
+
+        Raises:
+            N/A
+
+        """
+        return list(self._re_table.header)
+
+    def _finished(self) -> bool:
+        # the state machine stops at End/EOF, ParseText ignores any text after that point
+        return self._re_table._cur_state_name in ("End", "EOF")
+
+    def _parse(self, text: str, eof: bool) -> list[Any]:
+        import textfsm  # noqa: PLC0415
+
+        if self._finished():
+            # ParseText would check one more line before noticing, so nothing is parsed at all --
+            # at eof this still applies the implicit EOF record, exactly as a single ParseText does
+            text = ""
+
+        try:
+            # the state machine (and its current record) persist across calls w/ eof=False, the
+            # returned list is the state machine's own result table
+            records: list[Any] = self._re_table.ParseText(text, eof=eof)
+        except textfsm.parser.TextFSMError as exc:
+            raise ParsingException("failed parsing output with 'textfsm'") from exc
+
+        if self._hold_records and not eof:
+            return []
+
+        out = list(records)
+
+        # release the records we hand back so the full table is never held here
+        del records[:]
+
+        if self._to_dict:
+            return [dict(zip(self._header_lower, row)) for row in out]
+
+        return out
+
+    def feed(self, chunk: str) -> list[Any]:
+        """
+        Feed a chunk of output, returning any records completed by it.
+
+        Args:
+            chunk: the next chunk of unstructured output, need not end on a line boundary
+
+        Returns:
+            list[Any]: records completed by this chunk, possibly empty
+
+        Raises:
+            ParsingException: if the parser is closed or a textfsm parsing error occurs
+
+        """
+        if self._closed:
+            raise ParsingException("cannot feed a closed textfsm stream parser")
+
+        if self._finished():
+            self._partial_line = ""
+
+            return []
+
+        buf = self._partial_line + chunk
+
+        last_newline = buf.rfind("\n")
+        if last_newline == -1:
+            self._partial_line = buf
+
+            return []
+
+        self._partial_line = buf[last_newline + 1 :]
+
+        return self._parse(text=buf[: last_newline + 1], eof=False)
+
+    def close(self) -> list[Any]:
+        """
+        Flush any remaining (partial line) output through the state machine and finish parsing.
+
+        Args:
+            N/A
+
+        Returns:
+            list[Any]: remaining records
+
+        Raises:
+            ParsingException: if a textfsm parsing error occurs
+
+        """
+        if self._closed:
+            return []
+
+        self._closed = True
+
+        remaining = self._partial_line
+        self._partial_line = ""
+
+        return self._parse(text=remaining, eof=True)
+
+
+def textfsm_parse_iter(
+    template: str | TextIO, chunks: Iterable[str], to_dict: bool = True
+) -> Iterator[Any]:
+    """
+    Parse streamed output with TextFSM, yielding records as soon as they are complete
+
+    Args:
+        template: TextIO or string of URL or filesystem path to template to use to parse data
+        chunks: iterable of unstructured output chunks, i.e. reads from a session or a file
+        to_dict: convert textfsm output from list of lists to list of dicts
+
+    Yields:
+        Any: parsed records
 
     Raises:
+        ParsingException: if a textfsm parsing error occurs
+
+    """
+    parser = TextFSMStreamParser(template=template, to_dict=to_dict)
+
+    for chunk in chunks:
+        yield from parser.feed(chunk=chunk)
+
+    yield from parser.close()
+
+
+GENIE_PARSERS_MAX_ENTRIES = 1_024
+
+# genie device objects keyed by genie platform, and resolved (parser class, parser kwargs) keyed
+# by (genie platform, command) -- building devices and resolving parsers is the expensive part of
+# genie parsing, so we only do it once per platform/command; commands may hold varying arguments
+# (interface names and such) so the parsers are bounded, least recently used are evicted first
+_genie_devices: dict[str, Any] = {}
+_genie_parsers: OrderedDict[tuple[str, str], tuple[Any, dict[str, Any]]] = OrderedDict()
+_genie_parsers_lock = Lock()
+
+
+@cache
+def _genie_load() -> tuple[Any, Any]:
+    """
+    Import (once) and return the genie device class and parser lookup function
+
+    Args:
         N/A
 
+    Returns:
+        tuple[Any, Any]: the genie `Device` class and the `get_parser` function
+
+    Raises:
+        ParsingException: if genie is not installed
+
     """
     try:
         device = getattr(import_module(name=".conf.base", package="genie"), "Device")
@@ -148,14 +349,129 @@ def genie_parse(platform: str, command: str, output: str) -> list[Any] | dict[st
     except ModuleNotFoundError as exc:
         raise ParsingException("optional extra 'genie' not found") from exc
 
-    genie_device = device("scrapli_device", custom={"abstraction": {"order": ["os"]}}, os=platform)
+    return device, get_parser
+
+
+def _genie_get_device(platform: str) -> Any:
+    """
+    Return the (cached) genie device for the given platform
+
+    Args:
+        platform: genie device type; i.e. iosxe, iosxr, etc.
+
+    Returns:
+        Any: the genie device object
+
+    Raises:
+        N/A
+
+    """
+    genie_device = _genie_devices.get(platform)
+
+    if genie_device is None:
+        device, _ = _genie_load()
+
+        genie_device = device(
+            "scrapli_device", custom={"abstraction": {"order": ["os"]}}, os=platform
+        )
+        _genie_devices[platform] = genie_device
+
+    return genie_device
+
+
+def _genie_get_parser_for_command(platform: str, command: str) -> tuple[Any, Any, dict[str, Any]]:
+    """
+    Return the (cached) genie device, parser class and parser kwargs for the platform and command
+
+    Args:
+        platform: genie device type; i.e. iosxe, iosxr, etc.
+        command: string of command that was executed (to find appropriate parser)
+
+    Returns:
+        tuple[Any, Any, dict[str, Any]]: the genie device, parser class and parser kwargs
+
+    Raises:
+        N/A
+
+    """
+    genie_device = _genie_get_device(platform=platform)
+
+    key = (platform, command)
+
+    with _genie_parsers_lock:
+        resolved = _genie_parsers.get(key)
+
+        if resolved is not None:
+            _genie_parsers.move_to_end(key)
+
+    if resolved is None:
+        _, get_parser = _genie_load()
+
+        parser_cls, parser_kwargs = get_parser(command, genie_device)
+        resolved = (parser_cls, parser_kwargs)
+
+        with _genie_parsers_lock:
+            _genie_parsers[key] = resolved
+
+            while len(_genie_parsers) > GENIE_PARSERS_MAX_ENTRIES:
+                _genie_parsers.popitem(last=False)
+
+    return genie_device, resolved[0], resolved[1]
+
+
+def genie_parse(platform: str, command: str, output: str) -> list[Any] | dict[str, Any]:
+    """
+    Parse output with Cisco genie parsers, try to return structured output
+
+    The genie device object for a given platform and the parser resolved for a given
+    (platform, command) pair are cached at the module level, so repeated parses only pay for the
+    actual parsing.
+
+    Args:
+        platform: genie device type; i.e. iosxe, iosxr, etc.
+        command: string of command that was executed (to find appropriate parser)
+        output: unstructured output from device to parse
+
+    Returns:
+        output: structured data
+
+    Raises:
+        ParsingException: if genie is not installed or parsing fails
+
+    """
+    _genie_load()
 
     try:
-        get_parser(command, genie_device)
-        genie_parsed_result = genie_device.parse(command, output=output)
+        genie_device, parser_cls, parser_kwargs = _genie_get_parser_for_command(
+            platform=platform, command=command
+        )
+        genie_parsed_result = parser_cls(device=genie_device).parse(**parser_kwargs, output=output)
         if isinstance(genie_parsed_result, list | dict):
             return genie_parsed_result
     except Exception as exc:
         raise ParsingException("failed parsing output with 'genie'") from exc
 
     return []
+
+
+def genie_parse_many(
+    platform: str, commands_and_outputs: list[tuple[str, str]]
+) -> list[list[Any] | dict[str, Any]]:
+    """
+    Parse many (command, output) pairs for a single platform with Cisco genie parsers
+
+    Args:
+        platform: genie device type; i.e. iosxe, iosxr, etc.
+        commands_and_outputs: list of (command, output) pairs to parse
+
+    Returns:
+        list[list[Any] | dict[str, Any]]: structured data for each pair, in the given order
+
+    Raises:
+        ParsingException: if genie is not installed or parsing any output fails
+
+    """
+    return [
+        genie_parse(platform=platform, command=command, output=output)
+        for command, output in commands_and_outputs
+    ]
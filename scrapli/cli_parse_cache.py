@@ -0,0 +1,309 @@
+"""scrapli.cli_parse_cache"""
+
+import json
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from hashlib import blake2b
+from logging import getLogger
+from pathlib import Path
+from tempfile import mkstemp
+from threading import Lock
+from typing import Any
+
+logger = getLogger(__name__)
+
+DEFAULT_PARSE_CACHE_MAX_ENTRIES = 1_024
+
+
+@dataclass
+class ParseCacheStats:
+    """
+    ParseCacheStats holds the counters of a ParseCache.
+
+    Args:
+        hits: count of lookups served from the cache (memory or disk)
+        misses: count of lookups that were not in the cache
+        evictions: count of entries evicted from the in memory cache
+        entries: current count of in memory entries
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+
+
+class ParseCache:
+    """
+    ParseCache memoizes structured (parsed) output keyed on the content of the unstructured output.
+
+    Entries are keyed on the parser engine, the platform, the command (or template) and a hash of
+    the output, so byte-identical outputs (as is common when polling) are only ever parsed once.
+    Entries are stored json encoded so every hit returns a fresh (safe to mutate) copy.
+
+    Args:
+        max_entries: maximum number of in memory entries, least recently used are evicted first
+        disk_path: optional directory to persist entries to, checked on in memory misses
+        max_disk_entries: maximum number of on disk entries, oldest are removed first
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_PARSE_CACHE_MAX_ENTRIES,
+        disk_path: str | None = None,
+        max_disk_entries: int | None = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.disk_path = Path(disk_path).expanduser() if disk_path is not None else None
+        self.max_disk_entries = max_disk_entries
+
+        if self.disk_path is not None:
+            self.disk_path.mkdir(parents=True, exist_ok=True)
+
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __repr__(self) -> str:
+        """
+        Magic repr method for ParseCache object
+
+        Args:
+            N/A
+
+        Returns:
+            str: repr for ParseCache object
+
+        Raises:
+            N/A
+
+        """
+        return (
+            f"{self.__class__.__name__}("
+            f"max_entries={self.max_entries!r}, "
+            f"disk_path={self.disk_path!r}, "
+            f"max_disk_entries={self.max_disk_entries!r})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(engine: str, platform: str, command: str, output: str) -> str:
+        """
+        Build the cache key for the given parse inputs.
+
+        Args:
+            engine: parser engine name, i.e. "textfsm" or "genie"
+            platform: the platform the output was parsed for
+            command: the command (or template identifier) the output was parsed with
+            output: the unstructured output
+
+        Returns:
+            str: the cache key
+
+        Raises:
+            N/A
+
+        """
+        h = blake2b(digest_size=16)
+
+        for part in (engine, platform, command):
+            h.update(part.encode())
+            h.update(b"\x00")
+
+        h.update(output.encode())
+
+        return h.hexdigest()
+
+    @property
+    def stats(self) -> ParseCacheStats:
+        """
+        Returns the cache counters.
+
+        Args:
+            N/A
+
+        Returns:
+            ParseCacheStats: the cache counters
+
+        Raises:
+            N/A
+
+        """
+        return ParseCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=len(self._entries),
+        )
+
+    def get(self, key: str) -> list[Any] | dict[str, Any] | None:
+        """
+        Return the cached structured output for the key, or None on a miss.
+
+        Args:
+            key: the cache key (see ParseCache.key)
+
+        Returns:
+            list[Any] | dict[str, Any] | None: the cached structured output or None
+
+        Raises:
+            N/A
+
+        """
+        with self._lock:
+            encoded = self._entries.get(key)
+
+            if encoded is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+
+                return json.loads(encoded)  # type: ignore[no-any-return]
+
+        encoded = self._disk_get(key=key)
+        value = self._disk_decode(key=key, encoded=encoded) if encoded is not None else None
+
+        if encoded is None or value is None:
+            with self._lock:
+                self._misses += 1
+
+            return None
+
+        with self._lock:
+            self._hits += 1
+            self._set_locked(key=key, encoded=encoded)
+
+        return value
+
+    def set(self, key: str, value: list[Any] | dict[str, Any]) -> None:
+        """
+        Store the structured output for the key.
+
+        Values that can't be json encoded, or that would not decode back to an equal value (i.e.
+        dicts with int keys or tuples, as genie output often holds) are not cached, so a hit always
+        returns the same data as a miss.
+
+        Args:
+            key: the cache key (see ParseCache.key)
+            value: the structured output to store
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        try:
+            encoded = json.dumps(value)
+        except (TypeError, ValueError):
+            logger.debug("parsed output not json serializable, not caching")
+
+            return
+
+        if json.loads(encoded) != value:
+            logger.debug("parsed output does not survive json encoding, not caching")
+
+            return
+
+        with self._lock:
+            self._set_locked(key=key, encoded=encoded)
+
+        self._disk_set(key=key, encoded=encoded)
+
+    def clear(self) -> None:
+        """
+        Clear the in memory entries and reset the counters, on disk entries are left as is.
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        with self._lock:
+            self._entries.clear()
+
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def _set_locked(self, key: str, encoded: str) -> None:
+        self._entries[key] = encoded
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def _disk_get(self, key: str) -> str | None:
+        if self.disk_path is None:
+            return None
+
+        try:
+            return (self.disk_path / f"{key}.json").read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def _disk_decode(self, key: str, encoded: str) -> list[Any] | dict[str, Any] | None:
+        try:
+            return json.loads(encoded)  # type: ignore[no-any-return]
+        except ValueError:
+            logger.warning("corrupt parse cache entry on disk, removing it")
+
+        if self.disk_path is not None:
+            (self.disk_path / f"{key}.json").unlink(missing_ok=True)
+
+        return None
+
+    def _disk_set(self, key: str, encoded: str) -> None:
+        if self.disk_path is None:
+            return
+
+        try:
+            # write then rename so concurrent readers never see a partial entry
+            fd, tmp_path = mkstemp(dir=self.disk_path, suffix=".tmp")
+
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(encoded)
+
+            os.replace(tmp_path, self.disk_path / f"{key}.json")
+        except OSError as exc:
+            logger.warning(f"failed writing parse cache entry to disk: {exc}")
+
+            return
+
+        if self.max_disk_entries is None:
+            return
+
+        disk_entries = sorted(
+            self.disk_path.glob("*.json"),
+            key=lambda p: p.stat().st_mtime_ns,
+        )
+
+        for stale in disk_entries[: max(len(disk_entries) - self.max_disk_entries, 0)]:
+            stale.unlink(missing_ok=True)
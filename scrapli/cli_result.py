@@ -1,10 +1,14 @@
 """scrapli.result"""
 
+from codecs import getincrementaldecoder
+from collections.abc import Iterator
 from ctypes import c_size_t, pointer
-from typing import Any, TextIO
+from mmap import ACCESS_READ, mmap
+from typing import Any, BinaryIO, TextIO
 
 from scrapli.cli_parse import genie_parse, textfsm_get_template, textfsm_parse
-from scrapli.exceptions import ParsingException
+from scrapli.cli_parse_cache import ParseCache
+from scrapli.exceptions import ParsingException, ScrapliException
 from scrapli.ffi_types import ZigSlice
 from scrapli.helper import bulid_result_preview, unix_nano_timestmap_to_iso
 
@@ -56,24 +60,31 @@ class Result:
         *,
         host: str,
         port: int,
-        inputs: bytes,
+        inputs: bytes | list[str],
         input_lens: list[int],
         start_time: int,
         splits: list[int],
-        result_raw_journals: bytes,
+        result_raw_journals: bytes | None,
         result_raw_journal_lens: list[int],
         results: bytes,
         result_lens: list[int],
         results_failed_indicator: str,
         textfsm_platform: str,
         genie_platform: str,
+        results_spool: str | BinaryIO | None = None,
+        results_spool_offset: int = 0,
     ) -> None:
         self.host = host
         self.port = port
-        self.inputs = [i.decode() for i in _split_packed(inputs, input_lens)]
+        # callers that already know the inputs (they sent them after all!) can pass them as is
+        # rather than have them shipped back over the ffi boundary and decoded
+        self.inputs = (
+            list(inputs)
+            if isinstance(inputs, list)
+            else [i.decode() for i in _split_packed(inputs, input_lens)]
+        )
         self.start_time = start_time
         self.splits = splits
-        self.results = [r.decode() for r in _split_packed(results, result_lens)]
         self.results_failed_indicator = results_failed_indicator
         self.textfsm_platform = textfsm_platform
         self.genie_platform = genie_platform
@@ -81,9 +92,26 @@ class Result:
         # each entry's *journal* of the content that was cleaned out of the corresponding
         # result -- raw is never stored, its reconstructed (lazily, see results_raw) from the
         # (result, journal) pair on demand
-        self._result_raw_journals = _split_packed(result_raw_journals, result_raw_journal_lens)
+        # journals may not have been retained at all (see Cli fetch_results_raw) in which case raw
+        # can not be reconstructed
+        self._result_raw_journals: list[bytes] | None = (
+            _split_packed(result_raw_journals, result_raw_journal_lens)
+            if result_raw_journals is not None
+            else None
+        )
         self._results_raw: list[bytes] | None = None
 
+        # when spooled, the (packed) results live in the spool file starting at the offset and are
+        # only ever decoded (and then cached) if/when the results property is accessed
+        self._results_spool = results_spool
+        self._results_spool_offset = results_spool_offset
+        self._results_spool_mmap: mmap | None = None
+        self._result_lens = result_lens
+
+        self._results: list[str] | None = None
+        if results_spool is None:
+            self._results = [r.decode() for r in _split_packed(results, result_lens)]
+
     def __repr__(self) -> str:
         """
         Magic repr method for Result class
@@ -145,13 +173,155 @@ class Result:
         """
         self.inputs.extend(result.inputs)
         self.results.extend(result.results)
+        self._result_lens.extend(result._result_lens)
         self.splits.extend(result.splits)
 
-        self._result_raw_journals.extend(result._result_raw_journals)
+        if not self.results_failed_indicator:
+            # keep the first failure so an extended result is failed if any part of it failed
+            self.results_failed_indicator = result.results_failed_indicator
+
+        if self._result_raw_journals is None or result._result_raw_journals is None:
+            # if either side didnt retain raw journals we cant reconstruct raw for the whole thing
+            self._result_raw_journals = None
+        else:
+            self._result_raw_journals.extend(result._result_raw_journals)
+
         # drop any cached reconstruction, itll rebuild (now including the extended entries)
         # on next access
         self._results_raw = None
 
+    @property
+    def results(self) -> list[str]:
+        """
+        Returns the result of each input.
+
+        For spooled results this decodes (and caches) the full contents of the spool, use
+        `results_view` or `iter_result_chunks` to access spooled results without doing so.
+
+        Args:
+            N/A
+
+        Returns:
+            list[str]: the results
+
+        Raises:
+            N/A
+
+        """
+        if self._results is None:
+            self._results = [
+                bytes(self.results_view(index=index)).decode()
+                for index in range(len(self._result_lens))
+            ]
+
+        return self._results
+
+    @property
+    def spooled(self) -> bool:
+        """
+        Returns True if the results are spooled to a file rather than held in memory.
+
+        Args:
+            N/A
+
+        Returns:
+            bool: True if spooled, otherwise False
+
+        Raises:
+            N/A
+
+        """
+        return self._results_spool is not None and self._results is None
+
+    def _spool_mmap(self) -> mmap | None:
+        if self._results_spool_mmap is not None:
+            return self._results_spool_mmap
+
+        if self._results_spool is None or sum(self._result_lens) == 0:
+            return None
+
+        spool = self._results_spool
+
+        # prefer (re)opening by name so write only file objects work too, otherwise (i.e. anonymous
+        # temporary files) map the file object's own fd
+        spool_path: str | None = None
+
+        if isinstance(spool, str):
+            spool_path = spool
+        else:
+            spool.flush()
+
+            if isinstance(getattr(spool, "name", None), str):
+                spool_path = spool.name
+
+            if spool_path is None:
+                self._results_spool_mmap = mmap(spool.fileno(), 0, access=ACCESS_READ)
+
+                return self._results_spool_mmap
+
+        with open(spool_path, "rb") as f:
+            self._results_spool_mmap = mmap(f.fileno(), 0, access=ACCESS_READ)
+
+        return self._results_spool_mmap
+
+    def results_view(self, index: int = 0) -> memoryview:
+        """
+        Returns a read only view of the (encoded) result at the given index.
+
+        For spooled results the view is backed by a memory mapping of the spool file, so no copy
+        of the result is made.
+
+        Args:
+            index: the index of the result
+
+        Returns:
+            memoryview: view of the result bytes
+
+        Raises:
+            N/A
+
+        """
+        if not self.spooled:
+            return memoryview(self.results[index].encode())
+
+        mm = self._spool_mmap()
+        if mm is None:
+            return memoryview(b"")
+
+        start = self._results_spool_offset + sum(self._result_lens[:index])
+
+        return memoryview(mm)[start : start + self._result_lens[index]]
+
+    def iter_result_chunks(self, index: int = 0, chunk_size: int = 65_536) -> Iterator[str]:
+        """
+        Yields the result at the given index as decoded chunks.
+
+        Paired with spooling this allows for processing (i.e. `textfsm_parse_iter`) very large
+        results without ever holding the full decoded result in memory.
+
+        Args:
+            index: the index of the result
+            chunk_size: size in bytes of each chunk to decode
+
+        Yields:
+            str: decoded chunks of the result
+
+        Raises:
+            N/A
+
+        """
+        view = self.results_view(index=index)
+        decoder = getincrementaldecoder("utf-8")()
+
+        for start in range(0, len(view), chunk_size):
+            chunk = decoder.decode(view[start : start + chunk_size])
+            if chunk:
+                yield chunk
+
+        final = decoder.decode(b"", final=True)
+        if final:
+            yield final
+
     @property
     def failed(self) -> bool:
         """
@@ -241,12 +411,12 @@ class Result:
             list[bytes]: the raw result entries
 
         Raises:
-            N/A
+            ScrapliException: if raw journals were not fetched for this result
 
         """
         if self._results_raw is None:
             self._results_raw = [
-                self._reconstruct_result_raw(index=index) for index in range(len(self.results))
+                self._reconstruct_result_raw(index=index) for index in range(len(self._result_lens))
             ]
 
         return self._results_raw
@@ -268,7 +438,12 @@ class Result:
         # deferred to avoid circular imports (and to only pay for it when raw is fetched)
         from scrapli.ffi_mapping import LibScrapliMapping  # noqa: PLC0415
 
-        result = self.results[index].encode()
+        if self._result_raw_journals is None:
+            raise ScrapliException(
+                "raw results unavailable, result raw journals were not fetched for this result"
+            )
+
+        result = bytes(self.results_view(index=index))
         journal = self._result_raw_journals[index]
 
         if not journal:
@@ -320,6 +495,7 @@ class Result:
         index: int = 0,
         template: str | TextIO | None = None,
         to_dict: bool = True,
+        cache: ParseCache | None = None,
     ) -> list[Any] | dict[str, Any]:
         """
         Parse results with textfsm, always return structured data
@@ -331,6 +507,8 @@ class Result:
             template: string path to textfsm template or opened textfsm template file
             to_dict: convert textfsm output from list of lists to list of dicts -- basically create
                 dict from header and row data so it is easier to read/parse the output
+            cache: optional parse cache -- if the same output was already parsed (for the same
+                platform/command/template) the cached structured data is returned without parsing
 
         Returns:
             structured_result: empty list or parsed data from textfsm
@@ -339,6 +517,30 @@ class Result:
             N/A
 
         """
+        cache_key = None
+
+        if cache is not None:
+            # an explicitly provided template is part of the key, an opened template w/out a name
+            # cant be identified so we just dont cache in that case
+            template_id: str | None = ""
+
+            if isinstance(template, str):
+                template_id = template
+            elif template is not None:
+                template_id = getattr(template, "name", None)
+
+            if template_id is not None:
+                cache_key = ParseCache.key(
+                    engine=f"textfsm:{to_dict}",
+                    platform=self.textfsm_platform,
+                    command=f"{self.inputs[index]}\x00{template_id}",
+                    output=self.results[index],
+                )
+
+                cached = cache.get(key=cache_key)
+                if cached is not None:
+                    return cached
+
         if template is None:
             template = textfsm_get_template(
                 platform=self.textfsm_platform, command=self.inputs[index]
@@ -347,11 +549,19 @@ class Result:
         if template is None:
             raise ParsingException("no template provided or available for input")
 
-        return textfsm_parse(template=template, output=self.results[index], to_dict=to_dict)
+        structured_result = textfsm_parse(
+            template=template, output=self.results[index], to_dict=to_dict
+        )
+
+        if cache is not None and cache_key is not None:
+            cache.set(key=cache_key, value=structured_result)
+
+        return structured_result
 
     def genie_parse(
         self,
         index: int = 0,
+        cache: ParseCache | None = None,
     ) -> dict[str, Any] | list[Any]:
         """
         Parse results with genie, always return structured data
@@ -360,6 +570,8 @@ class Result:
 
         Args:
             index: the index of the result to parse, assumes first/zeroith if not provided
+            cache: optional parse cache -- if the same output was already parsed (for the same
+                platform/command) the cached structured data is returned without parsing
 
         Returns:
             structured_result: empty list or parsed data from genie
@@ -368,4 +580,24 @@ class Result:
             N/A
 
         """
-        return genie_parse(self.genie_platform, self.inputs[index], self.results[index])
+        if cache is None:
+            return genie_parse(self.genie_platform, self.inputs[index], self.results[index])
+
+        cache_key = ParseCache.key(
+            engine="genie",
+            platform=self.genie_platform,
+            command=self.inputs[index],
+            output=self.results[index],
+        )
+
+        cached = cache.get(key=cache_key)
+        if cached is not None:
+            return cached
+
+        structured_result = genie_parse(
+            self.genie_platform, self.inputs[index], self.results[index]
+        )
+
+        cache.set(key=cache_key, value=structured_result)
+
+        return structured_result
@@ -10,10 +10,11 @@ from ctypes import (
     c_uint64,
     c_void_p,
 )
+from functools import cached_property
+from typing import TYPE_CHECKING
 
 from scrapli.ffi import get_libscrapli_path
 from scrapli.ffi_mapping_cli import LibScrapliCliMapping
-from scrapli.ffi_mapping_netconf import LibScrapliNetconfMapping
 from scrapli.ffi_types import (
     DriverPointer,
     LibScrapliFFIResult,
@@ -22,6 +23,9 @@ from scrapli.ffi_types import (
     ZigSlicePointer,
 )
 
+if TYPE_CHECKING:
+    from scrapli.ffi_mapping_netconf import LibScrapliNetconfMapping
+
 
 class LibScrapliSharedMapping:
     """
@@ -486,7 +490,25 @@ class LibScrapliMapping:
         self.shared_mapping = LibScrapliSharedMapping(self.lib)
         self.session_mapping = LibScrapliSessionMapping(self.lib)
         self.cli_mapping = LibScrapliCliMapping(self.lib)
-        self.netconf_mapping = LibScrapliNetconfMapping(self.lib)
+
+    @cached_property
+    def netconf_mapping(self) -> "LibScrapliNetconfMapping":
+        """
+        Returns the netconf mapping, only set up (and imported) once a netconf driver needs it.
+
+        Args:
+            N/A
+
+        Returns:
+            LibScrapliNetconfMapping: the netconf mapping
+
+        Raises:
+            N/A
+
+        """
+        from scrapli.ffi_mapping_netconf import LibScrapliNetconfMapping  # noqa: PLC0415
+
+        return LibScrapliNetconfMapping(self.lib)
 
     def assert_no_leaks(self) -> bool:
         """
@@ -1,7 +1,8 @@
 """scrapli.ffi_types"""
 
-import xml.etree.ElementTree as ET
+import os
 from collections.abc import Callable
+from contextlib import suppress
 from ctypes import (
     CFUNCTYPE,
     POINTER,
@@ -25,8 +26,13 @@ from ctypes import (
     pointer,
 )
 from enum import IntEnum
-from logging import CRITICAL, DEBUG, FATAL, INFO, NOTSET, WARN, Logger
-from typing import TYPE_CHECKING, Any, ClassVar, TypeAlias
+from logging import CRITICAL, DEBUG, FATAL, INFO, NOTSET, WARN, WARNING, Logger, LogRecord
+from queue import Queue
+from threading import Lock
+from time import monotonic_ns
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, BinaryIO, ClassVar, TypeAlias
+from weakref import WeakSet, finalize
 
 from scrapli.exceptions import (
     CancelledException,
@@ -81,10 +87,42 @@ class Cancel:
 
     def __init__(self) -> None:
         self._v = c_bool(False)
+        self._scope: CancelScope | None = None
+
+    @classmethod
+    def with_deadline(cls, deadline_ns: int) -> "CancelScope":
+        """
+        Returns a cancel scope that cancels its operations once the deadline passes.
+
+        Args:
+            deadline_ns: the `time.monotonic_ns()` at which to cancel
+
+        Returns:
+            CancelScope: the cancel scope
+
+        Raises:
+            N/A
+
+        """
+        return CancelScope(deadline_ns=deadline_ns)
 
     def _to_ffi(self) -> CancelPointer:
         return pointer(self._v)
 
+    def _wakeup_scope(self) -> "CancelScope | None":
+        return self._scope
+
+    def _wakeup_fds(self) -> list[int]:
+        scope = self._wakeup_scope()
+
+        return [] if scope is None else [scope.wakeup_fd]
+
+    def _wait_timeout_s(self, poll_interval_s: float) -> float | None:
+        scope = self._wakeup_scope()
+
+        # a bare cancel may be set from anywhere so has to be polled, a scope wakes its waiters
+        return poll_interval_s if scope is None else scope.remaining_s
+
     def cancel(self) -> None:
         """Send the cancellation signal for the operation."""
         self._v.value = True
@@ -92,8 +130,235 @@ class Cancel:
     @property
     def cancelled(self) -> bool:
         """Returns the cancellation state."""
+        if not self._v.value and self._scope is not None and self._scope.cancelled:
+            self._v.value = True
+
+        return self._v.value
+
+
+def _close_fds(*fds: int) -> None:
+    for fd in fds:
+        with suppress(OSError):
+            os.close(fd)
+
+
+class CancelScope(Cancel):
+    """
+    CancelScope is a cancellation shared by many operations, possibly of many drivers.
+
+    Pass a scope as the `cancel` of any number of operations, each operation gets a child
+    cancellation of the scope. Cancelling the scope (or the deadline passing) immediately flips
+    the cancellation of every child -- so libscrapli sees it without waiting on python -- and
+    wakes every operation waiting on a result right away rather than on their next poll (sync
+    waiters via the scope's wakeup fd, async waiters via callback). Cancelling a single child
+    (i.e. when its asyncio task is cancelled) leaves the scope and all other operations alone.
+
+    Close the scope (or use it as a context manager) once its operations are done to release the
+    wakeup fds.
+
+    Args:
+        deadline_ns: optional `time.monotonic_ns()` at which to cancel the scope
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    def __init__(self, *, deadline_ns: int | None = None) -> None:
+        super().__init__()
+
+        self.deadline_ns = deadline_ns
+
+        self._lock = Lock()
+        self._children: WeakSet[Cancel] = WeakSet()
+        self._waiters: list[Callable[[], None]] = []
+
+        self._wakeup_read_fd, self._wakeup_write_fd = os.pipe()
+        os.set_blocking(self._wakeup_read_fd, False)
+        os.set_blocking(self._wakeup_write_fd, False)
+
+        self._finalizer = finalize(self, _close_fds, self._wakeup_read_fd, self._wakeup_write_fd)
+
+    def __enter__(self) -> "CancelScope":
+        """
+        Enter method for context manager
+
+        Args:
+            N/A
+
+        Returns:
+            CancelScope: the scope
+
+        Raises:
+            N/A
+
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """
+        Exit method to cleanup for context manager
+
+        Args:
+            exc_type: exception type being raised
+            exc_value: message from exception being raised
+            traceback: traceback from exception being raised
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.close()
+
+    def _wakeup_scope(self) -> "CancelScope | None":
+        return self
+
+    @property
+    def wakeup_fd(self) -> int:
+        """
+        Returns the fd that becomes (and stays) readable once the scope is cancelled.
+
+        Args:
+            N/A
+
+        Returns:
+            int: the wakeup fd
+
+        Raises:
+            N/A
+
+        """
+        return self._wakeup_read_fd
+
+    @property
+    def remaining_s(self) -> float | None:
+        """
+        Returns the seconds until the deadline, if any.
+
+        Args:
+            N/A
+
+        Returns:
+            float | None: the seconds until the deadline, None if the scope has no deadline
+
+        Raises:
+            N/A
+
+        """
+        if self.deadline_ns is None:
+            return None
+
+        return max(self.deadline_ns - monotonic_ns(), 0) / 1_000_000_000
+
+    def _add_waiter(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            if not self._v.value:
+                self._waiters.append(callback)
+
+                return
+
+        callback()
+
+    def _remove_waiter(self, callback: Callable[[], None]) -> None:
+        with self._lock, suppress(ValueError):
+            self._waiters.remove(callback)
+
+    def child(self) -> Cancel:
+        """
+        Returns a cancellation for a single operation of this scope.
+
+        Args:
+            N/A
+
+        Returns:
+            Cancel: the child cancellation
+
+        Raises:
+            N/A
+
+        """
+        child = Cancel()
+        child._scope = self
+
+        with self._lock:
+            if self._v.value:
+                child._v.value = True
+            else:
+                self._children.add(child)
+
+        return child
+
+    def cancel(self) -> None:
+        """
+        Cancel every operation of the scope and wake all of their waiters.
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        with self._lock:
+            if self._v.value:
+                return
+
+            self._v.value = True
+            children = list(self._children)
+            waiters, self._waiters = self._waiters, []
+
+        for child in children:
+            child._v.value = True
+
+        for waiter in waiters:
+            waiter()
+
+        # never read, so the fd stays readable for every (current and future) waiter
+        with suppress(OSError):
+            os.write(self._wakeup_write_fd, b"\x00")
+
+    @property
+    def cancelled(self) -> bool:
+        """Returns the cancellation state, cancelling the scope if the deadline passed."""
+        if (
+            not self._v.value
+            and self.deadline_ns is not None
+            and monotonic_ns() >= self.deadline_ns
+        ):
+            self.cancel()
+
         return self._v.value
 
+    def close(self) -> None:
+        """
+        Release the wakeup fds, the scope must not be used by any operation after closing it.
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self._finalizer()
+
 
 class LibScrapliFFIResult(IntEnum):
     """
@@ -294,6 +559,25 @@ class ZigSlice(Structure):
         """
         return bytes(cast(self.ptr, POINTER(c_uint8 * self.len)).contents[0 : self.len])
 
+    def write_contents_to(self, f: BinaryIO) -> int:
+        """
+        Write the contents of the slice to the given file object without copying to bytes first.
+
+        Args:
+            f: the (binary) file object to write to
+
+        Returns:
+            int: the number of bytes written
+
+        Raises:
+            N/A
+
+        """
+        if self.len == 0:
+            return 0
+
+        return f.write(memoryview(cast(self.ptr, POINTER(c_uint8 * self.len)).contents))
+
     def get_decoded_contents(self) -> str:
         """
         Return the contents of the slice as str.
@@ -338,12 +622,70 @@ LoggerCallbackC = CFUNCTYPE(c_void_p, c_size_t, c_uint8, ZigSlicePointer)
 LoggerCallback: TypeAlias = FuncPtr
 
 
-def ffi_logger_callback_wrapper(logger: Logger) -> LoggerCallback:
+# libscrapli log level -> std logger level, libscrapli "trace" (0) has no std logger equivalent
+# so it's logged at debug (with a "TRACE: " prefix)
+_FFI_LOGGER_LEVELS = {
+    0: DEBUG,
+    1: DEBUG,
+    2: INFO,
+    3: WARNING,
+    4: CRITICAL,
+    5: FATAL,
+}
+
+
+class FFILogRecord(LogRecord):
+    """
+    FFILogRecord is a LogRecord whose (raw bytes) message is only decoded when it is formatted.
+
+    Records are created by the ffi logger callback in queue mode (see ffi_logger_callback_wrapper)
+    so that decoding/formatting happens in whatever consumes the queue, typically a
+    `logging.handlers.QueueListener` thread, rather than in the libscrapli callback.
+
+    Args:
+        N/A
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    def getMessage(self) -> str:  # noqa: N802
+        """
+        Return the (decoded) message for this record.
+
+        Args:
+            N/A
+
+        Returns:
+            str: the decoded message
+
+        Raises:
+            N/A
+
+        """
+        if isinstance(self.msg, bytes):
+            self.msg = self.msg.decode(errors="backslashreplace")
+
+        return super().getMessage()
+
+
+def ffi_logger_callback_wrapper(
+    logger: Logger, queue: "Queue[LogRecord] | None" = None
+) -> LoggerCallback:
     """
     Closure that accepts logger instance and returns a ffi logger callback
 
+    Messages are dropped before being decoded if the logger is not enabled for the level. If a
+    queue is given, the callback only copies the raw message into an FFILogRecord and enqueues it,
+    pair the queue with a `logging.handlers.QueueListener` to handle (format/emit) the records.
+
     Args:
         logger: the logger to wrap for use in the zig bits
+        queue: optional queue to enqueue (not yet decoded) log records to rather than logging
 
     Returns:
         LogerCallback: the logger callback
@@ -353,29 +695,40 @@ def ffi_logger_callback_wrapper(logger: Logger) -> LoggerCallback:
 
     """
 
-    def _cb(_: c_size_t, level: c_uint8, message: ZigSlicePointer) -> None:
+    def _cb(_: c_size_t, level: int, message: ZigSlicePointer) -> None:
+        # note: ctypes hands simple (c_uint8) callback args over as plain ints
+        py_level = _FFI_LOGGER_LEVELS.get(level)
+        if py_level is None or not logger.isEnabledFor(py_level):
+            return
+
         v = message.contents
         if v is None:
             return
 
+        if queue is not None:
+            raw = v.get_contents()
+
+            queue.put_nowait(
+                FFILogRecord(
+                    name=logger.name,
+                    level=py_level,
+                    pathname="libscrapli",
+                    lineno=0,
+                    msg=b"TRACE: " + raw if level == 0 else raw,
+                    args=None,
+                    exc_info=None,
+                )
+            )
+
+            return
+
         m = v.get_decoded_contents()
 
-        match level:
-            case 0:
-                # no "trace" level in std logger, so just format to be clear which ones are trace
-                logger.debug("TRACE: %s", m)
-            case 1:
-                logger.debug(m)
-            case 2:
-                logger.info(m)
-            case 3:
-                logger.warning(m)
-            case 4:
-                logger.critical(m)
-            case 5:
-                logger.fatal(m)
-            case _:
-                return
+        if level == 0:
+            # no "trace" level in std logger, so just format to be clear which ones are trace
+            logger.debug("TRACE: %s", m)
+        else:
+            logger.log(py_level, m)
 
     return LoggerCallbackC(_cb)
 
@@ -461,6 +814,11 @@ def capabilities_callback_wrapper(
         N/A
 
     """
+    # deferred, only netconf capabilities handling needs xml
+    import xml.etree.ElementTree as ET  # noqa: PLC0415
+
+    # the returned slice must outlive the callback, it is read by libscrapli once we return
+    returned: list[ZigSlice] = []
 
     def _cb(_: c_size_t, buf: ZigSlicePointer) -> int:
         v = buf.contents
@@ -485,8 +843,8 @@ def capabilities_callback_wrapper(
 
         out_bytes = "".join(out_elems).encode()
 
-        slice = ZigSlice(size=c_size_t(len(out_bytes)))
-        slice.ptr = cast((c_uint8 * len(out_bytes))(*out_bytes), POINTER(c_uint8))
+        slice = ZigSlice(content=out_bytes)
+        returned[:] = [slice]
 
         # ctypes expects an int that it will wrap in c_void_p for us (because of the typing above
         # so... we'll just always return an int, it should really never not succeed?)
@@ -1,19 +1,22 @@
 """scrapli.helper"""
 
-from asyncio import CancelledError
+from asyncio import CancelledError, Future
 from asyncio import TimeoutError as AsyncioTimeoutError
 from asyncio import get_event_loop, wait_for
 from datetime import datetime
 from os import read
 from pathlib import Path
+from re import compile as re_compile
 from select import select
 
 from scrapli.exceptions import CancelledException, OperationException
-from scrapli.ffi_types import Cancel, OperationIdPointer
+from scrapli.ffi_types import Cancel, CancelScope, OperationIdPointer
 
 WAKEUP_FD_SIGNAL_SIZE = 4
 WAKEUP_FD_POLL_INTERVAL_S = 0.1
 
+QUANTIFIER_PATTERN = re_compile(r"[*+?]|\{\d+(?:,\d*)?\}|\{,\d+\}")
+
 
 def resolve_file(file: str) -> str:
     """
@@ -84,13 +87,16 @@ def wait_for_available_operation_result(
             requested id -- this should never happen
 
     """
+    fds = [fd, *cancel._wakeup_fds()]
+
     while True:
         if cancel.cancelled:
             raise CancelledException
 
-        readable, _, _ = select([fd], [], [], WAKEUP_FD_POLL_INTERVAL_S)
+        readable, _, _ = select(fds, [], [], cancel._wait_timeout_s(WAKEUP_FD_POLL_INTERVAL_S))
 
-        if not readable:
+        if fd not in readable:
+            # timed out polling or woken by a cancel scope, either way re-check cancellation
             continue
 
         wait_wakeup_operation_id = _read_wakeup_signal_operation_id(fd)
@@ -104,15 +110,16 @@ def wait_for_available_operation_result(
             )
 
 
-async def _wait_for_fd_readable(fd: int) -> None:
+async def _wait_for_fd_readable(fd: int, scope: CancelScope | None = None) -> bool:
     """
-    Wait for fd to be readable.
+    Wait for fd to be readable or the cancel scope, if any, to be cancelled.
 
     Args:
         fd: the fd to wait on
+        scope: the cancel scope to wake up on
 
     Returns:
-        None
+        bool: True if the fd is readable, False if woken by the cancel scope
 
     Raises:
         N/A
@@ -120,19 +127,31 @@ async def _wait_for_fd_readable(fd: int) -> None:
     """
     loop = get_event_loop()
 
-    fut = loop.create_future()
+    fut: Future[bool] = loop.create_future()
 
-    def on_ready() -> None:
+    def on_ready(readable: bool) -> None:
         if not fut.done():
-            fut.set_result(None)
+            fut.set_result(readable)
 
-    loop.add_reader(fd, on_ready)
+    def on_cancel() -> None:
+        # a scope may be cancelled from any thread
+        loop.call_soon_threadsafe(on_ready, False)
+
+    loop.add_reader(fd, on_ready, True)
+
+    # the scope wakes waiters via callback rather than its fd, an event loop only allows one
+    # reader per fd and a scope is shared by any number of operations
+    if scope is not None:
+        scope._add_waiter(on_cancel)
 
     try:
-        await fut
+        return await fut
     finally:
         loop.remove_reader(fd)
 
+        if scope is not None:
+            scope._remove_waiter(on_cancel)
+
 
 async def wait_for_available_operation_result_async(
     fd: int,
@@ -156,12 +175,17 @@ async def wait_for_available_operation_result_async(
             requested id -- this should never happen
 
     """
+    scope = cancel._wakeup_scope()
+
     while True:
         if cancel.cancelled:
             raise CancelledException
 
         try:
-            await wait_for(_wait_for_fd_readable(fd), timeout=WAKEUP_FD_POLL_INTERVAL_S)
+            readable = await wait_for(
+                _wait_for_fd_readable(fd, scope=scope),
+                timeout=cancel._wait_timeout_s(WAKEUP_FD_POLL_INTERVAL_S),
+            )
         except AsyncioTimeoutError:
             continue
         except CancelledError:
@@ -171,6 +195,10 @@ async def wait_for_available_operation_result_async(
 
             raise
 
+        if not readable:
+            # woken by the cancel scope, re-check cancellation
+            continue
+
         wait_wakeup_operation_id = _read_wakeup_signal_operation_id(fd)
 
         if wait_wakeup_operation_id == operation_id_ptr.contents.value:
@@ -252,3 +280,93 @@ def bulid_result_preview(result: str) -> str:
         return f"{preview_line}\n\t                 : ... <truncated>"
 
     return preview_line
+
+
+def _class_end(pattern: str, start: int) -> int:
+    """
+    Find the end of the character class starting at the given index of a pattern.
+
+    Args:
+        pattern: the pattern
+        start: the index of the "[" opening the class
+
+    Returns:
+        int: the index just past the "]" closing the class
+
+    Raises:
+        N/A
+
+    """
+    idx = start + 1
+
+    if pattern.startswith("^", idx):
+        idx += 1
+
+    # a "]" first in the class is a literal "]"
+    if pattern.startswith("]", idx):
+        idx += 1
+
+    while idx < len(pattern) and pattern[idx] != "]":
+        idx += 2 if pattern[idx] == "\\" else 1
+
+    return idx + 1
+
+
+def without_possessive_quantifiers(pattern: str) -> str:
+    """
+    Rewrite possessive quantifiers and atomic groups to their greedy/plain equivalents.
+
+    Python (before 3.11) does not support either. The rewritten pattern finds the same prompts in
+    practice, but may backtrack where libscrapli would not.
+
+    Args:
+        pattern: the pattern
+
+    Returns:
+        str: the rewritten pattern
+
+    Raises:
+        N/A
+
+    """
+    out = []
+    idx = 0
+    # if the last token was a quantifier, a "+" following it makes it possessive
+    quantified = False
+
+    while idx < len(pattern):
+        if pattern[idx] == "\\":
+            token = pattern[idx : idx + 2]
+        elif pattern[idx] == "[":
+            token = pattern[idx : _class_end(pattern=pattern, start=idx)]
+        elif pattern.startswith("(?>", idx):
+            out.append("(?:")
+            idx += len("(?>")
+            quantified = False
+
+            continue
+        elif pattern.startswith("(?", idx):
+            token = "(?"
+        elif quantified and pattern[idx] == "+":
+            # the possessive "+" is dropped, leaving the (greedy) quantifier
+            idx += 1
+            quantified = False
+
+            continue
+        elif quantified and pattern[idx] == "?":
+            token = "?"
+        else:
+            match = QUANTIFIER_PATTERN.match(pattern, idx)
+            token = match.group() if match is not None else pattern[idx]
+
+            out.append(token)
+            idx += len(token)
+            quantified = match is not None
+
+            continue
+
+        out.append(token)
+        idx += len(token)
+        quantified = False
+
+    return "".join(out)
@@ -0,0 +1,466 @@
+"""scrapli.instrumentation"""
+
+from asyncio import CancelledError
+from asyncio import TimeoutError as AsyncioTimeoutError
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import update_wrapper
+from time import perf_counter_ns, time_ns
+from typing import Any, Concatenate, ParamSpec, Protocol, TypeVar
+
+from scrapli.exceptions import (
+    CancelledException,
+    FFIException,
+    OperationException,
+    TimeoutException,
+)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+@dataclass
+class OperationTimings:
+    """
+    OperationTimings holds the phase timings of a single (completed or failed) operation.
+
+    The phases are sequential, so they can be turned into child spans of an operation span
+    starting at `start_time`. `wait_ns` is the time spent waiting on libscrapli to complete the
+    operation (so mostly the device), the other phases are python side ffi/marshalling.
+
+    Args:
+        operation: name of the operation, i.e. "send_input"
+        host: host of the driver
+        port: port of the driver
+        operation_id: libscrapli operation id
+        start_time: unix ns at which the operation started
+        platform: platform of the driver, i.e. "cisco_iosxe" or "netconf"
+        submit_ns: ns spent before waiting on the result, i.e. submitting the operation
+        wait_ns: ns spent waiting on libscrapli to complete the operation (the wakeup read)
+        fetch_sizes_ns: ns spent fetching the result sizes
+        fetch_ns: ns spent fetching the result
+        decode_ns: ns spent copying/decoding the result out of ffi buffers
+        result_ns: ns spent constructing the Result object
+        failed: True if the operation returned an (ffi/operation) error
+        error: kind of the error if failed -- "timeout", "cancelled", "operation" or the name of
+            the exception type raised
+        bytes_written: bytes of input sent to the device
+        bytes_read: bytes of output fetched for the operation -- the raw journal (and for cli
+            operations the processed results as well)
+        failed_indicator: True if the output matched any of the failed when contains strings/the
+            rpc reply held rpc-errors
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    operation: str
+    host: str
+    port: int
+    operation_id: int
+    start_time: int
+    platform: str = ""
+    submit_ns: int = 0
+    wait_ns: int = 0
+    fetch_sizes_ns: int = 0
+    fetch_ns: int = 0
+    decode_ns: int = 0
+    result_ns: int = 0
+    failed: bool = False
+    error: str = ""
+    bytes_written: int = 0
+    bytes_read: int = 0
+    failed_indicator: bool = False
+
+    @property
+    def total_ns(self) -> int:
+        """
+        Returns the total ns of all phases.
+
+        Args:
+            N/A
+
+        Returns:
+            int: the total ns
+
+        Raises:
+            N/A
+
+        """
+        return (
+            self.submit_ns
+            + self.wait_ns
+            + self.fetch_sizes_ns
+            + self.fetch_ns
+            + self.decode_ns
+            + self.result_ns
+        )
+
+
+OperationTimingsCallback = Callable[[OperationTimings], None]
+
+_operation_timings_callback: ContextVar[OperationTimingsCallback | None] = ContextVar(
+    "scrapli_operation_timings_callback", default=None
+)
+
+
+@contextmanager
+def operation_timings(callback: OperationTimingsCallback) -> Iterator[None]:
+    """
+    Report the timings of every operation of every driver in this context to the callback.
+
+    Being a context var this is scoped to the current thread/asyncio task (and any tasks created
+    from it), a callback set on a driver takes precedence.
+
+    Args:
+        callback: the callback to report timings to
+
+    Returns:
+        Iterator[None]: the context
+
+    Raises:
+        N/A
+
+    """
+    token = _operation_timings_callback.set(callback)
+
+    try:
+        yield
+    finally:
+        _operation_timings_callback.reset(token)
+
+
+class _Instrumented(Protocol):
+    host: str
+    port: int
+    _platform_name: str
+    operation_timings_callback: OperationTimingsCallback | None
+
+
+@dataclass
+class _Operation:
+    name: str
+    host: str
+    port: int
+    platform: str
+    callback: OperationTimingsCallback
+    start_time: int
+    started_at: int
+    submitted: bool = False
+    timer: "OperationTimer | None" = None
+    failure_reported: bool = False
+
+
+_current_operation: ContextVar[_Operation | None] = ContextVar(
+    "scrapli_current_operation", default=None
+)
+
+
+def _start_operation(inst: _Instrumented, name: str) -> _Operation | None:
+    callback = inst.operation_timings_callback or _operation_timings_callback.get()
+    if callback is None:
+        return None
+
+    return _Operation(
+        name=name,
+        host=inst.host,
+        port=inst.port,
+        platform=inst._platform_name,
+        callback=callback,
+        start_time=time_ns(),
+        started_at=perf_counter_ns(),
+    )
+
+
+def _classify_error(exc: BaseException) -> str:
+    # timeouts/cancellations surfaced by libscrapli are wrapped in an FFIException
+    if isinstance(exc, FFIException) and exc.args and isinstance(exc.args[0], BaseException):
+        exc = exc.args[0]
+
+    if isinstance(exc, TimeoutException | TimeoutError | AsyncioTimeoutError):
+        return "timeout"
+
+    if isinstance(exc, CancelledException | CancelledError):
+        return "cancelled"
+
+    if isinstance(exc, OperationException):
+        return "operation"
+
+    return type(exc).__name__
+
+
+def _report_failure(operation: _Operation, exc: BaseException) -> None:
+    timer = operation.timer
+
+    if timer is None or timer.finished:
+        if operation.failure_reported:
+            # the result already reported the failure before raising
+            return
+
+        # failed before (or after) fetching a result, i.e. timed out waiting on it
+        timer = OperationTimer(operation=operation)
+
+    timer.finish(failed=True, error=_classify_error(exc))
+
+
+def instrument_operation(
+    wrapped: Callable[Concatenate[Any, P], R],
+) -> Callable[Concatenate[Any, P], R]:
+    """
+    Wraps a driver operation to record its name/start/failure when instrumentation is enabled.
+
+    Args:
+        wrapped: the operation function
+
+    Returns:
+        callable: the wrapper function
+
+    Raises:
+        N/A
+
+    """
+    name = wrapped.__name__
+
+    def wrapper(inst: _Instrumented, /, *args: P.args, **kwargs: P.kwargs) -> R:
+        operation = _start_operation(inst=inst, name=name)
+        if operation is None:
+            return wrapped(inst, *args, **kwargs)
+
+        token = _current_operation.set(operation)
+
+        try:
+            return wrapped(inst, *args, **kwargs)
+        except BaseException as exc:
+            _report_failure(operation=operation, exc=exc)
+
+            raise
+        finally:
+            _current_operation.reset(token)
+
+    update_wrapper(wrapper=wrapper, wrapped=wrapped)
+
+    return wrapper
+
+
+def instrument_operation_async(
+    wrapped: Callable[Concatenate[Any, P], Awaitable[R]],
+) -> Callable[Concatenate[Any, P], Awaitable[R]]:
+    """
+    Wraps a driver operation to record its name/start/failure when instrumentation is enabled.
+
+    Args:
+        wrapped: the operation function
+
+    Returns:
+        callable: the wrapper function
+
+    Raises:
+        N/A
+
+    """
+    name = wrapped.__name__
+
+    async def wrapper(inst: _Instrumented, /, *args: P.args, **kwargs: P.kwargs) -> R:
+        operation = _start_operation(inst=inst, name=name)
+        if operation is None:
+            return await wrapped(inst, *args, **kwargs)
+
+        token = _current_operation.set(operation)
+
+        try:
+            return await wrapped(inst, *args, **kwargs)
+        except BaseException as exc:
+            _report_failure(operation=operation, exc=exc)
+
+            raise
+        finally:
+            _current_operation.reset(token)
+
+    update_wrapper(wrapper=wrapper, wrapped=wrapped)
+
+    return wrapper
+
+
+class OperationTimer:
+    """
+    OperationTimer records the phases of fetching an operation result.
+
+    Should not be used directly/by users, see `start_operation_timer`.
+
+    Args:
+        operation: the operation being timed
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    __slots__ = ("_last", "_operation", "finished", "timings")
+
+    def __init__(self, operation: _Operation) -> None:
+        self._operation = operation
+        self._last = perf_counter_ns()
+
+        self.finished = False
+        self.timings = OperationTimings(
+            operation=operation.name,
+            host=operation.host,
+            port=operation.port,
+            operation_id=0,
+            start_time=operation.start_time,
+            platform=operation.platform,
+        )
+
+        # a pipeline (many results for one operation) only has a single submit phase
+        if not operation.submitted:
+            operation.submitted = True
+            self.timings.submit_ns = self._last - operation.started_at
+
+    def _lap(self) -> int:
+        now = perf_counter_ns()
+        elapsed = now - self._last
+        self._last = now
+
+        return elapsed
+
+    def waited(self, operation_id: int) -> None:
+        """
+        Mark the end of waiting on libscrapli to complete the operation.
+
+        Args:
+            operation_id: the libscrapli operation id
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.timings.wait_ns = self._lap()
+        self.timings.operation_id = operation_id
+
+    def fetched_sizes(self) -> None:
+        """
+        Mark the end of fetching the result sizes.
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.timings.fetch_sizes_ns = self._lap()
+
+    def fetched(self) -> None:
+        """
+        Mark the end of fetching the result.
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.timings.fetch_ns = self._lap()
+
+    def decoded(self) -> None:
+        """
+        Mark the end of copying/decoding the result out of the ffi buffers.
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.timings.decode_ns = self._lap()
+
+    def finish(
+        self,
+        *,
+        failed: bool = False,
+        error: str = "operation",
+        bytes_written: int = 0,
+        bytes_read: int = 0,
+        failed_indicator: bool = False,
+    ) -> None:
+        """
+        Mark the end of the Result construction (or the failure) and report the timings.
+
+        Args:
+            failed: True if the operation returned an error
+            error: kind of the error if failed
+            bytes_written: bytes of input sent to the device
+            bytes_read: bytes of output fetched for the operation
+            failed_indicator: True if the result matched a failed indicator
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        if self.finished:
+            return
+
+        self.finished = True
+
+        if failed:
+            self.timings.decode_ns = self._lap()
+            self.timings.failed = True
+            self.timings.error = error
+            self._operation.failure_reported = True
+        else:
+            self.timings.result_ns = self._lap()
+
+        self.timings.bytes_written = bytes_written
+        self.timings.bytes_read = bytes_read
+        self.timings.failed_indicator = failed_indicator
+
+        self._operation.callback(self.timings)
+
+
+def start_operation_timer() -> OperationTimer | None:
+    """
+    Start timing the result phases of the current operation, if instrumentation is enabled.
+
+    Args:
+        N/A
+
+    Returns:
+        OperationTimer | None: the timer or None if instrumentation is not enabled
+
+    Raises:
+        N/A
+
+    """
+    operation = _current_operation.get()
+    if operation is None:
+        return None
+
+    operation.timer = OperationTimer(operation=operation)
+
+    return operation.timer
@@ -0,0 +1,369 @@
+"""scrapli.metrics"""
+
+from bisect import bisect_left
+from collections.abc import Sequence
+from threading import Lock, local
+from typing import Any
+
+from scrapli.instrumentation import OperationTimings
+
+DEFAULT_LATENCY_BUCKETS_S = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+_HOST_LABELS = ("host", "platform")
+_OPERATION_LABELS = (*_HOST_LABELS, "operation")
+
+# name -> (help, label names)
+_COUNTERS: dict[str, tuple[str, tuple[str, ...]]] = {
+    "scrapli_operations_total": ("Operations executed, by kind.", _OPERATION_LABELS),
+    "scrapli_operation_errors_total": (
+        "Operations that failed, by kind and error.",
+        (*_OPERATION_LABELS, "error"),
+    ),
+    "scrapli_operation_timeouts_total": ("Operations that timed out.", _OPERATION_LABELS),
+    "scrapli_operation_cancellations_total": (
+        "Operations that were cancelled.",
+        _OPERATION_LABELS,
+    ),
+    "scrapli_failed_indicator_total": (
+        "Operations whose output matched a failed indicator (or held rpc-errors).",
+        _OPERATION_LABELS,
+    ),
+    "scrapli_bytes_read_total": ("Bytes of output fetched from devices.", _HOST_LABELS),
+    "scrapli_bytes_written_total": ("Bytes of input written to devices.", _HOST_LABELS),
+}
+
+_HISTOGRAMS: dict[str, tuple[str, tuple[str, ...]]] = {
+    "scrapli_operation_duration_seconds": ("Duration of operations.", _OPERATION_LABELS),
+    "scrapli_open_duration_seconds": ("Duration of opening connections.", _HOST_LABELS),
+    "scrapli_close_duration_seconds": ("Duration of closing connections.", _HOST_LABELS),
+}
+
+_MetricKey = tuple[str, tuple[str, ...]]
+
+
+class _Shard:
+    """
+    _Shard holds the metric values recorded by a single thread.
+
+    Only the owning thread ever writes to a shard, so recording does not need any locking.
+
+    Args:
+        bucket_count: count of histogram buckets (including +Inf)
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    __slots__ = ("bucket_count", "counters", "histogram_counts", "histogram_sums")
+
+    def __init__(self, bucket_count: int) -> None:
+        self.bucket_count = bucket_count
+        self.counters: dict[_MetricKey, int] = {}
+        self.histogram_counts: dict[_MetricKey, list[int]] = {}
+        self.histogram_sums: dict[_MetricKey, float] = {}
+
+    def clear(self) -> None:
+        self.counters.clear()
+        self.histogram_counts.clear()
+        self.histogram_sums.clear()
+
+    def inc(self, key: _MetricKey, value: int = 1) -> None:
+        self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, key: _MetricKey, bucket: int, value: float) -> None:
+        counts = self.histogram_counts.get(key)
+        if counts is None:
+            counts = self.histogram_counts[key] = [0] * self.bucket_count
+
+        counts[bucket] += 1
+        self.histogram_sums[key] = self.histogram_sums.get(key, 0.0) + value
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    return ",".join(
+        f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values, strict=True)
+    )
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(float(bound))
+
+
+class MetricsRegistry:
+    """
+    MetricsRegistry aggregates operation counters and latency histograms per host and platform.
+
+    The registry is an operation timings callback, so it is enabled like any other timings
+    callback -- by passing it as a driver's `operation_timings_callback` or via
+    `scrapli.instrumentation.operation_timings` for every driver in a context:
+
+        registry = MetricsRegistry()
+
+        with operation_timings(registry):
+            ...
+
+        print(registry.to_prometheus())
+
+    Recording is done into a per thread shard, so the hot path never contends on a lock, shards
+    are merged when reading the registry via `snapshot` or `to_prometheus`.
+
+    Args:
+        latency_buckets_s: upper bounds (in seconds) of the latency histogram buckets
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    def __init__(self, *, latency_buckets_s: Sequence[float] = DEFAULT_LATENCY_BUCKETS_S) -> None:
+        self.latency_buckets_s = tuple(sorted(latency_buckets_s))
+
+        self._lock = Lock()
+        self._local = local()
+        self._shards: list[_Shard] = []
+
+    def __repr__(self) -> str:
+        """
+        Magic repr method for MetricsRegistry object
+
+        Args:
+            N/A
+
+        Returns:
+            str: repr for MetricsRegistry object
+
+        Raises:
+            N/A
+
+        """
+        return f"{self.__class__.__name__}(latency_buckets_s={self.latency_buckets_s!r})"
+
+    def __call__(self, timings: OperationTimings) -> None:
+        """
+        Record the timings of an operation, the operation timings callback entrypoint.
+
+        Args:
+            timings: the operation timings
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        shard = self._shard()
+
+        # sync and async flavors of an operation are the same kind of operation
+        operation = timings.operation.removesuffix("_async")
+        host_labels = (timings.host, timings.platform)
+        operation_labels = (*host_labels, operation)
+
+        shard.inc(("scrapli_operations_total", operation_labels))
+
+        if timings.failed:
+            shard.inc(("scrapli_operation_errors_total", (*operation_labels, timings.error)))
+
+            if timings.error == "timeout":
+                shard.inc(("scrapli_operation_timeouts_total", operation_labels))
+            elif timings.error == "cancelled":
+                shard.inc(("scrapli_operation_cancellations_total", operation_labels))
+
+        if timings.failed_indicator:
+            shard.inc(("scrapli_failed_indicator_total", operation_labels))
+
+        if timings.bytes_read:
+            shard.inc(("scrapli_bytes_read_total", host_labels), timings.bytes_read)
+
+        if timings.bytes_written:
+            shard.inc(("scrapli_bytes_written_total", host_labels), timings.bytes_written)
+
+        duration_s = timings.total_ns / 1_000_000_000
+        bucket = bisect_left(self.latency_buckets_s, duration_s)
+
+        shard.observe(("scrapli_operation_duration_seconds", operation_labels), bucket, duration_s)
+
+        if operation in ("open", "close"):
+            shard.observe(
+                (f"scrapli_{operation}_duration_seconds", host_labels), bucket, duration_s
+            )
+
+    def _shard(self) -> _Shard:
+        shard: _Shard | None = getattr(self._local, "shard", None)
+
+        if shard is None:
+            shard = _Shard(bucket_count=len(self.latency_buckets_s) + 1)
+
+            with self._lock:
+                self._shards.append(shard)
+
+            self._local.shard = shard
+
+        return shard
+
+    def _merged(
+        self,
+    ) -> tuple[dict[_MetricKey, int], dict[_MetricKey, list[int]], dict[_MetricKey, float]]:
+        with self._lock:
+            shards = list(self._shards)
+
+        counters: dict[_MetricKey, int] = {}
+        histogram_counts: dict[_MetricKey, list[int]] = {}
+        histogram_sums: dict[_MetricKey, float] = {}
+
+        for shard in shards:
+            # copying is atomic, the owning thread may keep recording while we merge
+            for key, value in shard.counters.copy().items():
+                counters[key] = counters.get(key, 0) + value
+
+            for key, counts in shard.histogram_counts.copy().items():
+                merged = histogram_counts.setdefault(key, [0] * shard.bucket_count)
+
+                for idx, count in enumerate(counts.copy()):
+                    merged[idx] += count
+
+            for key, total in shard.histogram_sums.copy().items():
+                histogram_sums[key] = histogram_sums.get(key, 0.0) + total
+
+        return counters, histogram_counts, histogram_sums
+
+    def reset(self) -> None:
+        """
+        Drop all recorded values.
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        with self._lock:
+            # cleared in place, threads keep recording into the shard they already hold
+            for shard in self._shards:
+                shard.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Returns the current values of all metrics.
+
+        Counters map to a list of {"labels": ..., "value": ...} samples, histograms to a list of
+        {"labels": ..., "buckets": ..., "count": ..., "sum": ...} samples where buckets maps the
+        (cumulative, prometheus style) bucket upper bound to its count.
+
+        Args:
+            N/A
+
+        Returns:
+            dict[str, Any]: the metric values keyed by metric name
+
+        Raises:
+            N/A
+
+        """
+        counters, histogram_counts, histogram_sums = self._merged()
+        bounds = [*(_format_bound(b) for b in self.latency_buckets_s), "+Inf"]
+
+        snapshot: dict[str, Any] = {}
+
+        for name, (_, label_names) in _COUNTERS.items():
+            snapshot[name] = [
+                {"labels": dict(zip(label_names, labels, strict=True)), "value": value}
+                for (metric, labels), value in sorted(counters.items())
+                if metric == name
+            ]
+
+        for name, (_, label_names) in _HISTOGRAMS.items():
+            samples = []
+
+            for (metric, labels), counts in sorted(histogram_counts.items()):
+                if metric != name:
+                    continue
+
+                cumulative = 0
+                buckets = {}
+
+                for bound, count in zip(bounds, counts, strict=True):
+                    cumulative += count
+                    buckets[bound] = cumulative
+
+                samples.append(
+                    {
+                        "labels": dict(zip(label_names, labels, strict=True)),
+                        "buckets": buckets,
+                        "count": cumulative,
+                        "sum": histogram_sums.get((metric, labels), 0.0),
+                    }
+                )
+
+            snapshot[name] = samples
+
+        return snapshot
+
+    def to_prometheus(self) -> str:
+        """
+        Returns all metrics in the prometheus text exposition format.
+
+        Args:
+            N/A
+
+        Returns:
+            str: the metrics exposition
+
+        Raises:
+            N/A
+
+        """
+        snapshot = self.snapshot()
+        lines = []
+
+        for name, (help_, label_names) in _COUNTERS.items():
+            lines.append(f"# HELP {name} {help_}")
+            lines.append(f"# TYPE {name} counter")
+
+            for sample in snapshot[name]:
+                labels = _format_labels(label_names, list(sample["labels"].values()))
+                lines.append(f"{name}{{{labels}}} {sample['value']}")
+
+        for name, (help_, label_names) in _HISTOGRAMS.items():
+            lines.append(f"# HELP {name} {help_}")
+            lines.append(f"# TYPE {name} histogram")
+
+            for sample in snapshot[name]:
+                labels = _format_labels(label_names, list(sample["labels"].values()))
+
+                for bound, count in sample["buckets"].items():
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+
+                lines.append(f"{name}_sum{{{labels}}} {sample['sum']!r}")
+                lines.append(f"{name}_count{{{labels}}} {sample['count']}")
+
+        return "\n".join(lines) + "\n"
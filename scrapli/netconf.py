@@ -1,6 +1,7 @@
 """scrapli.netconf"""
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
 from ctypes import (
     POINTER,
     c_bool,
@@ -16,8 +17,11 @@ from ctypes import (
 )
 from dataclasses import dataclass, field
 from enum import Enum
-from logging import getLogger
+from logging import LogRecord, getLogger
+from queue import Queue
+from time import monotonic_ns, time_ns
 from types import TracebackType
+from typing import Any
 
 from scrapli.auth import Options as AuthOptions
 from scrapli.exceptions import (
@@ -31,6 +35,7 @@ from scrapli.ffi_mapping import LibScrapliMapping
 from scrapli.ffi_options import DriverOptions, DriverOptionsPointer
 from scrapli.ffi_types import (
     Cancel,
+    CancelScope,
     DriverPointer,
     IntPointer,
     NetconfCapabilitesCallback,
@@ -48,8 +53,12 @@ from scrapli.helper import (
     wait_for_available_operation_result,
     wait_for_available_operation_result_async,
 )
+from scrapli.instrumentation import OperationTimingsCallback, start_operation_timer
+from scrapli.netconf_capabilities import Capabilities
 from scrapli.netconf_decorators import handle_operation_timeout, handle_operation_timeout_async
-from scrapli.netconf_result import Result
+from scrapli.netconf_result import Result, TransactionResult, TransactionStep
+from scrapli.netconf_schema_cache import SchemaCache
+from scrapli.session import DEFAULT_OPERATION_TIMEOUT_NS
 from scrapli.session import Options as SessionOptions
 from scrapli.transport import BinOptions as TransportBinOptions
 from scrapli.transport import Options as TransportOptions
@@ -369,9 +378,6 @@ class Options:
 
     _error_tag: c_char_p | None = field(init=False, default=None, repr=False)
     _preferred_version: c_char_p | None = field(init=False, default=None, repr=False)
-    _capabilities_callback: NetconfCapabilitesCallback | None = field(
-        init=False, default=None, repr=False
-    )
 
     def apply(self, *, options: DriverOptionsPointer) -> None:
         """
@@ -406,11 +412,6 @@ class Options:
                 c_uint64(self.message_poll_interval_ns)
             )
 
-        if self.capabilities_callback is not None:
-            self._capabilities_callback = capabilities_callback_wrapper(self.capabilities_callback)
-
-            options.contents.netconf.capabilities_callback = self._capabilities_callback
-
     def __repr__(self) -> str:
         """
         Magic repr method for Options object
@@ -436,6 +437,136 @@ class Options:
         )
 
 
+@dataclass
+class PipelineGet:
+    """
+    PipelineGet describes a get rpc to send as part of a Netconf pipeline.
+
+    Args:
+        filter_: filter to apply to the get (or not if empty string)
+        filter_type: type of filter to apply, subtree|xpath
+        filter_namespace_prefix: filter namespace prefix
+        filter_namespace: filter namespace
+        defaults_type: defaults type to apply to the get, "unset" means dont apply one
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    filter_: str = ""
+    filter_type: FilterType = FilterType.SUBTREE
+    filter_namespace_prefix: str = ""
+    filter_namespace: str = ""
+    defaults_type: DefaultsType = DefaultsType.UNSET
+
+
+@dataclass
+class PipelineGetConfig:
+    """
+    PipelineGetConfig describes a get-config rpc to send as part of a Netconf pipeline.
+
+    Args:
+        source: source datastore to get config from
+        filter_: filter to apply to the get-config (or not if empty string)
+        filter_type: type of filter to apply, subtree|xpath
+        filter_namespace_prefix: filter namespace prefix
+        filter_namespace: filter namespace
+        defaults_type: defaults type to apply to the get-config, "unset" means dont apply one
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    source: DatastoreType = DatastoreType.RUNNING
+    filter_: str = ""
+    filter_type: FilterType = FilterType.SUBTREE
+    filter_namespace_prefix: str = ""
+    filter_namespace: str = ""
+    defaults_type: DefaultsType = DefaultsType.UNSET
+
+
+@dataclass
+class PipelineRawRpc:
+    """
+    PipelineRawRpc describes a "raw" / user crafted rpc to send as part of a Netconf pipeline.
+
+    Args:
+        payload: the raw rpc payload
+        base_namespace_prefix: prefix to use for the base/default netconf base namespace
+        extra_namespaces: optional list of pairs of prefix::namespaces
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    payload: str
+    base_namespace_prefix: str = ""
+    extra_namespaces: list[tuple[str, str]] | None = None
+
+
+@dataclass
+class PipelineEditConfig:
+    """
+    PipelineEditConfig describes an edit-config rpc to send as part of a Netconf pipeline.
+
+    Args:
+        config: string config payload to send
+        target: target datastore as DatastoreType enum
+        default_operation: value (or none) for default operation field
+        test_option: the value (or none) for the test option field
+        error_option: the value (or none) for the error option field
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    config: str = ""
+    target: DatastoreType = DatastoreType.RUNNING
+    default_operation: DefaultOperation = DefaultOperation.UNSET
+    test_option: TestOption = TestOption.UNSET
+    error_option: ErrorOption = ErrorOption.UNSET
+
+
+@dataclass
+class PipelineValidate:
+    """
+    PipelineValidate describes a validate rpc to send as part of a Netconf pipeline.
+
+    Args:
+        source: datastore to validate
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    source: DatastoreType = DatastoreType.RUNNING
+
+
+PipelineRpc = (
+    PipelineGet | PipelineGetConfig | PipelineRawRpc | PipelineEditConfig | PipelineValidate
+)
+
+
 class Netconf:
     """
     Netconf represents a netconf connection object.
@@ -461,14 +592,20 @@ class Netconf:
         session_options: SessionOptions | None = None,
         transport_options: TransportOptions | None = None,
         logging_uid: str | None = None,
+        logging_queue: "Queue[LogRecord] | None" = None,
+        operation_timings_callback: OperationTimingsCallback | None = None,
     ) -> None:
         logger_name = f"{__name__}.{host}:{port}"
         if logging_uid is not None:
             logger_name += f":{logging_uid}"
 
         self.logger = getLogger(logger_name)
-        self.logger_callback = ffi_logger_callback_wrapper(logger=self.logger)
+        self.logger_callback = ffi_logger_callback_wrapper(logger=self.logger, queue=logging_queue)
         self._logging_uid = logging_uid
+        self._logging_queue = logging_queue
+
+        # opt-in per operation phase timings, see scrapli.instrumentation
+        self.operation_timings_callback = operation_timings_callback
 
         self.ffi_mapping = LibScrapliMapping()
 
@@ -477,15 +614,26 @@ class Netconf:
 
         self.port = port
 
+        # the "platform" label for instrumentation, mirrors the cli driver's platform name
+        self._platform_name = "netconf"
+
         self.options = options or Options()
         self.auth_options = auth_options or AuthOptions()
         self.session_options = session_options or SessionOptions()
         self.transport_options = transport_options or TransportBinOptions()
 
+        # the operation timeout currently applied in libscrapli, see handle_operation_timeout
+        self._operation_timeout_ns = (
+            self.session_options.operation_timeout_ns or DEFAULT_OPERATION_TIMEOUT_NS
+        )
+
         self.ptr: DriverPointer | None = None
         self.poll_fd: int = 0
 
         self._session_id: int | None = None
+        # capabilities advertised by the server in its hello, set by the capabilities callback
+        self._capabilities: Capabilities | None = None
+        self._ffi_capabilities_callback: NetconfCapabilitesCallback | None = None
 
     def __enter__(self: "Netconf") -> "Netconf":
         """
@@ -624,6 +772,8 @@ class Netconf:
             session_options=self.session_options,
             transport_options=self.transport_options,
             logging_uid=self._logging_uid,
+            logging_queue=self._logging_queue,
+            operation_timings_callback=self.operation_timings_callback,
         )
 
     def _ptr_or_exception(self) -> DriverPointer:
@@ -656,11 +806,35 @@ class Netconf:
 
         self.poll_fd = poll_fd
 
+        # alloc applied the session options, so the session operation timeout
+        self._operation_timeout_ns = (
+            self.session_options.operation_timeout_ns or DEFAULT_OPERATION_TIMEOUT_NS
+        )
+
     def _free(
         self,
     ) -> None:
         self.ffi_mapping.shared_mapping.free(ptr=self._ptr_or_exception())
 
+        self._operation_timeout_ns = (
+            self.session_options.operation_timeout_ns or DEFAULT_OPERATION_TIMEOUT_NS
+        )
+
+    def _capabilities_callback(self, capabilities: list[str]) -> list[str]:
+        self._capabilities = Capabilities.from_list([c.strip() for c in capabilities])
+
+        if self.options.capabilities_callback is None:
+            return capabilities
+
+        return self.options.capabilities_callback(capabilities)
+
+    def _apply_capabilities_callback(self, *, options: DriverOptionsPointer) -> None:
+        # always installed (wrapping any user callback) so the capabilities are indexed from the
+        # hello as it is received, held on the instance as libscrapli only holds a pointer to it
+        self._ffi_capabilities_callback = capabilities_callback_wrapper(self._capabilities_callback)
+
+        options.contents.netconf.capabilities_callback = self._ffi_capabilities_callback
+
     def _get_options(self) -> str:
         """
         Returns the options provided as a json string.
@@ -690,6 +864,8 @@ class Netconf:
         self.session_options.apply(options=options)
         self.transport_options.apply(options=options)
 
+        self._apply_capabilities_callback(options=options)
+
         options_size = pointer(c_size_t())
 
         self.ffi_mapping.shared_mapping.fetch_options_size(
@@ -728,6 +904,9 @@ class Netconf:
         self.session_options.apply(options=options)
         self.transport_options.apply(options=options)
 
+        self._capabilities = None
+        self._apply_capabilities_callback(options=options)
+
         try:
             self._alloc(options_ptr=options_ptr)
         finally:
@@ -911,6 +1090,8 @@ class Netconf:
         operation_id_ptr: OperationIdPointer,
         cancel: Cancel,
     ) -> Result:
+        timer = start_operation_timer()
+
         wait_for_available_operation_result(
             self.poll_fd,
             cancel=cancel,
@@ -919,6 +1100,9 @@ class Netconf:
 
         operation_id_value = c_uint32(operation_id_ptr.contents.value)
 
+        if timer is not None:
+            timer.waited(operation_id=operation_id_value.value)
+
         input_size = pointer(c_size_t())
         result_raw_size = pointer(c_size_t())
         result_size = pointer(c_size_t())
@@ -939,6 +1123,9 @@ class Netconf:
             last_err_str_size=last_err_str_size,
         )
 
+        if timer is not None:
+            timer.fetched_sizes()
+
         start_time = U64Pointer(c_uint64())
         end_time = U64Pointer(c_uint64())
 
@@ -965,30 +1152,57 @@ class Netconf:
             last_err_string=last_err_string,
         )
 
+        if timer is not None:
+            timer.fetched()
+
         err_contents = err_slice.contents.get_decoded_contents()
         if err_contents:
             if last_err_string:
                 err_contents += f": {last_err_string.contents.get_decoded_contents()}"
 
+            if timer is not None:
+                timer.finish(failed=True)
+
             raise OperationException(err_contents)
 
-        return Result(
-            input_=input_slice.contents.get_decoded_contents(),
+        input_ = input_slice.contents.get_decoded_contents()
+        result_raw_journal = result_raw_slice.contents.get_contents()
+        result_ = result_slice.contents.get_decoded_contents()
+        rpc_warnings = rpc_warnings_slice.contents.get_decoded_contents()
+        rpc_errors = rpc_errors_slice.contents.get_decoded_contents()
+
+        if timer is not None:
+            timer.decoded()
+
+        result = Result(
+            input_=input_,
             host=self.host,
             port=self.port,
             start_time=start_time.contents.value,
             end_time=end_time.contents.value,
-            result_raw_journal=result_raw_slice.contents.get_contents(),
-            _result=result_slice.contents.get_decoded_contents(),
-            rpc_warnings=rpc_warnings_slice.contents.get_decoded_contents(),
-            rpc_errors=rpc_errors_slice.contents.get_decoded_contents(),
-        )
+            result_raw_journal=result_raw_journal,
+            _result=result_,
+            rpc_warnings=rpc_warnings,
+            rpc_errors=rpc_errors,
+        )
+
+        if timer is not None:
+            timer.finish(
+                bytes_written=input_size.contents.value,
+                # the raw result alone leaves out the (processed) result fetched alongside it
+                bytes_read=result_size.contents.value + result_raw_size.contents.value,
+                failed_indicator=bool(rpc_errors),
+            )
+
+        return result
 
     async def _get_result_async(
         self,
         operation_id_ptr: OperationIdPointer,
         cancel: Cancel,
     ) -> Result:
+        timer = start_operation_timer()
+
         await wait_for_available_operation_result_async(
             self.poll_fd,
             cancel=cancel,
@@ -997,6 +1211,9 @@ class Netconf:
 
         operation_id_value = c_uint32(operation_id_ptr.contents.value)
 
+        if timer is not None:
+            timer.waited(operation_id=operation_id_value.value)
+
         input_size = pointer(c_size_t())
         result_raw_size = pointer(c_size_t())
         result_size = pointer(c_size_t())
@@ -1017,6 +1234,9 @@ class Netconf:
             last_err_str_size=last_err_str_size,
         )
 
+        if timer is not None:
+            timer.fetched_sizes()
+
         start_time = U64Pointer(c_uint64())
         end_time = U64Pointer(c_uint64())
 
@@ -1043,24 +1263,49 @@ class Netconf:
             last_err_string=last_err_string,
         )
 
+        if timer is not None:
+            timer.fetched()
+
         err_contents = err_slice.contents.get_decoded_contents()
         if err_contents:
             if last_err_string:
                 err_contents += f": {last_err_string.contents.get_decoded_contents()}"
 
+            if timer is not None:
+                timer.finish(failed=True)
+
             raise OperationException(err_contents)
 
-        return Result(
-            input_=input_slice.contents.get_decoded_contents(),
+        input_ = input_slice.contents.get_decoded_contents()
+        result_raw_journal = result_raw_slice.contents.get_contents()
+        result_ = result_slice.contents.get_decoded_contents()
+        rpc_warnings = rpc_warnings_slice.contents.get_decoded_contents()
+        rpc_errors = rpc_errors_slice.contents.get_decoded_contents()
+
+        if timer is not None:
+            timer.decoded()
+
+        result = Result(
+            input_=input_,
             host=self.host,
             port=self.port,
             start_time=start_time.contents.value,
             end_time=end_time.contents.value,
-            result_raw_journal=result_raw_slice.contents.get_contents(),
-            _result=result_slice.contents.get_decoded_contents(),
-            rpc_warnings=rpc_warnings_slice.contents.get_decoded_contents(),
-            rpc_errors=rpc_errors_slice.contents.get_decoded_contents(),
-        )
+            result_raw_journal=result_raw_journal,
+            _result=result_,
+            rpc_warnings=rpc_warnings,
+            rpc_errors=rpc_errors,
+        )
+
+        if timer is not None:
+            timer.finish(
+                bytes_written=input_size.contents.value,
+                # the raw result alone leaves out the (processed) result fetched alongside it
+                bytes_read=result_size.contents.value + result_raw_size.contents.value,
+                failed_indicator=bool(rpc_errors),
+            )
+
+        return result
 
     @property
     def session_id(self) -> int:
@@ -1193,6 +1438,60 @@ class Netconf:
 
         return subscription_slice.contents.get_decoded_contents()
 
+    @property
+    def capabilities(self) -> Capabilities | None:
+        """
+        Returns the (indexed) capabilities advertised by the server.
+
+        Parsed once per session (when opened) and shared between sessions advertising the exact
+        same capabilities, i.e. devices of the same model and version.
+
+        Args:
+            N/A
+
+        Returns:
+            Capabilities | None: the server capabilities or None if not (yet) known
+
+        Raises:
+            N/A
+
+        """
+        return self._capabilities
+
+    def _advertised_schema_revision(self, identifier: str) -> str | None:
+        """
+        Return the revision of the module advertised in the server capabilities, if any.
+
+        Args:
+            identifier: the module name
+
+        Returns:
+            str | None: the advertised revision or None if unknown
+
+        Raises:
+            N/A
+
+        """
+        if self._capabilities is None:
+            return None
+
+        return self._capabilities.revision(name=identifier)
+
+    def _cached_result(self, input_: str, result: str) -> Result:
+        now = time_ns()
+
+        return Result(
+            input_=input_,
+            host=self.host,
+            port=self.port,
+            start_time=now,
+            end_time=now,
+            result_raw_journal=b"",
+            _result=result,
+            rpc_warnings="",
+            rpc_errors="",
+        )
+
     @handle_operation_timeout
     def raw_rpc(
         self,
@@ -1323,6 +1622,566 @@ class Netconf:
 
         return await self._get_result_async(operation_id_ptr=operation_id_ptr, cancel=cancel)
 
+    def _submit_pipeline_rpc(
+        self, rpc: PipelineRpc, cancel: Cancel
+    ) -> tuple[OperationIdPointer, tuple[Any, ...]]:
+        """
+        Submit (but do not wait on) a single pipeline rpc.
+
+        Args:
+            rpc: the rpc to submit
+            cancel: cancellation context for the pipeline
+
+        Returns:
+            tuple[OperationIdPointer, tuple[Any, ...]]: the operation id pointer of the submitted
+                rpc and the ffi arguments that must be kept alive until its result is fetched
+
+        Raises:
+            NotOpenedException: if the ptr to the netconf object is None (via _ptr_or_exception)
+
+        """
+        operation_id_ptr = OperationIdPointer(c_uint32(0))
+
+        match rpc:
+            case PipelineGet():
+                _filter = to_c_string(rpc.filter_)
+                _filter_namespace_prefix = to_c_string(rpc.filter_namespace_prefix)
+                _filter_namespace = to_c_string(rpc.filter_namespace)
+
+                self.ffi_mapping.netconf_mapping.get(
+                    ptr=self._ptr_or_exception(),
+                    operation_id_ptr=operation_id_ptr,
+                    cancel=cancel._to_ffi(),
+                    filter_=_filter,
+                    filter_type=rpc.filter_type._to_ffi(),
+                    filter_namespace_prefix=_filter_namespace_prefix,
+                    filter_namespace=_filter_namespace,
+                    defaults_type=rpc.defaults_type._to_ffi(),
+                )
+
+                return operation_id_ptr, (_filter, _filter_namespace_prefix, _filter_namespace)
+            case PipelineGetConfig():
+                _filter = to_c_string(rpc.filter_)
+                _filter_namespace_prefix = to_c_string(rpc.filter_namespace_prefix)
+                _filter_namespace = to_c_string(rpc.filter_namespace)
+
+                self.ffi_mapping.netconf_mapping.get_config(
+                    ptr=self._ptr_or_exception(),
+                    operation_id_ptr=operation_id_ptr,
+                    cancel=cancel._to_ffi(),
+                    source=rpc.source._to_ffi(),
+                    filter_=_filter,
+                    filter_type=rpc.filter_type._to_ffi(),
+                    filter_namespace_prefix=_filter_namespace_prefix,
+                    filter_namespace=_filter_namespace,
+                    defaults_type=rpc.defaults_type._to_ffi(),
+                )
+
+                return operation_id_ptr, (_filter, _filter_namespace_prefix, _filter_namespace)
+            case PipelineRawRpc():
+                _payload = to_c_string(rpc.payload)
+                _base_namespace_prefix = to_c_string(rpc.base_namespace_prefix)
+
+                encoded_extra_namespaces = []
+
+                if rpc.extra_namespaces is not None:
+                    for prefix, namespace in rpc.extra_namespaces:
+                        encoded_extra_namespaces.append(prefix.encode(encoding="utf-8"))
+                        encoded_extra_namespaces.append(namespace.encode(encoding="utf-8"))
+
+                _extra_namespaces = pointer(ZigSlice(content=b"".join(encoded_extra_namespaces)))
+                _extra_namespace_lens = pointer(
+                    ZigU64Slice(vals=[len(e) for e in encoded_extra_namespaces])
+                )
+
+                self.ffi_mapping.netconf_mapping.raw_rpc(
+                    ptr=self._ptr_or_exception(),
+                    operation_id_ptr=operation_id_ptr,
+                    cancel=cancel._to_ffi(),
+                    payload=_payload,
+                    base_namespace_prefix=_base_namespace_prefix,
+                    extra_namespaces=_extra_namespaces,
+                    extra_namespace_lens=_extra_namespace_lens,
+                )
+
+                return operation_id_ptr, (
+                    _payload,
+                    _base_namespace_prefix,
+                    _extra_namespaces,
+                    _extra_namespace_lens,
+                )
+            case PipelineEditConfig():
+                _config = to_c_string(rpc.config)
+
+                self.ffi_mapping.netconf_mapping.edit_config(
+                    ptr=self._ptr_or_exception(),
+                    operation_id_ptr=operation_id_ptr,
+                    cancel=cancel._to_ffi(),
+                    config=_config,
+                    target=rpc.target._to_ffi(),
+                    default_operation=rpc.default_operation._to_ffi(),
+                    test_option=rpc.test_option._to_ffi(),
+                    error_option=rpc.error_option._to_ffi(),
+                )
+
+                return operation_id_ptr, (_config,)
+            case PipelineValidate():
+                self.ffi_mapping.netconf_mapping.validate(
+                    ptr=self._ptr_or_exception(),
+                    operation_id_ptr=operation_id_ptr,
+                    cancel=cancel._to_ffi(),
+                    source=rpc.source._to_ffi(),
+                )
+
+                return operation_id_ptr, ()
+            case _:
+                raise OperationException(f"unsupported pipeline rpc '{rpc!r}'")
+
+    @handle_operation_timeout
+    def pipeline(
+        self,
+        rpcs: list[PipelineRpc],
+        *,
+        operation_timeout_ns: int | None = None,
+        cancel: Cancel | None = None,
+    ) -> list[Result]:
+        """
+        Execute a batch of rpcs, submitting all of them before waiting on any.
+
+        Each rpc is still its own operation (with its own message-id), all rpcs are handed to
+        libscrapli up front and their results are then collected (correlated by operation id) in
+        submission order, rather than paying for a full submit/wait/fetch cycle per rpc.
+
+        Args:
+            rpcs: the rpcs to send
+            operation_timeout_ns: operation timeout in ns for each rpc of the pipeline
+            cancel: cancellation context for the whole pipeline
+
+        Returns:
+            list[Result]: a Result object for each rpc, in the same order as the given rpcs
+
+        Raises:
+            NotOpenedException: if the ptr to the netconf object is None (via _ptr_or_exception)
+            OperationException: if any of the rpcs fail, raised only after all results have been
+                collected, for the first failing rpc
+
+        """
+        if cancel is None:
+            cancel = Cancel()
+
+        # only used in the decorator
+        _ = operation_timeout_ns
+
+        submitted: list[tuple[OperationIdPointer, tuple[Any, ...]]] = []
+
+        try:
+            # one at a time so the already submitted rpcs are known if a submit fails
+            for rpc in rpcs:
+                submitted.append(self._submit_pipeline_rpc(rpc=rpc, cancel=cancel))  # noqa: PERF401
+        except BaseException:
+            self._drain_pipeline(submitted=submitted)
+
+            raise
+
+        results = []
+        first_exc: OperationException | None = None
+
+        for idx, (operation_id_ptr, _keepalive) in enumerate(submitted):
+            try:
+                results.append(self._get_result(operation_id_ptr=operation_id_ptr, cancel=cancel))
+            except OperationException as exc:  # noqa: PERF203
+                # keep going so every submitted result is fetched (and freed) from libscrapli
+                if first_exc is None:
+                    first_exc = exc
+            except BaseException:
+                # i.e. cancelled or timed out waiting, the result of this and every following rpc
+                # is not fetched yet
+                self._drain_pipeline(submitted=submitted[idx:])
+
+                raise
+
+        if first_exc is not None:
+            raise first_exc
+
+        return results
+
+    def _drain_pipeline(self, submitted: list[tuple[OperationIdPointer, tuple[Any, ...]]]) -> None:
+        """
+        Fetch (and so free) the results of submitted pipeline rpcs, ignoring any failures.
+
+        Used when a pipeline is abandoned, each wait is bounded by the operation timeout so a
+        result libscrapli never delivers (i.e. dropped as it was cancelled) can't hang the caller.
+
+        Args:
+            submitted: the submitted rpcs (see `_submit_pipeline_rpc`)
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        for operation_id_ptr, _keepalive in submitted:
+            with (
+                CancelScope.with_deadline(monotonic_ns() + self._operation_timeout_ns) as scope,
+                suppress(Exception),
+            ):
+                self._get_result(operation_id_ptr=operation_id_ptr, cancel=scope)
+
+    @handle_operation_timeout_async
+    async def pipeline_async(
+        self,
+        rpcs: list[PipelineRpc],
+        *,
+        operation_timeout_ns: int | None = None,
+        cancel: Cancel | None = None,
+    ) -> list[Result]:
+        """
+        Execute a batch of rpcs, submitting all of them before waiting on any.
+
+        Each rpc is still its own operation (with its own message-id), all rpcs are handed to
+        libscrapli up front and their results are then collected (correlated by operation id) in
+        submission order, rather than paying for a full submit/wait/fetch cycle per rpc.
+
+        Args:
+            rpcs: the rpcs to send
+            operation_timeout_ns: operation timeout in ns for each rpc of the pipeline
+            cancel: cancellation context for the whole pipeline
+
+        Returns:
+            list[Result]: a Result object for each rpc, in the same order as the given rpcs
+
+        Raises:
+            NotOpenedException: if the ptr to the netconf object is None (via _ptr_or_exception)
+            OperationException: if any of the rpcs fail, raised only after all results have been
+                collected, for the first failing rpc
+
+        """
+        if cancel is None:
+            cancel = Cancel()
+
+        # only used in the decorator
+        _ = operation_timeout_ns
+
+        submitted: list[tuple[OperationIdPointer, tuple[Any, ...]]] = []
+
+        try:
+            # one at a time so the already submitted rpcs are known if a submit fails
+            for rpc in rpcs:
+                submitted.append(self._submit_pipeline_rpc(rpc=rpc, cancel=cancel))  # noqa: PERF401
+        except BaseException:
+            await self._drain_pipeline_async(submitted=submitted)
+
+            raise
+
+        results = []
+        first_exc: OperationException | None = None
+
+        for idx, (operation_id_ptr, _keepalive) in enumerate(submitted):
+            try:
+                results.append(
+                    await self._get_result_async(operation_id_ptr=operation_id_ptr, cancel=cancel)
+                )
+            except OperationException as exc:  # noqa: PERF203
+                # keep going so every submitted result is fetched (and freed) from libscrapli
+                if first_exc is None:
+                    first_exc = exc
+            except BaseException:
+                # i.e. cancelled (the task or the operation) or timed out waiting, the result of
+                # this and every following rpc is not fetched yet
+                await self._drain_pipeline_async(submitted=submitted[idx:])
+
+                raise
+
+        if first_exc is not None:
+            raise first_exc
+
+        return results
+
+    async def _drain_pipeline_async(
+        self, submitted: list[tuple[OperationIdPointer, tuple[Any, ...]]]
+    ) -> None:
+        """
+        Fetch (and so free) the results of submitted pipeline rpcs, ignoring any failures.
+
+        Used when a pipeline is abandoned, each wait is bounded by the operation timeout so a
+        result libscrapli never delivers (i.e. dropped as it was cancelled) can't hang the caller.
+
+        Args:
+            submitted: the submitted rpcs (see `_submit_pipeline_rpc`)
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        for operation_id_ptr, _keepalive in submitted:
+            with (
+                CancelScope.with_deadline(monotonic_ns() + self._operation_timeout_ns) as scope,
+                suppress(Exception),
+            ):
+                await self._get_result_async(operation_id_ptr=operation_id_ptr, cancel=scope)
+
+    def _transaction_pipeline_rpcs(  # noqa: PLR0913
+        self,
+        *,
+        configs: list[str],
+        target: DatastoreType,
+        default_operation: DefaultOperation,
+        test_option: TestOption,
+        error_option: ErrorOption,
+        validate: bool,
+    ) -> tuple[list[str], list[PipelineRpc]]:
+        names: list[str] = []
+        rpcs: list[PipelineRpc] = []
+
+        for config in configs:
+            names.append("edit_config")
+            rpcs.append(
+                PipelineEditConfig(
+                    config=config,
+                    target=target,
+                    default_operation=default_operation,
+                    test_option=test_option,
+                    error_option=error_option,
+                )
+            )
+
+        if validate:
+            names.append("validate")
+            rpcs.append(PipelineValidate(source=target))
+
+        return names, rpcs
+
+    @handle_operation_timeout
+    def transaction(  # noqa: PLR0913
+        self,
+        configs: str | list[str],
+        *,
+        target: DatastoreType = DatastoreType.CANDIDATE,
+        default_operation: DefaultOperation = DefaultOperation.UNSET,
+        test_option: TestOption = TestOption.UNSET,
+        error_option: ErrorOption = ErrorOption.UNSET,
+        validate: bool = True,
+        operation_timeout_ns: int | None = None,
+        cancel: Cancel | None = None,
+    ) -> TransactionResult:
+        """
+        Execute a lock -> edit-config(s) -> validate -> commit -> unlock transaction.
+
+        The edit-config(s) and validate are pipelined (see `pipeline`) as they are safe to send
+        back to back, lock and commit are waited on individually so nothing is committed unless
+        every prior step succeeded. On the first failed step (rpc-error) the transaction is
+        aborted with a discard and unlock -- the same happens (before re-raising) if any step
+        raises.
+
+        Args:
+            configs: config payload(s) to send, each sent as its own edit-config
+            target: target datastore to lock/edit/validate, should be the candidate datastore
+            default_operation: value (or none) for default operation field of the edit-config(s)
+            test_option: the value (or none) for the test option field of the edit-config(s)
+            error_option: the value (or none) for the error option field of the edit-config(s)
+            validate: send a validate rpc before committing
+            operation_timeout_ns: operation timeout in ns for each rpc of the transaction
+            cancel: cancellation context for the transaction
+
+        Returns:
+            TransactionResult: the results and timings of each step of the transaction
+
+        Raises:
+            NotOpenedException: if the ptr to the netconf object is None (via _ptr_or_exception)
+            OperationException: if any of the rpcs fail (as opposed to return an rpc-error)
+
+        """
+        if cancel is None:
+            cancel = Cancel()
+
+        # only used in the decorator
+        _ = operation_timeout_ns
+
+        if isinstance(configs, str):
+            configs = [configs]
+
+        transaction_result = TransactionResult(host=self.host, port=self.port)
+
+        lock_result = self.lock(target=target, cancel=cancel)
+        transaction_result.steps.append(TransactionStep(name="lock", result=lock_result))
+
+        if lock_result.failed:
+            return transaction_result
+
+        names, rpcs = self._transaction_pipeline_rpcs(
+            configs=configs,
+            target=target,
+            default_operation=default_operation,
+            test_option=test_option,
+            error_option=error_option,
+            validate=validate,
+        )
+
+        try:
+            for name, result in zip(names, self.pipeline(rpcs, cancel=cancel), strict=True):
+                transaction_result.steps.append(TransactionStep(name=name, result=result))
+
+            if transaction_result.failed_step is None:
+                commit_result = self.commit(cancel=cancel)
+                transaction_result.steps.append(
+                    TransactionStep(name="commit", result=commit_result)
+                )
+
+                transaction_result.committed = not commit_result.failed
+        except BaseException:
+            # base exception so being interrupted/cancelled mid transaction also aborts
+            self._transaction_abort(transaction_result=transaction_result, target=target)
+
+            raise
+
+        if not transaction_result.committed:
+            self._transaction_abort(transaction_result=transaction_result, target=target)
+
+            return transaction_result
+
+        transaction_result.steps.append(
+            TransactionStep(name="unlock", result=self.unlock(target=target))
+        )
+
+        return transaction_result
+
+    def _transaction_abort(
+        self, transaction_result: TransactionResult, target: DatastoreType
+    ) -> None:
+        # fresh cancel as the transaction's cancel may be the reason we are aborting; failures are
+        # only logged so they never mask the reason we are aborting (and unlock is always tried)
+        steps: list[tuple[str, Callable[[], Result]]] = [
+            ("discard", lambda: self.discard(cancel=Cancel())),
+            ("unlock", lambda: self.unlock(target=target, cancel=Cancel())),
+        ]
+
+        for name, step in steps:
+            try:
+                transaction_result.steps.append(TransactionStep(name=name, result=step()))
+            except Exception as exc:  # noqa: PERF203
+                self.logger.warning(f"transaction abort {name} failed: {exc!r}")
+
+    @handle_operation_timeout_async
+    async def transaction_async(  # noqa: PLR0913
+        self,
+        configs: str | list[str],
+        *,
+        target: DatastoreType = DatastoreType.CANDIDATE,
+        default_operation: DefaultOperation = DefaultOperation.UNSET,
+        test_option: TestOption = TestOption.UNSET,
+        error_option: ErrorOption = ErrorOption.UNSET,
+        validate: bool = True,
+        operation_timeout_ns: int | None = None,
+        cancel: Cancel | None = None,
+    ) -> TransactionResult:
+        """
+        Execute a lock -> edit-config(s) -> validate -> commit -> unlock transaction.
+
+        The edit-config(s) and validate are pipelined (see `pipeline`) as they are safe to send
+        back to back, lock and commit are waited on individually so nothing is committed unless
+        every prior step succeeded. On the first failed step (rpc-error) the transaction is
+        aborted with a discard and unlock -- the same happens (before re-raising) if any step
+        raises.
+
+        Args:
+            configs: config payload(s) to send, each sent as its own edit-config
+            target: target datastore to lock/edit/validate, should be the candidate datastore
+            default_operation: value (or none) for default operation field of the edit-config(s)
+            test_option: the value (or none) for the test option field of the edit-config(s)
+            error_option: the value (or none) for the error option field of the edit-config(s)
+            validate: send a validate rpc before committing
+            operation_timeout_ns: operation timeout in ns for each rpc of the transaction
+            cancel: cancellation context for the transaction
+
+        Returns:
+            TransactionResult: the results and timings of each step of the transaction
+
+        Raises:
+            NotOpenedException: if the ptr to the netconf object is None (via _ptr_or_exception)
+            OperationException: if any of the rpcs fail (as opposed to return an rpc-error)
+
+        """
+        if cancel is None:
+            cancel = Cancel()
+
+        # only used in the decorator
+        _ = operation_timeout_ns
+
+        if isinstance(configs, str):
+            configs = [configs]
+
+        transaction_result = TransactionResult(host=self.host, port=self.port)
+
+        lock_result = await self.lock_async(target=target, cancel=cancel)
+        transaction_result.steps.append(TransactionStep(name="lock", result=lock_result))
+
+        if lock_result.failed:
+            return transaction_result
+
+        names, rpcs = self._transaction_pipeline_rpcs(
+            configs=configs,
+            target=target,
+            default_operation=default_operation,
+            test_option=test_option,
+            error_option=error_option,
+            validate=validate,
+        )
+
+        try:
+            results = await self.pipeline_async(rpcs, cancel=cancel)
+
+            for name, result in zip(names, results, strict=True):
+                transaction_result.steps.append(TransactionStep(name=name, result=result))
+
+            if transaction_result.failed_step is None:
+                commit_result = await self.commit_async(cancel=cancel)
+                transaction_result.steps.append(
+                    TransactionStep(name="commit", result=commit_result)
+                )
+
+                transaction_result.committed = not commit_result.failed
+        except BaseException:
+            # base exception so being interrupted/cancelled mid transaction also aborts
+            await self._transaction_abort_async(
+                transaction_result=transaction_result, target=target
+            )
+
+            raise
+
+        if not transaction_result.committed:
+            await self._transaction_abort_async(
+                transaction_result=transaction_result, target=target
+            )
+
+            return transaction_result
+
+        transaction_result.steps.append(
+            TransactionStep(name="unlock", result=await self.unlock_async(target=target))
+        )
+
+        return transaction_result
+
+    async def _transaction_abort_async(
+        self, transaction_result: TransactionResult, target: DatastoreType
+    ) -> None:
+        # fresh cancel as the transaction's cancel may be the reason we are aborting; failures are
+        # only logged so they never mask the reason we are aborting (and unlock is always tried)
+        steps: list[tuple[str, Callable[[], Awaitable[Result]]]] = [
+            ("discard", lambda: self.discard_async(cancel=Cancel())),
+            ("unlock", lambda: self.unlock_async(target=target, cancel=Cancel())),
+        ]
+
+        for name, step in steps:
+            try:
+                transaction_result.steps.append(TransactionStep(name=name, result=await step()))
+            except Exception as exc:  # noqa: PERF203
+                self.logger.warning(f"transaction abort {name} failed: {exc!r}")
+
     @handle_operation_timeout
     def get_config(  # noqa: PLR0913
         self,
@@ -2480,7 +3339,7 @@ class Netconf:
         return await self._get_result_async(operation_id_ptr=operation_id_ptr, cancel=cancel)
 
     @handle_operation_timeout
-    def get_schema(
+    def get_schema(  # noqa: PLR0913
         self,
         identifier: str,
         *,
@@ -2488,6 +3347,7 @@ class Netconf:
         format_: SchemaFormat = SchemaFormat.YANG,
         operation_timeout_ns: int | None = None,
         cancel: Cancel | None = None,
+        cache: SchemaCache | None = None,
     ) -> Result:
         """
         Execute a get-schema rpc operation.
@@ -2498,6 +3358,9 @@ class Netconf:
             format_: schema format to apply
             operation_timeout_ns: optional timeout in ns for this operation
             cancel: cancellation context for this operation
+            cache: optional schema cache to serve the schema from/store the schema to; only used
+                when the version is known -- either explicitly provided or advertised for the
+                identifier in the server capabilities
 
         Returns:
             Result: a Result object representing the operation
@@ -2513,6 +3376,14 @@ class Netconf:
         # only used in the decorator
         _ = operation_timeout_ns
 
+        cache_version = version or self._advertised_schema_revision(identifier=identifier)
+
+        if cache is not None and cache_version:
+            cached = cache.get(identifier=identifier, version=cache_version, format_=format_.value)
+
+            if cached is not None:
+                return self._cached_result(input_=identifier, result=cached)
+
         operation_id_ptr = OperationIdPointer(c_uint32(0))
 
         _identifier = to_c_string(identifier)
@@ -2527,10 +3398,20 @@ class Netconf:
             format_=format_._to_ffi(),
         )
 
-        return self._get_result(operation_id_ptr=operation_id_ptr, cancel=cancel)
+        result = self._get_result(operation_id_ptr=operation_id_ptr, cancel=cancel)
+
+        if cache is not None and cache_version and not result.failed:
+            cache.set(
+                identifier=identifier,
+                version=cache_version,
+                format_=format_.value,
+                reply=result.result,
+            )
+
+        return result
 
     @handle_operation_timeout_async
-    async def get_schema_async(
+    async def get_schema_async(  # noqa: PLR0913
         self,
         identifier: str,
         *,
@@ -2538,6 +3419,7 @@ class Netconf:
         format_: SchemaFormat = SchemaFormat.YANG,
         operation_timeout_ns: int | None = None,
         cancel: Cancel | None = None,
+        cache: SchemaCache | None = None,
     ) -> Result:
         """
         Execute a get-schema rpc operation.
@@ -2548,6 +3430,9 @@ class Netconf:
             format_: schema format to apply
             operation_timeout_ns: optional timeout in ns for this operation
             cancel: cancellation context for this operation
+            cache: optional schema cache to serve the schema from/store the schema to; only used
+                when the version is known -- either explicitly provided or advertised for the
+                identifier in the server capabilities
 
         Returns:
             Result: a Result object representing the operation
@@ -2563,6 +3448,14 @@ class Netconf:
         # only used in the decorator
         _ = operation_timeout_ns
 
+        cache_version = version or self._advertised_schema_revision(identifier=identifier)
+
+        if cache is not None and cache_version:
+            cached = cache.get(identifier=identifier, version=cache_version, format_=format_.value)
+
+            if cached is not None:
+                return self._cached_result(input_=identifier, result=cached)
+
         operation_id_ptr = OperationIdPointer(c_uint32(0))
 
         _identifier = to_c_string(identifier)
@@ -2577,7 +3470,17 @@ class Netconf:
             format_=format_._to_ffi(),
         )
 
-        return await self._get_result_async(operation_id_ptr=operation_id_ptr, cancel=cancel)
+        result = await self._get_result_async(operation_id_ptr=operation_id_ptr, cancel=cancel)
+
+        if cache is not None and cache_version and not result.failed:
+            cache.set(
+                identifier=identifier,
+                version=cache_version,
+                format_=format_.value,
+                reply=result.result,
+            )
+
+        return result
 
     @handle_operation_timeout
     def get_data(  # noqa: PLR0913
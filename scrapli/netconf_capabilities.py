@@ -0,0 +1,225 @@
+"""scrapli.netconf_capabilities"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+
+CAPABILITIES_CACHE_MAX_ENTRIES = 256
+
+
+@dataclass(frozen=True)
+class ModuleCapability:
+    """
+    ModuleCapability holds the parsed details of a (yang) module advertised as a capability.
+
+    Args:
+        name: the module name
+        namespace: the module namespace
+        revision: the module revision, empty if not advertised
+        features: the advertised features of the module
+        deviations: the modules deviating this module
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    name: str
+    namespace: str
+    revision: str = ""
+    features: frozenset[str] = field(default_factory=frozenset)
+    deviations: frozenset[str] = field(default_factory=frozenset)
+
+
+def _parse_module_capability(capability: str) -> ModuleCapability | None:
+    """
+    Parse a module capability uri, i.e. "urn:foo?module=foo&revision=2020-01-01&features=a,b"
+
+    Args:
+        capability: the capability uri
+
+    Returns:
+        ModuleCapability | None: the parsed module or None if the capability is not a module one
+
+    Raises:
+        N/A
+
+    """
+    namespace, _, query = capability.partition("?")
+    if not query:
+        return None
+
+    params = dict(param.partition("=")[::2] for param in query.split("&"))
+
+    name = params.get("module")
+    if not name:
+        return None
+
+    return ModuleCapability(
+        name=name,
+        namespace=namespace,
+        revision=params.get("revision", ""),
+        features=frozenset(f for f in params.get("features", "").split(",") if f),
+        deviations=frozenset(d for d in params.get("deviations", "").split(",") if d),
+    )
+
+
+class Capabilities:
+    """
+    Capabilities is an indexed (read only) view of the capabilities advertised by a server.
+
+    Urn and module lookups are dict/set lookups rather than scans of the capability strings. Use
+    `Capabilities.from_list` to build instances -- it returns the same instance for the same list
+    of capabilities, so devices of the same model/version share a single parsed view.
+
+    Args:
+        capabilities: the capability strings as advertised in the server hello
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    def __init__(self, capabilities: tuple[str, ...]) -> None:
+        self.raw = capabilities
+
+        # full capability strings and their "base" (query stripped) form, so both
+        # "urn:ietf:params:netconf:capability:candidate:1.0" and a full module capability work
+        self.urns = frozenset(capabilities) | frozenset(c.partition("?")[0] for c in capabilities)
+
+        modules = {}
+
+        for capability in capabilities:
+            module = _parse_module_capability(capability=capability)
+
+            if module is not None:
+                modules[module.name] = module
+
+        # instances are shared (see from_list) so the index is exposed read only
+        self.modules: Mapping[str, ModuleCapability] = MappingProxyType(modules)
+
+    @classmethod
+    def from_list(cls, capabilities: list[str]) -> "Capabilities":
+        """
+        Return the (cached) Capabilities for the given capability strings.
+
+        Args:
+            capabilities: the capability strings as advertised in the server hello
+
+        Returns:
+            Capabilities: the capabilities view
+
+        Raises:
+            N/A
+
+        """
+        return _capabilities_from_tuple(tuple(capabilities))
+
+    def __repr__(self) -> str:
+        """
+        Magic repr method for Capabilities object
+
+        Args:
+            N/A
+
+        Returns:
+            str: repr for Capabilities object
+
+        Raises:
+            N/A
+
+        """
+        return (
+            f"{self.__class__.__name__}(capabilities={len(self.raw)}, modules={len(self.modules)})"
+        )
+
+    def __contains__(self, urn: object) -> bool:
+        return urn in self.urns
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def has_capability(self, urn: str) -> bool:
+        """
+        Check if the urn (with or without query) was advertised.
+
+        Args:
+            urn: the capability urn, i.e. "urn:ietf:params:netconf:capability:candidate:1.0"
+
+        Returns:
+            bool: True if advertised, otherwise False
+
+        Raises:
+            N/A
+
+        """
+        return urn in self.urns
+
+    def module(self, name: str) -> ModuleCapability | None:
+        """
+        Return the advertised module of the given name, if any.
+
+        Args:
+            name: the module name
+
+        Returns:
+            ModuleCapability | None: the module or None if not advertised
+
+        Raises:
+            N/A
+
+        """
+        return self.modules.get(name)
+
+    def revision(self, name: str) -> str | None:
+        """
+        Return the advertised revision of the given module, if any.
+
+        Args:
+            name: the module name
+
+        Returns:
+            str | None: the revision or None if the module or its revision was not advertised
+
+        Raises:
+            N/A
+
+        """
+        module = self.modules.get(name)
+        if module is None:
+            return None
+
+        return module.revision or None
+
+    def has_feature(self, name: str, feature: str) -> bool:
+        """
+        Check if the given module was advertised with the given feature.
+
+        Args:
+            name: the module name
+            feature: the feature name
+
+        Returns:
+            bool: True if advertised, otherwise False
+
+        Raises:
+            N/A
+
+        """
+        module = self.modules.get(name)
+        if module is None:
+            return False
+
+        return feature in module.features
+
+
+@lru_cache(maxsize=CAPABILITIES_CACHE_MAX_ENTRIES)
+def _capabilities_from_tuple(capabilities: tuple[str, ...]) -> Capabilities:
+    return Capabilities(capabilities=capabilities)
@@ -1,10 +1,80 @@
 """scrapli.result"""
 
+import re
+from collections.abc import Callable, Iterator
 from ctypes import c_size_t, pointer
 from dataclasses import dataclass, field
+from functools import cache
+from importlib import import_module
+from typing import Any, cast
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser
 
+from scrapli.exceptions import ParsingException
 from scrapli.ffi_types import ZigSlice
 
+NETCONF_BASE_NAMESPACE = "urn:ietf:params:xml:ns:netconf:base:1.0"
+
+_WHITESPACE_PATTERN = re.compile(r"\s*")
+
+
+def _skip_whitespace(text: str, pos: int = 0) -> int:
+    match = _WHITESPACE_PATTERN.match(text, pos)
+
+    return match.end() if match is not None else pos
+
+
+ITERPARSE_CHUNK_SIZE = 65_536
+
+
+@cache
+def _xml_etree() -> Any:
+    """
+    Return the etree module to parse results with -- lxml if installed, otherwise the stdlib one
+
+    Args:
+        N/A
+
+    Returns:
+        Any: the etree module
+
+    Raises:
+        N/A
+
+    """
+    try:
+        return import_module("lxml.etree")
+    except ModuleNotFoundError:
+        return import_module("xml.etree.ElementTree")
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", maxsplit=1)[-1]
+
+
+def _tag_matches(tag: str, want: str) -> bool:
+    """
+    Check if an element tag matches the wanted tag
+
+    Args:
+        tag: the (clark notation, i.e. "{ns}name") tag of an element
+        want: the wanted tag, clark notation to match exactly, a local name to match in any
+            namespace, or "*" to match anything
+
+    Returns:
+        bool: True if matching, otherwise False
+
+    Raises:
+        N/A
+
+    """
+    if want == "*":
+        return True
+
+    if want.startswith("{"):
+        return tag == want
+
+    return _local_name(tag) == want
+
 
 @dataclass
 class Result:
@@ -44,6 +114,11 @@ class Result:
     rpc_errors: str
 
     _result_raw: bytes | None = field(default=None, init=False, repr=False)
+    # offset of the result past any leading whitespace/xml header, only the offset is cached so
+    # large replies are not held twice
+    _result_offset: int | None = field(default=None, init=False, repr=False)
+    _xml: Any = field(default=None, init=False, repr=False)
+    _rpc_errors_parsed: list[dict[str, str]] | None = field(default=None, init=False, repr=False)
 
     @property
     def result_raw(self) -> bytes:
@@ -156,11 +231,382 @@ class Result:
             N/A
 
         """
-        out = self._result.lstrip()
+        if self._result_offset is None:
+            offset = _skip_whitespace(self._result)
+
+            if self._result.startswith("<?xml", offset):
+                end = self._result.find("?>", offset)
+                if end != -1:
+                    offset = _skip_whitespace(self._result, end + 2)
+
+            self._result_offset = offset
+
+        # a zero offset slice is the result itself, not a copy
+        return self._result[self._result_offset :]
+
+    @property
+    def xml(self) -> Any:
+        """
+        Returns the result parsed into an element tree, parsed once on first access then cached.
+
+        The element is an lxml element if lxml is installed, otherwise an xml.etree.ElementTree
+        element; treat it as read only as it is shared by all accessors of this result.
+
+        Args:
+            N/A
+
+        Returns:
+            Any: the root element of the result
+
+        Raises:
+            ParsingException: if the result is not valid xml
+
+        """
+        if self._xml is not None:
+            return self._xml
+
+        etree = _xml_etree()
+
+        try:
+            self._xml = etree.fromstring(self.result)
+        except Exception as exc:
+            raise ParsingException("failed parsing result xml") from exc
+
+        return self._xml
+
+    @property
+    def rpc_errors_parsed(self) -> list[dict[str, str]]:
+        """
+        Returns the rpc-error(s) of the result, each as a dict of child (local) name to text.
+
+        i.e. `{"error-type": "application", "error-tag": "invalid-value", ...}`, error-info is
+        included as its serialized xml. Parsed once on first access then cached.
+
+        Args:
+            N/A
+
+        Returns:
+            list[dict[str, str]]: the parsed rpc errors, empty if there were none
+
+        Raises:
+            ParsingException: if the result is not valid xml
+
+        """
+        if self._rpc_errors_parsed is not None:
+            return self._rpc_errors_parsed
+
+        if not self.rpc_errors:
+            self._rpc_errors_parsed = []
+
+            return self._rpc_errors_parsed
+
+        etree = _xml_etree()
+
+        parsed = []
+
+        for rpc_error in self.xml.iter():
+            if not isinstance(rpc_error.tag, str) or _local_name(rpc_error.tag) != "rpc-error":
+                continue
+
+            error = {}
+
+            for child in rpc_error:
+                if not isinstance(child.tag, str):
+                    # comments/processing instructions
+                    continue
+
+                name = _local_name(child.tag)
+
+                if len(child):
+                    error[name] = "".join(
+                        etree.tostring(c, encoding="unicode") for c in child
+                    ).strip()
+                else:
+                    error[name] = (child.text or "").strip()
+
+            parsed.append(error)
+
+        self._rpc_errors_parsed = parsed
+
+        return self._rpc_errors_parsed
+
+    def findall(self, path: str, namespaces: dict[str, str] | None = None) -> list[Any]:
+        """
+        Find all elements matching the path in the (cached) parsed result.
+
+        The "nc" prefix is mapped to the netconf base namespace unless otherwise provided.
+
+        Args:
+            path: the ElementPath expression, i.e. ".//nc:data" or ".//{urn:some:ns}interface"
+            namespaces: optional prefix to namespace uri mapping for the path
+
+        Returns:
+            list[Any]: the matching elements
+
+        Raises:
+            ParsingException: if the result is not valid xml
+
+        """
+        return list(
+            self.xml.findall(path, namespaces={"nc": NETCONF_BASE_NAMESPACE, **(namespaces or {})})
+        )
+
+    def iterparse(self, tag: str, chunk_size: int = ITERPARSE_CHUNK_SIZE) -> Iterator[Element]:
+        """
+        Incrementally parse the result yielding each element matching the tag.
+
+        Unlike `xml` the full tree is never built -- the result is fed to the parser in chunks and
+        each matched element (and everything before it) is cleared once consumed, so only the
+        current element and its ancestors are ever held. This means yielded elements are only
+        valid until the iterator is advanced, copy out anything you need before then. Matches
+        nested in another match are not yielded separately.
+
+        Args:
+            tag: tag to match, a local name (any namespace), clark notation ("{ns}name") or "*"
+            chunk_size: count of characters of the result to feed to the parser at a time
+
+        Yields:
+            Element: the matched elements
+
+        Raises:
+            ParsingException: if the result is not valid xml
+
+        """
+        yield from self._iter_matching(
+            matches=lambda path: _tag_matches(path[-1], tag), chunk_size=chunk_size
+        )
+
+    def iter_elements(self, path: str, chunk_size: int = ITERPARSE_CHUNK_SIZE) -> Iterator[Element]:
+        """
+        Incrementally parse the result yielding each element matching the (simple) path.
+
+        The path is a "/" separated list of tags (as in `iterparse`) matched against the trailing
+        ancestry of each element, i.e. "interfaces/interface" matches any interface element whose
+        parent is an interfaces element; a leading "/" anchors the path at the root element, i.e.
+        "/rpc-reply/data/*". See `iterparse` for memory/lifetime details.
+
+        Args:
+            path: the path to match
+            chunk_size: count of characters of the result to feed to the parser at a time
+
+        Yields:
+            Element: the matched elements
+
+        Raises:
+            ParsingException: if the result is not valid xml
+
+        """
+        anchored = path.startswith("/")
+        wanted = [segment for segment in path.strip("/").split("/") if segment]
+
+        if not wanted:
+            raise ParsingException(f"invalid element path '{path}'")
+
+        def matches(element_path: list[str]) -> bool:
+            if anchored and len(element_path) != len(wanted):
+                return False
+
+            if len(element_path) < len(wanted):
+                return False
+
+            return all(
+                _tag_matches(tag, want)
+                for tag, want in zip(element_path[-len(wanted) :], wanted, strict=True)
+            )
+
+        yield from self._iter_matching(matches=matches, chunk_size=chunk_size)
+
+    def _iter_matching(
+        self, matches: Callable[[list[str]], bool], chunk_size: int
+    ) -> Iterator[Element]:
+        parser: XMLPullParser[Any] = XMLPullParser(events=("start", "end"))
 
-        if out.startswith("<?xml"):
-            end = out.find("?>")
-            if end != -1:
-                return out[end + 2 :].lstrip()
+        result = self.result
+
+        # the currently open elements and their tags, root first
+        stack: list[Element] = []
+        path: list[str] = []
+        # depth of the currently open match (if any) in the stack
+        match_depth: int | None = None
+
+        for offset in range(0, len(result) or 1, chunk_size):
+            try:
+                parser.feed(result[offset : offset + chunk_size])
+            except ParseError as exc:
+                raise ParsingException("failed parsing result xml") from exc
+
+            # only start/end events requested, so all events are (event, element) pairs
+            events = cast(Iterator[tuple[str, Element]], parser.read_events())
+
+            for event, element in events:
+                if event == "start":
+                    stack.append(element)
+                    path.append(element.tag)
+
+                    if match_depth is None and matches(path):
+                        match_depth = len(stack)
+
+                    continue
+
+                depth = len(stack)
+
+                stack.pop()
+                path.pop()
+
+                if match_depth is not None and depth > match_depth:
+                    # inside of a match, leave it be until the match itself is done
+                    continue
+
+                if match_depth == depth:
+                    match_depth = None
+
+                    yield element
+
+                element.clear()
+
+                if stack:
+                    # drop the consumed element from its parent so nothing accumulates there
+                    stack[-1].remove(element)
+
+        try:
+            parser.close()
+        except ParseError as exc:
+            raise ParsingException("failed parsing result xml") from exc
+
+
+@dataclass
+class TransactionStep:
+    """
+    TransactionStep holds the result of a single step of a Netconf transaction.
+
+    Args:
+        name: name of the step, i.e. "lock", "edit_config", "validate", "commit"
+        result: the result of the step
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    name: str
+    result: Result
+
+    @property
+    def elapsed_time_seconds(self) -> float:
+        """
+        Returns the number of seconds the step took.
+
+        Args:
+            N/A
+
+        Returns:
+            float: duration in seconds
+
+        Raises:
+            N/A
+
+        """
+        return self.result.elapsed_time_seconds
+
+
+@dataclass
+class TransactionResult:
+    """
+    TransactionResult holds the results of all steps of a Netconf transaction.
+
+    Args:
+        host: the host the transaction was executed against
+        port: the port the transaction was executed against
+        steps: the executed steps, in execution order
+        committed: True if the transaction was committed, otherwise False (aborted)
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    host: str
+    port: int
+    steps: list[TransactionStep] = field(default_factory=list)
+    committed: bool = False
+
+    @property
+    def failed(self) -> bool:
+        """
+        Returns True if the transaction was not committed, otherwise False.
+
+        Args:
+            N/A
+
+        Returns:
+            bool: True for failed, otherwise False
+
+        Raises:
+            N/A
+
+        """
+        return not self.committed
+
+    @property
+    def failed_step(self) -> TransactionStep | None:
+        """
+        Returns the (first) step that failed, if any.
+
+        Args:
+            N/A
+
+        Returns:
+            TransactionStep | None: the failed step or None
+
+        Raises:
+            N/A
+
+        """
+        for step in self.steps:
+            if step.result.failed:
+                return step
+
+        return None
+
+    @property
+    def timings(self) -> list[tuple[str, float]]:
+        """
+        Returns the name and duration in seconds of each step.
+
+        Args:
+            N/A
+
+        Returns:
+            list[tuple[str, float]]: the step names and durations
+
+        Raises:
+            N/A
+
+        """
+        return [(step.name, step.elapsed_time_seconds) for step in self.steps]
+
+    @property
+    def elapsed_time_seconds(self) -> float:
+        """
+        Returns the number of seconds from the start of the first to the end of the last step.
+
+        Args:
+            N/A
+
+        Returns:
+            float: duration in seconds
+
+        Raises:
+            N/A
+
+        """
+        if not self.steps:
+            return 0.0
 
-        return out
+        return (self.steps[-1].result.end_time - self.steps[0].result.start_time) / 1_000_000_000
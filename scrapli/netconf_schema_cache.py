@@ -0,0 +1,184 @@
+"""scrapli.netconf_schema_cache"""
+
+import os
+import re
+from dataclasses import dataclass
+from hashlib import blake2b
+from logging import getLogger
+from pathlib import Path
+from tempfile import mkstemp
+from threading import Lock
+
+logger = getLogger(__name__)
+
+# yang module names and revision dates are "safe" as file names, anything else gets hashed
+_SAFE_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_.\-]+$")
+
+
+@dataclass
+class SchemaCacheStats:
+    """
+    SchemaCacheStats holds the counters of a SchemaCache.
+
+    Args:
+        hits: count of lookups served from the cache (memory or disk)
+        misses: count of lookups that were not in the cache
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+
+class SchemaCache:
+    """
+    SchemaCache stores get-schema replies on disk keyed on (identifier, version, format).
+
+    A given revision of a module is immutable, so once fetched from any device it can be served
+    from disk for every other device advertising that same revision. Entries are only ever
+    written/read for a concrete version -- see `Netconf.get_schema` for how the version is
+    resolved from the advertised capabilities when not explicitly provided.
+
+    Args:
+        path: directory to store schemas in, created if it does not exist
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = Path(path).expanduser()
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        # schemas are few but read often, so also keep whatever we read/wrote in memory
+        self._entries: dict[tuple[str, str, str], str] = {}
+        self._lock = Lock()
+
+        self._hits = 0
+        self._misses = 0
+
+    def __repr__(self) -> str:
+        """
+        Magic repr method for SchemaCache object
+
+        Args:
+            N/A
+
+        Returns:
+            str: repr for SchemaCache object
+
+        Raises:
+            N/A
+
+        """
+        return f"{self.__class__.__name__}(path={self.path!r})"
+
+    @property
+    def stats(self) -> SchemaCacheStats:
+        """
+        Returns the cache counters.
+
+        Args:
+            N/A
+
+        Returns:
+            SchemaCacheStats: the cache counters
+
+        Raises:
+            N/A
+
+        """
+        return SchemaCacheStats(hits=self._hits, misses=self._misses)
+
+    def _entry_path(self, identifier: str, version: str, format_: str) -> Path:
+        name = f"{identifier}@{version}"
+
+        if not (_SAFE_NAME_PATTERN.match(identifier) and _SAFE_NAME_PATTERN.match(version)):
+            name = blake2b(f"{identifier}\x00{version}".encode(), digest_size=16).hexdigest()
+
+        return self.path / format_ / f"{name}.xml"
+
+    def get(self, identifier: str, version: str, format_: str) -> str | None:
+        """
+        Return the cached get-schema reply, or None on a miss.
+
+        Args:
+            identifier: schema identifier (module name)
+            version: schema version (revision)
+            format_: schema format, i.e. "yang"
+
+        Returns:
+            str | None: the cached reply or None
+
+        Raises:
+            N/A
+
+        """
+        key = (identifier, version, format_)
+
+        with self._lock:
+            cached = self._entries.get(key)
+
+        if cached is None:
+            try:
+                cached = self._entry_path(*key).read_text(encoding="utf-8")
+            except OSError:
+                cached = None
+
+        with self._lock:
+            if cached is None:
+                self._misses += 1
+
+                return None
+
+            self._hits += 1
+            self._entries[key] = cached
+
+        return cached
+
+    def set(self, identifier: str, version: str, format_: str, reply: str) -> None:
+        """
+        Store the get-schema reply.
+
+        Args:
+            identifier: schema identifier (module name)
+            version: schema version (revision)
+            format_: schema format, i.e. "yang"
+            reply: the get-schema reply to store
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        key = (identifier, version, format_)
+
+        with self._lock:
+            self._entries[key] = reply
+
+        entry_path = self._entry_path(*key)
+
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # write then rename so concurrent readers never see a partial schema
+            fd, tmp_path = mkstemp(dir=entry_path.parent, suffix=".tmp")
+
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(reply)
+
+            os.replace(tmp_path, entry_path)
+        except OSError as exc:
+            logger.warning(f"failed writing schema cache entry to disk: {exc}")
@@ -0,0 +1,317 @@
+"""scrapli.replay"""
+
+import asyncio
+import os
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import suppress
+from hashlib import blake2b
+from pathlib import Path
+from shutil import copyfileobj
+from tempfile import gettempdir, mkstemp
+from typing import Any
+
+from scrapli.exceptions import OptionsException
+from scrapli.session import Options as SessionOptions
+from scrapli.session_recorder import RECORDER_TIMINGS_SUFFIX, open_recording
+from scrapli.transport import TestOptions as TransportTestOptions
+
+DEFAULT_REPLAY_CHUNK_SIZE = 65_536
+DEFAULT_REPLAY_CACHE_DIR = os.path.join(gettempdir(), "scrapli-replay")
+
+_COMPRESSED_SUFFIXES = (".gz", ".xz")
+
+
+class Replay:
+    """
+    Replay serves a recorded session, plain or compressed, as fast or as slow as desired.
+
+    Recordings may be anything written by `SessionOptions.recorder_path` or a segment written by
+    `scrapli.session_recorder.SessionRecorder`. Compressed segments are decompressed once into
+    `cache_dir` (keyed on the recording path, size and mtime) when a plain file is required, i.e.
+    for `transport_options`.
+
+    With `speed` unset the recording is served at wire speed -- in `chunk_size` chunks without any
+    delay. With `speed` set and a timings sidecar present (see `SessionRecorder.record_timings`)
+    chunks are served at their original timing divided by `speed`, so 2.0 replays twice as fast.
+
+    Timing is only honored by `chunks`/`chunks_async`. Drivers replaying the recording via
+    `transport_options` read the (materialized) file with the test transport, which always serves
+    it at wire speed, whatever `speed` is set to.
+
+    Args:
+        path: path to the recording
+        speed: timing multiplier, None to replay at wire speed
+        chunk_size: size of chunks served at wire speed, also used as the session read size
+        cache_dir: directory to decompress recordings to
+
+    Returns:
+        None
+
+    Raises:
+        OptionsException: if speed is not positive
+
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        speed: float | None = None,
+        chunk_size: int = DEFAULT_REPLAY_CHUNK_SIZE,
+        cache_dir: str = DEFAULT_REPLAY_CACHE_DIR,
+    ) -> None:
+        if speed is not None and speed <= 0:
+            raise OptionsException("replay speed must be positive")
+
+        self.path = os.path.expanduser(path)
+        self.speed = speed
+        self.chunk_size = chunk_size
+        self.cache_dir = cache_dir
+
+        self._data: bytes | None = None
+        self._timings: list[tuple[int, int]] | None = None
+        self._timings_loaded = False
+
+    def __repr__(self) -> str:
+        """
+        Magic repr method for Replay object
+
+        Args:
+            N/A
+
+        Returns:
+            str: repr for Replay object
+
+        Raises:
+            N/A
+
+        """
+        return f"{self.__class__.__name__}(path={self.path!r}, speed={self.speed!r})"
+
+    @property
+    def compressed(self) -> bool:
+        """
+        Returns True if the recording is compressed.
+
+        Args:
+            N/A
+
+        Returns:
+            bool: True if compressed
+
+        Raises:
+            N/A
+
+        """
+        return self.path.endswith(_COMPRESSED_SUFFIXES)
+
+    @property
+    def data(self) -> bytes:
+        """
+        Returns the (decompressed) recording, loaded once.
+
+        Args:
+            N/A
+
+        Returns:
+            bytes: the recorded session output
+
+        Raises:
+            N/A
+
+        """
+        if self._data is None:
+            with open_recording(self.path) as f:
+                self._data = f.read()
+
+        return self._data
+
+    @property
+    def timings(self) -> list[tuple[int, int]] | None:
+        """
+        Returns the recorded (offset, elapsed ns) chunk timings, if a timings sidecar exists.
+
+        Args:
+            N/A
+
+        Returns:
+            list[tuple[int, int]] | None: the chunk timings or None
+
+        Raises:
+            N/A
+
+        """
+        if not self._timings_loaded:
+            self._timings_loaded = True
+
+            try:
+                with open(f"{self.path}{RECORDER_TIMINGS_SUFFIX}", encoding="utf-8") as f:
+                    self._timings = [
+                        (int(offset), int(elapsed))
+                        for offset, elapsed in (line.split() for line in f if line.strip())
+                    ]
+            except OSError:
+                self._timings = None
+
+        return self._timings
+
+    def _schedule(self) -> Iterator[tuple[bytes, float]]:
+        """
+        Yield the chunks to serve along with the (replay relative) second to serve them at.
+
+        Args:
+            N/A
+
+        Returns:
+            Iterator[tuple[bytes, float]]: chunks and their due time
+
+        Raises:
+            N/A
+
+        """
+        data = self.data
+        timings = self.timings
+
+        if self.speed is None or not timings:
+            view = memoryview(data)
+
+            for offset in range(0, len(data), self.chunk_size):
+                yield bytes(view[offset : offset + self.chunk_size]), 0.0
+
+            return
+
+        for idx, (offset, elapsed_ns) in enumerate(timings):
+            end = timings[idx + 1][0] if idx + 1 < len(timings) else len(data)
+
+            yield data[offset:end], elapsed_ns / 1_000_000_000 / self.speed
+
+    def chunks(self) -> Iterator[bytes]:
+        """
+        Yield the recording in chunks, sleeping to honor the original timing if requested.
+
+        Args:
+            N/A
+
+        Returns:
+            Iterator[bytes]: the recorded chunks
+
+        Raises:
+            N/A
+
+        """
+        start = time.monotonic()
+
+        for chunk, due in self._schedule():
+            # sleep relative to the replay start so per chunk overhead does not accumulate
+            delay = due - (time.monotonic() - start)
+            if delay > 0:
+                time.sleep(delay)
+
+            yield chunk
+
+    async def chunks_async(self) -> AsyncIterator[bytes]:
+        """
+        Yield the recording in chunks, sleeping to honor the original timing if requested.
+
+        Args:
+            N/A
+
+        Returns:
+            AsyncIterator[bytes]: the recorded chunks
+
+        Raises:
+            N/A
+
+        """
+        start = time.monotonic()
+
+        for chunk, due in self._schedule():
+            delay = due - (time.monotonic() - start)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            yield chunk
+
+    def materialize(self) -> str:
+        """
+        Return a plain (decompressed) copy of the recording usable by the test transport.
+
+        Args:
+            N/A
+
+        Returns:
+            str: path to the plain recording
+
+        Raises:
+            N/A
+
+        """
+        if not self.compressed:
+            return self.path
+
+        stat = os.stat(self.path)
+        key = blake2b(
+            f"{os.path.abspath(self.path)}\x00{stat.st_size}\x00{stat.st_mtime_ns}".encode(),
+            digest_size=16,
+        ).hexdigest()
+
+        plain_path = Path(self.cache_dir) / f"{key}.log"
+
+        if not plain_path.exists():
+            plain_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # write then rename so concurrent replays never read a partial recording
+            fd, tmp_path = mkstemp(dir=plain_path.parent, suffix=".tmp")
+
+            try:
+                # streamed, recordings can be far larger than is sensible to hold in memory
+                with os.fdopen(fd, "wb") as f, open_recording(self.path) as recording:
+                    copyfileobj(recording, f)
+
+                os.replace(tmp_path, plain_path)
+            except BaseException:
+                # i.e. a corrupt/truncated recording, the partial copy is of no use to anyone
+                with suppress(OSError):
+                    os.unlink(tmp_path)
+
+                raise
+
+        return str(plain_path)
+
+    def transport_options(self) -> TransportTestOptions:
+        """
+        Return test transport options replaying this recording.
+
+        The test transport replays at wire speed, `speed` (and the recorded timings) only apply to
+        `chunks`/`chunks_async`.
+
+        Args:
+            N/A
+
+        Returns:
+            TransportTestOptions: the transport options
+
+        Raises:
+            N/A
+
+        """
+        return TransportTestOptions(f=self.materialize())
+
+    def session_options(self, **kwargs: Any) -> SessionOptions:
+        """
+        Return session options reading the recording at wire speed, rather than a byte at a time.
+
+        Args:
+            kwargs: any further session options, i.e. operation_timeout_s
+
+        Returns:
+            SessionOptions: the session options
+
+        Raises:
+            N/A
+
+        """
+        kwargs.setdefault("read_size", self.chunk_size)
+
+        return SessionOptions(**kwargs)
@@ -0,0 +1,470 @@
+"""scrapli.session_recorder"""
+
+import gzip
+import lzma
+import re
+from enum import Enum
+from io import BufferedIOBase, TextIOWrapper
+from logging import getLogger
+from pathlib import Path
+from threading import Lock
+from time import monotonic, monotonic_ns, time_ns
+from types import TracebackType
+
+logger = getLogger(__name__)
+
+DEFAULT_RECORDER_BUFFER_SIZE = 65_536
+DEFAULT_RECORDER_MAX_SEGMENT_SIZE = 64 * 1_024 * 1_024
+RECORDER_TIMINGS_SUFFIX = ".timings"
+
+
+class RecorderCompression(str, Enum):
+    """
+    Enum representing the compression of recorder segments
+
+    Args:
+        N/A
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    NONE = "none"
+    GZIP = "gzip"
+    LZMA = "lzma"
+
+    @property
+    def suffix(self) -> str:
+        """
+        Returns the file suffix for segments of this compression.
+
+        Args:
+            N/A
+
+        Returns:
+            str: the suffix
+
+        Raises:
+            N/A
+
+        """
+        match self:
+            case RecorderCompression.GZIP:
+                return ".log.gz"
+            case RecorderCompression.LZMA:
+                return ".log.xz"
+            case _:
+                return ".log"
+
+
+def open_recording(path: str) -> BufferedIOBase:
+    """
+    Open a (possibly compressed) recording segment for reading based on its suffix
+
+    Args:
+        path: path to the recording
+
+    Returns:
+        BufferedIOBase: the (decompressing) file object
+
+    Raises:
+        N/A
+
+    """
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+
+    if path.endswith(".xz"):
+        return lzma.open(path, "rb")
+
+    return open(path, "rb")
+
+
+class SessionRecorder:
+    """
+    SessionRecorder is a buffered, compressing, rotating session recorder sink.
+
+    Pass an instance as the `recorder_callback` of the session options. Chunks handed over by
+    libscrapli are buffered in memory and only written (compressed) to the current segment once
+    `buffer_size` bytes accumulated. Segments are rotated once they hold `max_segment_size`
+    (uncompressed) bytes or are older than `max_segment_age_s`, and only the newest
+    `max_segments` segments are retained. Segments are named
+    `<prefix>.<start unix ns>.<sequence><suffix>` in the given directory, so use a per host
+    prefix (the default is "session") when recording many hosts to the same directory.
+
+    With `record_timings` each segment gets a plain text `<segment>.timings` sidecar holding one
+    "<offset> <elapsed ns>" line per chunk, which lets `scrapli.replay.Replay` reproduce the
+    original timing of the session.
+
+    Always `close` the recorder (or use it as a context manager) once the session is closed so
+    the buffer is flushed and the compressed stream is finalized.
+
+    Args:
+        path: directory to write segments to, created if it does not exist
+        prefix: segment file name prefix, i.e. the host name
+        compression: compression to apply to segments
+        buffer_size: bytes to buffer before writing to the segment
+        max_segment_size: (uncompressed) bytes after which to rotate the segment, None to never
+            rotate on size
+        max_segment_age_s: seconds after which to rotate the segment, None to never rotate on age
+        max_segments: count of segments (for this prefix) to retain, None to retain all
+        record_timings: write a timings sidecar per segment
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        path: str,
+        *,
+        prefix: str = "session",
+        compression: RecorderCompression = RecorderCompression.GZIP,
+        buffer_size: int = DEFAULT_RECORDER_BUFFER_SIZE,
+        max_segment_size: int | None = DEFAULT_RECORDER_MAX_SEGMENT_SIZE,
+        max_segment_age_s: float | None = None,
+        max_segments: int | None = None,
+        record_timings: bool = False,
+    ) -> None:
+        self.path = Path(path).expanduser()
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        self.prefix = prefix
+        self.compression = compression
+        self.buffer_size = buffer_size
+        self.max_segment_size = max_segment_size
+        self.max_segment_age_s = max_segment_age_s
+        self.max_segments = max_segments
+        self.record_timings = record_timings
+
+        self._lock = Lock()
+
+        self._buffer: list[bytes] = []
+        self._buffer_timestamps: list[int] = []
+        self._buffered = 0
+
+        self._segment: BufferedIOBase | None = None
+        self._segment_path: Path | None = None
+        self._segment_size = 0
+        self._segment_opened_at = 0.0
+        self._segment_sequence = 0
+        self._segment_timings: TextIOWrapper | None = None
+        self._segment_first_timestamp: int | None = None
+
+        self._closed = False
+
+    def __repr__(self) -> str:
+        """
+        Magic repr method for SessionRecorder object
+
+        Args:
+            N/A
+
+        Returns:
+            str: repr for SessionRecorder object
+
+        Raises:
+            N/A
+
+        """
+        return (
+            f"{self.__class__.__name__}("
+            f"path={self.path!r}, "
+            f"prefix={self.prefix!r}, "
+            f"compression={self.compression!r})"
+        )
+
+    def __enter__(self) -> "SessionRecorder":
+        """
+        Enter method for context manager
+
+        Args:
+            N/A
+
+        Returns:
+            SessionRecorder: the recorder
+
+        Raises:
+            N/A
+
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """
+        Exit method to cleanup for context manager
+
+        Args:
+            exc_type: exception type being raised
+            exc_value: message from exception being raised
+            traceback: traceback from exception being raised
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.close()
+
+    def __call__(self, chunk: str) -> None:
+        """
+        Record a chunk of session output, the recorder callback entrypoint.
+
+        Args:
+            chunk: the chunk of session output
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        data = chunk.encode()
+
+        with self._lock:
+            if self._closed:
+                return
+
+            self._buffer.append(data)
+            self._buffered += len(data)
+
+            if self.record_timings:
+                self._buffer_timestamps.append(monotonic_ns())
+
+            if self._buffered >= self.buffer_size or self._segment_expired():
+                self._flush_locked()
+
+    @property
+    def segment_path(self) -> Path | None:
+        """
+        Returns the path of the current segment, if any.
+
+        Args:
+            N/A
+
+        Returns:
+            Path | None: the current segment path
+
+        Raises:
+            N/A
+
+        """
+        return self._segment_path
+
+    def segments(self) -> list[Path]:
+        """
+        Returns the (existing) segments of this recorder's prefix, oldest first.
+
+        Args:
+            N/A
+
+        Returns:
+            list[Path]: the segment paths
+
+        Raises:
+            N/A
+
+        """
+        # match the full name so "r1" does not pick up the segments of i.e. "r1.lab"
+        pattern = re.compile(
+            rf"^{re.escape(self.prefix)}\.\d+\.\d+{re.escape(self.compression.suffix)}$"
+        )
+
+        return sorted(
+            (p for p in self.path.glob(f"{self.prefix}.*") if pattern.match(p.name)),
+            key=lambda p: p.name[len(self.prefix) + 1 :],
+        )
+
+    def flush(self) -> None:
+        """
+        Write any buffered output to the current segment.
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        with self._lock:
+            self._flush_locked()
+
+            if self._segment is not None:
+                self._segment.flush()
+
+            if self._segment_timings is not None:
+                self._segment_timings.flush()
+
+    def close(self) -> None:
+        """
+        Flush any buffered output and close (finalize) the current segment.
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        with self._lock:
+            if self._closed:
+                return
+
+            self._flush_locked()
+            self._close_segment_locked()
+
+            self._closed = True
+
+    def _segment_expired(self) -> bool:
+        if self._segment is None or self.max_segment_age_s is None:
+            return False
+
+        return monotonic() - self._segment_opened_at >= self.max_segment_age_s
+
+    def _flush_locked(self) -> None:
+        if not self._buffer:
+            return
+
+        chunks = self._buffer
+        timestamps = self._buffer_timestamps
+        data = b"".join(chunks)
+
+        self._buffer = []
+        self._buffer_timestamps = []
+        self._buffered = 0
+
+        if self._segment is not None and (
+            self._segment_expired()
+            or (
+                self.max_segment_size is not None
+                and self._segment_size + len(data) > self.max_segment_size
+                and self._segment_size > 0
+            )
+        ):
+            self._close_segment_locked()
+
+        if self._segment is None:
+            self._open_segment_locked()
+
+        if self._segment is None:
+            return
+
+        offset = self._segment_size
+
+        try:
+            self._segment.write(data)
+        except OSError as exc:
+            logger.warning(f"failed writing session recorder segment: {exc}")
+
+            return
+
+        self._segment_size += len(data)
+
+        if self._segment_timings is not None and timestamps:
+            self._write_timings_locked(offset=offset, chunks=chunks, timestamps=timestamps)
+
+    def _write_timings_locked(
+        self, offset: int, chunks: list[bytes], timestamps: list[int]
+    ) -> None:
+        if self._segment_timings is None:
+            return
+
+        if self._segment_first_timestamp is None:
+            self._segment_first_timestamp = timestamps[0]
+
+        lines = []
+
+        for chunk, timestamp in zip(chunks, timestamps, strict=True):
+            lines.append(f"{offset} {timestamp - self._segment_first_timestamp}\n")
+            offset += len(chunk)
+
+        try:
+            self._segment_timings.write("".join(lines))
+        except OSError as exc:
+            logger.warning(f"failed writing session recorder timings: {exc}")
+
+    def _open_segment_locked(self) -> None:
+        self._segment_sequence += 1
+
+        segment_path = self.path / (
+            f"{self.prefix}.{time_ns()}.{self._segment_sequence:06d}{self.compression.suffix}"
+        )
+
+        try:
+            match self.compression:
+                case RecorderCompression.GZIP:
+                    self._segment = gzip.open(segment_path, "wb", compresslevel=6)
+                case RecorderCompression.LZMA:
+                    self._segment = lzma.open(segment_path, "wb")
+                case _:
+                    self._segment = open(segment_path, "wb")
+        except OSError as exc:
+            logger.warning(f"failed opening session recorder segment: {exc}")
+
+            return
+
+        self._segment_path = segment_path
+        self._segment_size = 0
+        self._segment_opened_at = monotonic()
+        self._segment_first_timestamp = None
+
+        if self.record_timings:
+            try:
+                self._segment_timings = open(
+                    f"{segment_path}{RECORDER_TIMINGS_SUFFIX}", "w", encoding="utf-8"
+                )
+            except OSError as exc:
+                logger.warning(f"failed opening session recorder timings: {exc}")
+
+        self._prune_segments_locked()
+
+    def _close_segment_locked(self) -> None:
+        if self._segment is None:
+            return
+
+        try:
+            self._segment.close()
+        except OSError as exc:
+            logger.warning(f"failed closing session recorder segment: {exc}")
+
+        self._segment = None
+
+        if self._segment_timings is not None:
+            try:
+                self._segment_timings.close()
+            except OSError as exc:
+                logger.warning(f"failed closing session recorder timings: {exc}")
+
+            self._segment_timings = None
+
+    def _prune_segments_locked(self) -> None:
+        if self.max_segments is None:
+            return
+
+        segments = self.segments()
+
+        for stale in segments[: max(len(segments) - self.max_segments, 0)]:
+            stale.unlink(missing_ok=True)
+            stale.with_name(f"{stale.name}{RECORDER_TIMINGS_SUFFIX}").unlink(missing_ok=True)
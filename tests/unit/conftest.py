@@ -11,6 +11,8 @@ from pathlib import Path
 from typing import IO
 
 import pytest
+from fake_device_server.server import FakeDeviceServer
+from fake_device_server.server import Options as FakeDeviceOptions
 
 from scrapli import (
     AuthOptions,
@@ -20,6 +22,7 @@ from scrapli import (
     SessionOptions,
     TransportBinOptions,
     TransportSsh2Options,
+    TransportTelnetOptions,
     TransportTestOptions,
 )
 from scrapli.cli_result import Result
@@ -320,3 +323,38 @@ def concurrency_cli(transport) -> Callable[[], Cli]:
         )
 
     return _concurrency_cli
+
+
+@pytest.fixture(scope="module")
+def fake_device_server() -> Generator[FakeDeviceServer, None, None]:
+    """Fixture running a (pure python) fake arista_eos telnet server on a free port"""
+    server = FakeDeviceServer(
+        "arista_eos",
+        options=FakeDeviceOptions(latency_jitter_s=0.1),
+    )
+
+    with server.serve_in_thread():
+        yield server
+
+
+@pytest.fixture(scope="function")
+def fake_device_cli(fake_device_server) -> Callable[[], Cli]:
+    """Fixture providing a factory building Cli instances pointed at the fake device server"""
+
+    def _fake_device_cli() -> Cli:
+        return Cli(
+            definition_file_or_name="arista_eos",
+            host=fake_device_server.host,
+            port=fake_device_server.port,
+            auth_options=AuthOptions(
+                username="admin",
+                password="password",
+                lookups=[LookupKeyValue(key="enable", value="libscrapli")],
+            ),
+            session_options=SessionOptions(
+                operation_timeout_s=30,
+            ),
+            transport_options=TransportTelnetOptions(),
+        )
+
+    return _fake_device_cli
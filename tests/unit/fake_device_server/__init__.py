@@ -0,0 +1 @@
+"""fake_device_server"""
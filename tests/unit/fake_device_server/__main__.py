@@ -0,0 +1,5 @@
+"""fake_device_server.__main__"""
+
+from .server import main
+
+main()
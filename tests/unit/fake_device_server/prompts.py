@@ -0,0 +1,155 @@
+"""fake_device_server.prompts"""
+
+import re
+import string
+
+from scrapli.helper import without_possessive_quantifiers
+
+try:
+    from re import _parser as sre_parse  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover -- python < 3.11
+    import sre_parse  # type: ignore[no-redef]
+
+_PREFERRED_CHARS = string.ascii_lowercase + string.digits + string.ascii_uppercase + "-_.:@/ "
+_MAX_FILL = 63
+
+
+def _class_chars(items: list[tuple[object, object]]) -> str:
+    """Return the (printable) chars allowed by a parsed character class"""
+    negate = any(op is sre_parse.NEGATE for op, _ in items)
+
+    allowed = set()
+
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            allowed.add(chr(av))  # type: ignore[arg-type]
+        elif op is sre_parse.RANGE:
+            lo, hi = av  # type: ignore[misc]
+            allowed.update(chr(c) for c in range(lo, hi + 1))
+        elif op is sre_parse.CATEGORY:
+            allowed.update(_category_chars(av))
+
+    printable = set(string.printable) - set("\t\r\n\x0b\x0c")
+
+    if negate:
+        return "".join(c for c in _PREFERRED_CHARS if c not in allowed)
+
+    return "".join(sorted(allowed & printable, key=lambda c: (_PREFERRED_CHARS.find(c) % 1_000, c)))
+
+
+_CATEGORY_CHARS = {
+    "category_digit": string.digits,
+    "category_not_digit": string.ascii_letters,
+    "category_space": " ",
+    "category_not_space": string.ascii_letters + string.digits + "-_.",
+    "category_word": string.ascii_letters + string.digits + "_",
+    "category_not_word": "-.:",
+}
+
+
+def _category_chars(category: object) -> set[str]:
+    return set(_CATEGORY_CHARS.get(str(category).lower(), ""))
+
+
+def _fill(chars: str, hostname: str, minimum: int, maximum: int) -> str:
+    """Fill a repeat of the given chars, using the hostname where the chars allow it"""
+    if not chars:
+        return ""
+
+    if minimum == 0 and maximum in {1, sre_parse.MAXREPEAT} and len(hostname) == 0:
+        return ""
+
+    usable = "".join(c for c in hostname if c in chars)
+    upper = min(maximum, _MAX_FILL)
+
+    filled = usable[:upper] if usable == hostname else ""
+
+    if len(filled) < minimum:
+        filled += chars[0] * (minimum - len(filled))
+
+    return filled
+
+
+def _sample(parsed: object, hostname: str) -> str:  # noqa: C901, PLR0912
+    out = []
+
+    for op, av in parsed:  # type: ignore[attr-defined]
+        if op is sre_parse.LITERAL:
+            out.append(chr(av))
+        elif op is sre_parse.NOT_LITERAL:
+            out.append("x" if chr(av) != "x" else "y")
+        elif op is sre_parse.ANY:
+            out.append("x")
+        elif op is sre_parse.IN:
+            chars = _class_chars(av)
+            out.append(chars[0] if chars else "x")
+        elif op in {
+            sre_parse.MAX_REPEAT,
+            sre_parse.MIN_REPEAT,
+            getattr(sre_parse, "POSSESSIVE_REPEAT", None),
+        }:
+            minimum, maximum, item = av
+            item = list(item)
+
+            if len(item) == 1 and item[0][0] in {sre_parse.IN, sre_parse.ANY, sre_parse.CATEGORY}:
+                inner_op, inner_av = item[0]
+                if inner_op is sre_parse.IN:
+                    chars = _class_chars(inner_av)
+                elif inner_op is sre_parse.CATEGORY:
+                    chars = "".join(sorted(_category_chars(inner_av)))
+                else:
+                    chars = _PREFERRED_CHARS.strip()
+
+                # only the "name-ish" repeats take the hostname, optional ones are left out
+                out.append(_fill(chars, hostname if minimum > 0 else "", minimum, maximum))
+            else:
+                out.extend(_sample(item, hostname) for _ in range(minimum))
+        elif op is sre_parse.SUBPATTERN:
+            out.append(_sample(av[-1], hostname))
+        elif op is sre_parse.BRANCH:
+            out.append(_sample(av[1][0], hostname))
+        elif op is sre_parse.CATEGORY:
+            chars = sorted(_category_chars(av))
+            out.append(chars[0] if chars else "")
+        elif op is sre_parse.ASSERT and av[0] == 1:
+            # positive lookahead -- i.e. "^(?=\[name\]$).*$", the lookahead *is* the prompt
+            out.append(_sample(av[1], hostname))
+
+    return "".join(out)
+
+
+def derive_prompt(pattern: str, hostname: str, excludes: list[str] | None = None) -> str | None:
+    """
+    Derive a concrete prompt (for the given hostname) matching the given prompt pattern.
+
+    Args:
+        pattern: the (definition) prompt pattern
+        hostname: the hostname to use in the prompt where the pattern allows it
+        excludes: strings the prompt must not contain
+
+    Returns:
+        str | None: the prompt or None if no matching prompt could be derived
+
+    Raises:
+        N/A
+
+    """
+    # python (before 3.11) rejects possessive quantifiers and atomic groups, the rewritten pattern
+    # matches the same prompts either way
+    pattern = without_possessive_quantifiers(pattern)
+
+    compiled = re.compile(pattern, flags=re.MULTILINE)
+    parsed = sre_parse.parse(pattern, flags=re.MULTILINE)
+
+    for name in (hostname, "router", ""):
+        candidate = _sample(parsed, name)
+
+        if not compiled.search(candidate):
+            continue
+
+        if any(exclude in candidate for exclude in excludes or []):
+            continue
+
+        return candidate
+
+    return None
@@ -0,0 +1,497 @@
+"""fake_device_server.server"""
+
+import argparse
+import asyncio
+import contextlib
+import importlib.resources
+import random
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from .prompts import derive_prompt
+
+IAC = 255
+SB = 250
+SE = 240
+WILL, WONT, DO, DONT = 251, 252, 253, 254
+
+EXIT_INPUTS = frozenset(("exit", "quit", "logout"))
+DEFAULT_BACKLOG = 4_096
+
+
+@dataclass
+class Step:
+    """
+    Step is a single instruction of a mode transition.
+
+    Args:
+        input_: the input that triggers the step
+        prompt: the prompt to emit after the input when the step is a prompted one
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    input_: str
+    prompt: str | None = None
+
+
+@dataclass
+class Mode:
+    """
+    Mode is a mode of a fake device, derived from a definition mode.
+
+    Args:
+        name: the mode name
+        prompt: the (concrete) prompt of the mode
+        transitions: the modes reachable from this mode, keyed on the first input
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    name: str
+    prompt: str
+    transitions: dict[str, tuple[str, list[Step]]] = field(default_factory=dict)
+
+
+@dataclass
+class Options:
+    """
+    Options holds the (per server) fake device behavior.
+
+    Args:
+        hostname: hostname to use in the prompts
+        username: username to prompt for, None to only prompt for a password
+        password: password to prompt for, None to not authenticate at all
+        initial_mode: mode sessions start in, defaults to the first mode of the definition
+        output_size: size in bytes of the generated output of "unknown" inputs
+        outputs: output for given inputs, takes precedence over generated output
+        latency_s: delay before sending output
+        latency_jitter_s: random (0..n) delay added to the latency
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    hostname: str = "r1"
+    username: str | None = "admin"
+    password: str | None = "password"
+    initial_mode: str | None = None
+    output_size: int = 256
+    outputs: dict[str, str] = field(default_factory=dict)
+    latency_s: float = 0.0
+    latency_jitter_s: float = 0.0
+
+
+def load_modes(definition_file_or_name: str, hostname: str) -> dict[str, Mode]:
+    """
+    Load the modes of a definition (shipped platform name or a path) as fake device modes.
+
+    Args:
+        definition_file_or_name: shipped definition name, i.e. "arista_eos", or path
+        hostname: hostname to use in the prompts
+
+    Returns:
+        dict[str, Mode]: modes keyed on name, in definition order
+
+    Raises:
+        ValueError: if no prompt can be derived for a mode
+
+    """
+    definition_path = Path(definition_file_or_name)
+    if not definition_path.exists():
+        definition_path = Path(
+            f"{importlib.resources.files('scrapli.definitions')}/{definition_file_or_name}.yaml"
+        )
+
+    definition = yaml.safe_load(definition_path.read_text(encoding="utf-8"))
+
+    modes = {}
+
+    for mode in definition.get("modes") or []:
+        prompt = derive_prompt(
+            pattern=mode["prompt_pattern"],
+            hostname=hostname,
+            excludes=mode.get("prompt_excludes"),
+        )
+        if prompt is None:
+            raise ValueError(f"failed deriving prompt for mode '{mode['name']}'")
+
+        transitions = {}
+
+        for accessible in mode.get("accessible_modes") or []:
+            steps = []
+
+            for instruction in accessible.get("instructions") or []:
+                if "send_input" in instruction:
+                    steps.append(Step(input_=instruction["send_input"]["input"]))
+                elif "send_prompted_input" in instruction:
+                    prompted = instruction["send_prompted_input"]
+                    steps.append(
+                        Step(
+                            input_=prompted["input"],
+                            prompt=prompted.get("prompt_exact")
+                            or derive_prompt(prompted.get("prompt_pattern", ""), hostname)
+                            or "Password:",
+                        )
+                    )
+
+            if steps:
+                transitions[steps[0].input_] = (accessible["name"], steps)
+
+        modes[mode["name"]] = Mode(name=mode["name"], prompt=prompt, transitions=transitions)
+
+    return modes
+
+
+def _strip_telnet_commands(data: bytes) -> bytes:
+    """Drop any telnet negotiation from the data, we never agree to any option"""
+    if IAC not in data:
+        return data
+
+    out = bytearray()
+    idx = 0
+
+    while idx < len(data):
+        byte = data[idx]
+
+        if byte != IAC:
+            out.append(byte)
+            idx += 1
+        elif idx + 1 < len(data) and data[idx + 1] in {WILL, WONT, DO, DONT}:
+            idx += 3
+        elif idx + 1 < len(data) and data[idx + 1] == SB:
+            end = data.find(bytes((IAC, SE)), idx)
+            idx = len(data) if end == -1 else end + 2
+        else:
+            idx += 2
+
+    return bytes(out)
+
+
+class _Session:
+    """A single connected client, the "device" side of a session"""
+
+    def __init__(
+        self,
+        server: "FakeDeviceServer",
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        self.server = server
+        self.reader = reader
+        self.writer = writer
+
+        self.mode = server.modes[server.initial_mode]
+
+        self._buffer = bytearray()
+        self._echo = True
+        self._skip_lf = False
+
+    async def _read_line(self) -> str | None:
+        while True:
+            for idx, byte in enumerate(self._buffer):
+                if byte in b"\r\n":
+                    line = bytes(self._buffer[:idx])
+                    del self._buffer[: idx + 1]
+
+                    # "\r\n" and "\r\0" are a single line ending, the second byte may not have
+                    # been read yet though
+                    if byte == ord("\r"):
+                        if self._buffer[:1] in (b"\n", b"\x00"):
+                            del self._buffer[:1]
+                        elif not self._buffer:
+                            self._skip_lf = True
+
+                    return line.decode(errors="replace")
+
+            data = await self.reader.read(4_096)
+            if not data:
+                return None
+
+            data = _strip_telnet_commands(data)
+
+            if self._skip_lf and data[:1] in {b"\n", b"\x00"}:
+                data = data[1:]
+
+            self._skip_lf = False
+
+            if self._echo:
+                # like a device we echo the input, the line ending is sent along with the output
+                self.writer.write(data.translate(None, b"\r\n\x00"))
+
+            self._buffer.extend(data)
+
+    async def _prompted(self, prompt: str, *, echo: bool) -> str | None:
+        self.writer.write(prompt.encode())
+
+        self._echo = echo
+        try:
+            return await self._read_line()
+        finally:
+            self._echo = True
+
+    async def _authenticate(self) -> bool:
+        options = self.server.options
+
+        if options.password is None:
+            return True
+
+        if options.username is not None:
+            username = await self._prompted("Username: ", echo=True)
+            if username is None:
+                return False
+
+            self.writer.write(b"\r\n")
+
+        password = await self._prompted("Password: ", echo=False)
+        if password is None:
+            return False
+
+        self.writer.write(b"\r\n")
+
+        if password != options.password or (
+            options.username is not None and username != options.username
+        ):
+            self.writer.write(b"% Authentication failed\r\n")
+
+            return False
+
+        return True
+
+    async def _transition(self, target: str, steps: list[Step]) -> bool:
+        for idx, step in enumerate(steps):
+            if idx > 0:
+                line = await self._prompted(f"\r\n{self.mode.prompt}", echo=True)
+                if line is None:
+                    return False
+
+            if step.prompt is not None:
+                response = await self._prompted(f"\r\n{step.prompt} ", echo=False)
+                if response is None:
+                    return False
+
+        self.mode = self.server.modes[target]
+
+        return True
+
+    async def _output(self, input_: str) -> None:
+        options = self.server.options
+
+        latency = options.latency_s + random.uniform(0, options.latency_jitter_s)
+        if latency:
+            await asyncio.sleep(latency)
+
+        output = options.outputs.get(input_)
+        if output is None:
+            output = self.server.generated_output
+        else:
+            output = output.replace("\n", "\r\n")
+
+        self.writer.write(f"\r\n{output}".encode())
+
+    async def run(self) -> None:
+        if not await self._authenticate():
+            return
+
+        self.writer.write(self.mode.prompt.encode())
+
+        while True:
+            await self.writer.drain()
+
+            line = await self._read_line()
+            if line is None:
+                return
+
+            input_ = line.strip()
+
+            if input_ in self.mode.transitions:
+                if not await self._transition(*self.mode.transitions[input_]):
+                    return
+            elif input_ in EXIT_INPUTS:
+                return
+            elif input_:
+                await self._output(input_)
+
+            self.writer.write(f"\r\n{self.mode.prompt}".encode())
+
+
+class FakeDeviceServer:
+    """
+    FakeDeviceServer is an asyncio (telnet) server simulating devices of a given platform.
+
+    Prompts and modes (and how to move between them) are derived from the scrapli definition,
+    so the server can be driven by a Cli of that same platform. Any input that is not a mode
+    change or "exit" is answered with `options.outputs[input]` or `options.output_size` bytes of
+    generated output after `options.latency_s` -- this keeps each session cheap enough to run
+    thousands of concurrent sessions on a single box.
+
+    Args:
+        definition_file_or_name: shipped definition name, i.e. "arista_eos", or path
+        host: host to listen on
+        port: port to listen on, 0 to pick a free port
+        options: fake device behavior options
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+
+    def __init__(
+        self,
+        definition_file_or_name: str = "default",
+        *,
+        host: str = "localhost",
+        port: int = 0,
+        options: Options | None = None,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.options = options or Options()
+
+        self.modes = load_modes(
+            definition_file_or_name=definition_file_or_name, hostname=self.options.hostname
+        )
+        self.initial_mode = self.options.initial_mode or next(iter(self.modes))
+
+        line = b"fake device output line, padding padding padding padding padding\r\n"
+        self.generated_output = (line * (self.options.output_size // len(line) + 1))[
+            : self.options.output_size
+        ].decode()
+
+        self.active_sessions = 0
+        self.total_sessions = 0
+
+        self._server: asyncio.Server | None = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.active_sessions += 1
+        self.total_sessions += 1
+
+        try:
+            await _Session(server=self, reader=reader, writer=writer).run()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.active_sessions -= 1
+
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def start(self) -> None:
+        """Start listening, `port` holds the actual port once started"""
+        self._server = await asyncio.start_server(
+            self._handle, host=self.host, port=self.port, backlog=DEFAULT_BACKLOG
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Stop listening"""
+        if self._server is None:
+            return
+
+        self._server.close()
+        if hasattr(self._server, "close_clients"):
+            # 3.12+ waits for all (client) connections to close when closing the server
+            self._server.close_clients()
+        await self._server.wait_closed()
+
+        self._server = None
+
+    async def __aenter__(self) -> "FakeDeviceServer":
+        await self.start()
+
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.stop()
+
+    @contextlib.contextmanager
+    def serve_in_thread(self) -> Iterator["FakeDeviceServer"]:
+        """Run the server on its own event loop in a (daemon) thread, i.e. for sync tests"""
+        loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def _run() -> None:
+            asyncio.set_event_loop(loop)
+            loop.run_until_complete(self.start())
+            started.set()
+            loop.run_forever()
+
+        thread = threading.Thread(target=_run, daemon=True)
+        thread.start()
+        started.wait()
+
+        try:
+            yield self
+        finally:
+            asyncio.run_coroutine_threadsafe(self.stop(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+
+def main() -> None:
+    """Run a fake device server until interrupted."""
+    parser = argparse.ArgumentParser(description="scrapli fake device server")
+    parser.add_argument("--definition", default="default")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=2323)
+    parser.add_argument("--hostname", default="r1")
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="password")
+    parser.add_argument("--no-username", action="store_true", help="only prompt for a password")
+    parser.add_argument("--initial-mode", default=None)
+    parser.add_argument("--output-size", type=int, default=256)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--latency-jitter", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = FakeDeviceServer(
+        args.definition,
+        host=args.host,
+        port=args.port,
+        options=Options(
+            hostname=args.hostname,
+            username=None if args.no_username else args.username,
+            password=args.password,
+            initial_mode=args.initial_mode,
+            output_size=args.output_size,
+            latency_s=args.latency,
+            latency_jitter_s=args.latency_jitter,
+        ),
+    )
+
+    async def _serve() -> None:
+        async with server:
+            print(f"fake device server listening on {server.host}:{server.port}...")
+            await asyncio.Event().wait()
+
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_serve())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+fake_device_server.ssh_stand_in
+
+Stand-in for the ssh binary of the bin transport -- i.e.
+`TransportBinOptions(bin=".../ssh_stand_in.py")` -- that simply pipes the pty to a fake device
+server. The port is taken from the "-p" argument libscrapli passes (the host is always the local
+server), start the server with `--no-username` as ssh only ever prompts for a password in channel.
+"""
+
+import os
+import selectors
+import socket
+import sys
+import termios
+import tty
+
+
+def _port(argv: list[str]) -> int:
+    for idx, arg in enumerate(argv):
+        if arg == "-p" and idx + 1 < len(argv):
+            return int(argv[idx + 1])
+
+    return int(os.environ.get("FAKE_DEVICE_SERVER_PORT", "2323"))
+
+
+def main() -> None:
+    """Pipe stdin/stdout to the fake device server until either side closes."""
+    host = os.environ.get("FAKE_DEVICE_SERVER_HOST", "localhost")
+    conn = socket.create_connection((host, _port(sys.argv[1:])))
+
+    stdin = sys.stdin.fileno()
+    stdout = sys.stdout.fileno()
+
+    # like ssh, put the pty in raw mode so the only echo is the "device" echo
+    old_attrs = termios.tcgetattr(stdin) if os.isatty(stdin) else None
+    if old_attrs is not None:
+        tty.setraw(stdin)
+
+    sel = selectors.DefaultSelector()
+    sel.register(stdin, selectors.EVENT_READ)
+    sel.register(conn, selectors.EVENT_READ)
+
+    try:
+        while True:
+            for key, _ in sel.select():
+                if key.fileobj is conn:
+                    data = conn.recv(65_536)
+                    if not data:
+                        return
+
+                    os.write(stdout, data)
+                else:
+                    data = os.read(stdin, 65_536)
+                    if not data:
+                        return
+
+                    conn.sendall(data)
+    finally:
+        if old_attrs is not None:
+            termios.tcsetattr(stdin, termios.TCSADRAIN, old_attrs)
+
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
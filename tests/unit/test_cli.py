@@ -2,7 +2,7 @@ from time import sleep
 
 import pytest
 
-from scrapli.cli import Cli, InputHandling, ReadCallback
+from scrapli.cli import Cli, InputHandling, ReadCallback, _AdaptiveChunkSize
 
 READ_ARGNAMES = (
     "size",
@@ -308,6 +308,40 @@ async def test_send_inputs_async(inputs, cli, cli_assert_result):
         cli_assert_result(actual=actual)
 
 
+def test_iter_send_inputs(fake_device_server, fake_device_cli, monkeypatch):
+    monkeypatch.setitem(fake_device_server.options.outputs, "show bad", "% Invalid input")
+
+    sent = []
+
+    def _inputs():
+        for input_ in ("show version", "show bad", "show clock"):
+            sent.append(input_)
+            yield input_
+
+    with fake_device_cli() as c:
+        results = list(c.iter_send_inputs(inputs=_inputs()))
+
+    assert [result.failed for result in results] == [False, True]
+    # stopped at the indicated failure, the last input is never even taken from the iterable
+    assert sent == ["show version", "show bad"]
+
+
+@pytest.mark.asyncio
+async def test_iter_send_inputs_async(fake_device_server, fake_device_cli, monkeypatch):
+    monkeypatch.setitem(fake_device_server.options.outputs, "show bad", "% Invalid input")
+
+    async with fake_device_cli() as c:
+        results = [
+            result
+            async for result in c.iter_send_inputs_async(
+                inputs=["show version", "show bad", "show clock"],
+                stop_on_indicated_failure=False,
+            )
+        ]
+
+    assert [result.failed for result in results] == [False, True, False]
+
+
 SEND_INPUTS_FROM_FILE_ARGNAMES = ("f",)
 SEND_INPUTS_FROM_FILE_ARGVALUES = (
     ("tests/unit/fixtures/cli/_inputs_from_file_single",),
@@ -342,6 +376,45 @@ async def test_send_inputs_from_file_async(f, cli, cli_assert_result):
         cli_assert_result(actual=actual)
 
 
+ADAPTIVE_CHUNK_SIZE = 10
+
+
+def test_adaptive_chunk_size():
+    chunk = _AdaptiveChunkSize(
+        ADAPTIVE_CHUNK_SIZE, adaptive=True, target_duration_s=1.0, max_size=100
+    )
+
+    # fast inputs grow the chunk, but at most double it per chunk
+    chunk.observe(inputs=ADAPTIVE_CHUNK_SIZE, elapsed_s=0.01)
+    assert chunk.size == ADAPTIVE_CHUNK_SIZE * 2
+
+    # slow inputs shrink it right away
+    chunk.observe(inputs=ADAPTIVE_CHUNK_SIZE * 2, elapsed_s=20.0)
+    assert chunk.size == 1
+
+    fixed = _AdaptiveChunkSize(ADAPTIVE_CHUNK_SIZE, adaptive=False)
+    fixed.observe(inputs=ADAPTIVE_CHUNK_SIZE, elapsed_s=0.01)
+    assert fixed.size == ADAPTIVE_CHUNK_SIZE
+
+
+FROM_FILE_INPUTS = 5
+
+
+def test_iter_send_inputs_from_file(fake_device_cli, tmp_path):
+    f = tmp_path / "inputs"
+    f.write_text("\n".join(f"show version {idx}" for idx in range(FROM_FILE_INPUTS)) + "\n")
+
+    with fake_device_cli() as c:
+        results = list(c.iter_send_inputs_from_file(f=str(f), chunk_size=2))
+
+        assert [len(result.inputs) for result in results] == [2, 2, 1]
+
+        combined = c.send_inputs_from_file(f=str(f), chunk_size=2)
+
+    assert combined.inputs == [f"show version {idx}" for idx in range(FROM_FILE_INPUTS)]
+    assert len(combined.results) == FROM_FILE_INPUTS
+
+
 SEND_PROMPTED_INPUT_ARGNAMES = (
     "input_",
     "prompt",
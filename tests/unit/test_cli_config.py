@@ -0,0 +1,283 @@
+import pytest
+
+from scrapli.cli_config import (
+    PushedConfigCache,
+    config_digest,
+    diff_config,
+    parse_config,
+)
+
+RUNNING_CONFIG = """Building configuration...
+
+Current configuration : 321 bytes
+!
+hostname old
+!
+interface Ethernet1
+   description uplink
+   shutdown
+!
+interface Ethernet2
+   description old
+!
+router bgp 65000
+   neighbor 10.0.0.1 remote-as 65001
+   address-family ipv4
+      network 10.0.0.0/24
+!
+no ip routing
+end
+"""
+
+
+def test_parse_config():
+    root = parse_config(RUNNING_CONFIG)
+
+    assert list(root.children) == [
+        "hostname old",
+        "interface Ethernet1",
+        "interface Ethernet2",
+        "router bgp 65000",
+        "no ip routing",
+    ]
+
+    bgp = root.children["router bgp 65000"]
+    assert list(bgp.children["address-family ipv4"].children) == ["network 10.0.0.0/24"]
+
+
+def test_diff_config():
+    desired = """hostname new
+interface Ethernet1
+   description uplink
+   no shutdown
+router bgp 65000
+   neighbor 10.0.0.1 remote-as 65001
+   address-family ipv4
+      network 10.0.0.0/24
+      network 10.1.0.0/24
+interface Ethernet3
+   description new
+"""
+
+    assert diff_config(desired=desired, running=RUNNING_CONFIG) == [
+        "no hostname old",
+        "no interface Ethernet2",
+        "ip routing",
+        "hostname new",
+        "interface Ethernet1",
+        "no shutdown",
+        "exit",
+        "router bgp 65000",
+        "address-family ipv4",
+        "network 10.1.0.0/24",
+        "exit",
+        "exit",
+        "interface Ethernet3",
+        "description new",
+        "exit",
+    ]
+
+
+@pytest.mark.parametrize(
+    "desired",
+    (
+        RUNNING_CONFIG,
+        # whitespace, comments and headers dont matter
+        "\n".join(line for line in RUNNING_CONFIG.splitlines() if not line.startswith("!")),
+    ),
+    ids=("identical", "cosmetic"),
+)
+def test_diff_config_no_changes(desired):
+    assert diff_config(desired=desired, running=RUNNING_CONFIG) == []
+
+
+def test_diff_config_custom_commands():
+    actual = diff_config(
+        desired="interfaces\n  ge-0/0/0\n",
+        running="interfaces\n  ge-0/0/1\n",
+        negate_prefix="delete ",
+        exit_command="up",
+    )
+
+    assert actual == ["interfaces", "delete ge-0/0/1", "ge-0/0/0", "up"]
+
+
+ACL_RUNNING_CONFIG = """ip access-list extended EDGE
+   permit tcp any any eq 22
+   deny ip any any
+interface Ethernet1
+   description uplink
+"""
+
+
+@pytest.mark.parametrize(
+    ("desired", "expected"),
+    (
+        (
+            # appended entries can be added in place
+            ACL_RUNNING_CONFIG.replace(
+                "   deny ip any any\n", "   deny ip any any\n   remark end\n"
+            ),
+            ["ip access-list extended EDGE", "remark end", "exit"],
+        ),
+        (
+            # an entry inserted before the final deny replaces the whole access list
+            ACL_RUNNING_CONFIG.replace(
+                "   deny ip any any\n", "   permit tcp any any eq 443\n   deny ip any any\n"
+            ),
+            [
+                "no ip access-list extended EDGE",
+                "ip access-list extended EDGE",
+                "permit tcp any any eq 22",
+                "permit tcp any any eq 443",
+                "deny ip any any",
+                "exit",
+            ],
+        ),
+        (
+            # as does reordering entries
+            """ip access-list extended EDGE
+   deny ip any any
+   permit tcp any any eq 22
+interface Ethernet1
+   description uplink
+""",
+            [
+                "no ip access-list extended EDGE",
+                "ip access-list extended EDGE",
+                "deny ip any any",
+                "permit tcp any any eq 22",
+                "exit",
+            ],
+        ),
+        (
+            # order of other (unordered) blocks does not matter
+            """interface Ethernet1
+   description uplink
+ip access-list extended EDGE
+   permit tcp any any eq 22
+   deny ip any any
+""",
+            [],
+        ),
+    ),
+    ids=("appended", "inserted", "reordered", "unordered"),
+)
+def test_diff_config_ordered(desired, expected):
+    assert diff_config(desired=desired, running=ACL_RUNNING_CONFIG) == expected
+
+
+DEVICE_MANAGED_RUNNING_CONFIG = """version 17.3
+boot-start-marker
+boot-end-marker
+!
+hostname r1
+!
+banner motd ^C
+authorized access only
+  hostname r2
+^C
+crypto pki certificate chain TP-self-signed-1
+ certificate self-signed 01
+  3082022B 30820194 A0030201
+  \tquit
+"""
+
+
+def test_diff_config_ignore():
+    # device managed lines and banner/certificate bodies are left alone by default
+    assert diff_config(desired="hostname r2\n", running=DEVICE_MANAGED_RUNNING_CONFIG) == [
+        "no hostname r1",
+        "hostname r2",
+    ]
+
+    assert diff_config(
+        desired="hostname r1\n", running=DEVICE_MANAGED_RUNNING_CONFIG, ignore=()
+    ) == [
+        "no version 17.3",
+        "no boot-start-marker",
+        "no boot-end-marker",
+        "no banner motd ^C",
+        "no crypto pki certificate chain TP-self-signed-1",
+    ]
+
+
+def test_diff_config_scope():
+    desired = """hostname new
+interface Ethernet3
+   description new
+"""
+
+    assert diff_config(desired=desired, running=RUNNING_CONFIG, scope=(r"interface ",)) == [
+        "no interface Ethernet1",
+        "no interface Ethernet2",
+        "interface Ethernet3",
+        "description new",
+        "exit",
+    ]
+
+
+def test_parse_config_banner():
+    root = parse_config(
+        DEVICE_MANAGED_RUNNING_CONFIG + "banner login\nhello\nEOF\nbanner exec ^Chi^C\n"
+    )
+
+    assert list(root.children["banner motd ^C"].children) == [
+        "authorized access only",
+        "hostname r2",
+        "^C",
+    ]
+    assert list(root.children["banner login"].children) == ["hello", "EOF"]
+    assert not root.children["banner exec ^Chi^C"].children
+    assert "hostname r2" not in root.children
+
+
+def test_config_digest():
+    assert config_digest(RUNNING_CONFIG) == config_digest(RUNNING_CONFIG.replace("!\n", ""))
+    assert config_digest(RUNNING_CONFIG) != config_digest(RUNNING_CONFIG.replace("old", "new"))
+    assert config_digest(RUNNING_CONFIG) != config_digest(RUNNING_CONFIG, context="scoped")
+
+
+PUSHED_CONFIG_CACHE_MAX_ENTRIES = 2
+
+
+def test_pushed_config_cache():
+    cache = PushedConfigCache(max_entries=PUSHED_CONFIG_CACHE_MAX_ENTRIES)
+
+    assert cache.get(host="a", port=22) is None
+
+    cache.set(host="a", port=22, digest="foo")
+    cache.set(host="b", port=22, digest="bar")
+    assert cache.get(host="a", port=22) == "foo"
+
+    # b is the least recently used
+    cache.set(host="c", port=22, digest="baz")
+    assert len(cache) == PUSHED_CONFIG_CACHE_MAX_ENTRIES
+    assert cache.get(host="b", port=22) is None
+
+    cache.invalidate(host="a", port=22)
+    assert cache.get(host="a", port=22) is None
+
+
+def test_push_config(fake_device_server, fake_device_cli, monkeypatch):
+    monkeypatch.setitem(
+        fake_device_server.options.outputs,
+        "show running-config",
+        "hostname old\nip routing\n",
+    )
+
+    cache = PushedConfigCache()
+
+    with fake_device_cli() as c:
+        actual = c.push_config("hostname new\nip routing\n", cache=cache)
+
+        assert actual.changed
+        assert not actual.failed
+        assert actual.inputs == ["no hostname old", "hostname new"]
+        assert actual.result.inputs == actual.inputs
+
+        # unchanged config, nothing fetched or sent
+        actual = c.push_config("hostname new\nip routing\n", cache=cache)
+
+        assert actual.cached
+        assert not actual.changed
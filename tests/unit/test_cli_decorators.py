@@ -5,6 +5,9 @@ import pytest
 from scrapli import Cli
 from scrapli.cli_decorators import handle_operation_timeout, handle_operation_timeout_async
 
+# applying the operation timeout and then restoring the session timeout
+TIMEOUT_SET_AND_RESTORED_CALLS = 2
+
 
 def test_handle_operation_timeout_unmodified():
     c = Cli(
@@ -86,3 +89,72 @@ async def test_handle_operation_timeout_async_modified():
     await c.fooer(c, operation_timeout_ns=1)
 
     assert c.ffi_mapping.session_mapping.set_operation_timeout_ns.called is True
+
+
+def test_handle_operation_timeout_skips_redundant_sets():
+    c = Cli(
+        definition_file_or_name="nokia_srlinux",
+        host="localhost",
+    )
+
+    c.ffi_mapping = Mock()
+    c.ffi_mapping.session_mapping.set_operation_timeout_ns = Mock(return_value=0)
+    c.ptr = 1
+
+    @handle_operation_timeout
+    def fooer(cls, *, operation_timeout_ns: int | None = None) -> str:
+        return "foo'd"
+
+    c.fooer = fooer
+
+    c.fooer(c, operation_timeout_ns=1)
+    c.fooer(c, operation_timeout_ns=1)
+
+    assert c.ffi_mapping.session_mapping.set_operation_timeout_ns.call_count == 1
+
+    # back to the session timeout, once
+    c.fooer(c)
+    c.fooer(c)
+
+    assert (
+        c.ffi_mapping.session_mapping.set_operation_timeout_ns.call_count
+        == TIMEOUT_SET_AND_RESTORED_CALLS
+    )
+
+
+def test_handle_operation_timeout_nested():
+    c = Cli(
+        definition_file_or_name="nokia_srlinux",
+        host="localhost",
+    )
+
+    c.ffi_mapping = Mock()
+    c.ffi_mapping.session_mapping.set_operation_timeout_ns = Mock(return_value=0)
+    c.ptr = 1
+
+    applied = []
+
+    @handle_operation_timeout
+    def inner(cls, *, operation_timeout_ns: int | None = None) -> str:
+        applied.append(cls._operation_timeout_ns)
+
+        return "foo'd"
+
+    @handle_operation_timeout
+    def outer(cls, *, operation_timeout_ns: int | None = None) -> str:
+        return cls.inner(cls)
+
+    c.inner = inner
+    c.outer = outer
+
+    # the inner operation keeps the timeout of the outer one rather than the session timeout
+    c.outer(c, operation_timeout_ns=1)
+
+    assert applied == [1]
+    assert c.ffi_mapping.session_mapping.set_operation_timeout_ns.call_count == 1
+
+    # and only while nested
+    c.inner(c)
+
+    assert applied == [1, c._operation_timeout_ns]
+    assert applied[-1] != 1
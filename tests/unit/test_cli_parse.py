@@ -1,9 +1,18 @@
+from collections import OrderedDict
 from importlib import resources
-from io import TextIOWrapper
+from io import StringIO, TextIOWrapper
 
 import pytest
 
-from scrapli.cli_parse import textfsm_get_template, textfsm_parse
+from scrapli import cli_parse
+from scrapli.cli_parse import (
+    TextFSMStreamParser,
+    genie_parse,
+    genie_parse_many,
+    textfsm_get_template,
+    textfsm_parse,
+    textfsm_parse_iter,
+)
 from scrapli.exceptions import ParsingException
 
 IOS_ARP = """Protocol  Address          Age (min)  Hardware Addr   Type   Interface
@@ -117,3 +126,129 @@ def test_textfsm_parse_failed_to_parse():
 
     with pytest.raises(ParsingException):
         textfsm_parse(template, "not really arp data")
+
+
+def test_genie_parse_caches_device_and_parser(monkeypatch):
+    devices = []
+    get_parser_calls = []
+
+    class FakeDevice:
+        def __init__(self, name, custom, os):
+            devices.append(os)
+
+    class FakeParser:
+        def __init__(self, device):
+            self.device = device
+
+        def parse(self, output, **kwargs):
+            return {"output": output, **kwargs}
+
+    def fake_get_parser(command, device):
+        get_parser_calls.append(command)
+
+        return FakeParser, {"vrf": "default"}
+
+    monkeypatch.setattr(cli_parse, "_genie_load", lambda: (FakeDevice, fake_get_parser))
+    monkeypatch.setattr(cli_parse, "_genie_devices", {})
+    monkeypatch.setattr(cli_parse, "_genie_parsers", OrderedDict())
+
+    actual = genie_parse_many(
+        "iosxe",
+        [("show ip arp", "one"), ("show ip arp", "two"), ("show version", "three")],
+    )
+
+    assert actual == [
+        {"output": "one", "vrf": "default"},
+        {"output": "two", "vrf": "default"},
+        {"output": "three", "vrf": "default"},
+    ]
+    assert devices == ["iosxe"]
+    assert get_parser_calls == ["show ip arp", "show version"]
+
+    assert genie_parse("iosxe", "show ip arp", "four") == {"output": "four", "vrf": "default"}
+    assert devices == ["iosxe"]
+    assert get_parser_calls == ["show ip arp", "show version"]
+
+
+def test_genie_parsers_bounded(monkeypatch):
+    get_parser_calls = []
+
+    def fake_get_parser(command, device):
+        get_parser_calls.append(command)
+
+        return object, {}
+
+    monkeypatch.setattr(
+        cli_parse, "_genie_load", lambda: (lambda *args, **kwargs: None, fake_get_parser)
+    )
+    monkeypatch.setattr(cli_parse, "_genie_devices", {})
+    monkeypatch.setattr(cli_parse, "_genie_parsers", OrderedDict())
+    monkeypatch.setattr(cli_parse, "GENIE_PARSERS_MAX_ENTRIES", 2)
+
+    for command in ("show int eth1", "show int eth2", "show int eth1", "show int eth3"):
+        cli_parse._genie_get_parser_for_command(platform="iosxe", command=command)
+
+    # eth2 was the least recently used when eth3 was added
+    assert list(cli_parse._genie_parsers) == [
+        ("iosxe", "show int eth1"),
+        ("iosxe", "show int eth3"),
+    ]
+
+    cli_parse._genie_get_parser_for_command(platform="iosxe", command="show int eth2")
+    assert get_parser_calls == ["show int eth1", "show int eth2", "show int eth3", "show int eth2"]
+
+
+@pytest.mark.parametrize(
+    "chunk_size",
+    [1, 7, 1_024],
+    ids=["single-char", "small", "large"],
+)
+def test_textfsm_parse_iter(chunk_size):
+    template = textfsm_get_template("cisco_ios", "show ip arp")
+    chunks = [IOS_ARP[i : i + chunk_size] for i in range(0, len(IOS_ARP), chunk_size)]
+
+    actual = list(textfsm_parse_iter(template.name, chunks))
+
+    assert actual == textfsm_parse(template, IOS_ARP)
+
+
+END_TEMPLATE = """Value NAME (\\S+)
+
+Start
+  ^name ${{NAME}} -> Record
+  ^${{NAME}}$$ -> {transition}
+"""
+END_OUTPUT = "name a\nb\nname c\nname d\n"
+
+
+@pytest.mark.parametrize("transition", ["End", "Record EOF"])
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1_024])
+def test_textfsm_parse_iter_end_state(transition, chunk_size):
+    template = END_TEMPLATE.format(transition=transition)
+    chunks = [END_OUTPUT[i : i + chunk_size] for i in range(0, len(END_OUTPUT), chunk_size)]
+
+    actual = list(textfsm_parse_iter(StringIO(template), chunks))
+
+    # nothing after the End/EOF transition is parsed, regardless of where the chunks split
+    assert actual == textfsm_parse(StringIO(template), END_OUTPUT)
+
+
+def test_textfsm_stream_parser_yields_incrementally():
+    template = textfsm_get_template("cisco_ios", "show ip arp")
+    lines = IOS_ARP.splitlines(keepends=True)
+
+    parser = TextFSMStreamParser(template=template, to_dict=False)
+
+    assert parser.feed(lines[0]) == []
+    # a partial line is held until its newline arrives
+    assert parser.feed(lines[1][:10]) == []
+    assert parser.feed(lines[1][10:]) == [
+        ["Internet", "172.31.254.1", "-", "0000.0c07.acfe", "ARPA", "Vlan254"]
+    ]
+    assert parser.feed(lines[2]) == [
+        ["Internet", "172.31.254.2", "-", "c800.84b2.e9c2", "ARPA", "Vlan254"]
+    ]
+    assert parser.close() == []
+
+    with pytest.raises(ParsingException):
+        parser.feed("foo")
@@ -0,0 +1,111 @@
+import pytest
+
+from scrapli.cli_parse_cache import ParseCache
+
+EXPECTED_HITS = 2
+MAX_ENTRIES = 2
+
+
+def test_parse_cache_hit_miss():
+    cache = ParseCache()
+    key = ParseCache.key(
+        engine="textfsm", platform="cisco_ios", command="show ip arp", output="foo"
+    )
+
+    assert cache.get(key=key) is None
+
+    cache.set(key=key, value=[{"foo": "bar"}])
+
+    actual = cache.get(key=key)
+    assert actual == [{"foo": "bar"}]
+
+    # hits are copies, mutating them doesnt poison the cache
+    actual[0]["foo"] = "baz"
+    assert cache.get(key=key) == [{"foo": "bar"}]
+
+    stats = cache.stats
+    assert stats.hits == EXPECTED_HITS
+    assert stats.misses == 1
+    assert stats.entries == 1
+
+
+def test_parse_cache_key():
+    key = ParseCache.key(engine="genie", platform="iosxe", command="show version", output="foo")
+
+    assert key == ParseCache.key(
+        engine="genie", platform="iosxe", command="show version", output="foo"
+    )
+    assert key != ParseCache.key(
+        engine="genie", platform="iosxe", command="show version", output="bar"
+    )
+    assert key != ParseCache.key(
+        engine="textfsm", platform="iosxe", command="show version", output="foo"
+    )
+
+
+def test_parse_cache_eviction():
+    cache = ParseCache(max_entries=MAX_ENTRIES)
+
+    cache.set(key="a", value=["a"])
+    cache.set(key="b", value=["b"])
+
+    # touch a so b is the least recently used
+    assert cache.get(key="a") == ["a"]
+
+    cache.set(key="c", value=["c"])
+
+    assert cache.get(key="b") is None
+    assert cache.get(key="a") == ["a"]
+    assert cache.get(key="c") == ["c"]
+    assert cache.stats.evictions == 1
+    assert len(cache) == MAX_ENTRIES
+
+
+def test_parse_cache_disk(tmp_path):
+    cache = ParseCache(disk_path=str(tmp_path))
+
+    cache.set(key="a", value={"a": 1})
+
+    fresh_cache = ParseCache(disk_path=str(tmp_path))
+
+    assert fresh_cache.get(key="a") == {"a": 1}
+    assert fresh_cache.stats.hits == 1
+    assert len(fresh_cache) == 1
+
+
+@pytest.mark.parametrize(
+    "value",
+    (
+        {1: {"a": "b"}},
+        {"a": (1, 2)},
+        [{"a": {2: (3,)}}],
+    ),
+    ids=("int-keys", "tuple-values", "nested"),
+)
+def test_parse_cache_not_json_safe(value):
+    cache = ParseCache()
+
+    cache.set(key="a", value=value)
+
+    # caching would change the value (int keys to str, tuples to lists), so it is not cached
+    assert cache.get(key="a") is None
+    assert len(cache) == 0
+
+
+def test_parse_cache_disk_corrupt(tmp_path):
+    (tmp_path / "a.json").write_text('{"a": ', encoding="utf-8")
+
+    cache = ParseCache(disk_path=str(tmp_path))
+
+    assert cache.get(key="a") is None
+    assert cache.stats.misses == 1
+    assert not (tmp_path / "a.json").exists()
+
+
+def test_parse_cache_disk_eviction(tmp_path):
+    cache = ParseCache(disk_path=str(tmp_path), max_disk_entries=1)
+
+    cache.set(key="a", value={"a": 1})
+    cache.set(key="b", value={"b": 1})
+
+    assert len(list(tmp_path.glob("*.json"))) == 1
@@ -1,7 +1,10 @@
 import pytest
 
+from scrapli import cli_result
 from scrapli.cli_parse import textfsm_get_template
+from scrapli.cli_parse_cache import ParseCache
 from scrapli.cli_result import Result
+from scrapli.exceptions import ScrapliException
 
 
 @pytest.mark.parametrize(
@@ -98,3 +101,139 @@ Internet  172.31.254.2            -   c800.84b2.e9c2  ARPA   Vlan254"""
     )
 
     assert r.textfsm_parse(template=template)[0] == expected
+
+
+def test_result_textfsm_parse_cached(monkeypatch):
+    result = """
+Protocol  Address          Age (min)  Hardware Addr   Type   Interface
+Internet  172.31.254.1            -   0000.0c07.acfe  ARPA   Vlan254
+Internet  172.31.254.2            -   c800.84b2.e9c2  ARPA   Vlan254"""
+
+    _input = b"show ip arp"
+
+    r = Result(
+        host="localhost",
+        port=22,
+        inputs=_input,
+        input_lens=[len(_input)],
+        start_time=0,
+        splits=[1],
+        result_raw_journals=b"",
+        result_raw_journal_lens=[0],
+        results=result.encode(),
+        result_lens=[len(result)],
+        results_failed_indicator="",
+        textfsm_platform="cisco_ios",
+        genie_platform="iosxe",
+    )
+
+    cache = ParseCache()
+
+    expected = r.textfsm_parse(cache=cache)
+
+    def _textfsm_parse(*args, **kwargs):
+        raise AssertionError("should have been served from the cache")
+
+    monkeypatch.setattr(cli_result, "textfsm_parse", _textfsm_parse)
+
+    assert r.textfsm_parse(cache=cache) == expected
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_result_genie_parse_cached_matches_uncached(monkeypatch):
+    _input = b"show interfaces"
+    result = "foo"
+
+    r = Result(
+        host="localhost",
+        port=22,
+        inputs=_input,
+        input_lens=[len(_input)],
+        start_time=0,
+        splits=[1],
+        result_raw_journals=b"",
+        result_raw_journal_lens=[0],
+        results=result.encode(),
+        result_lens=[len(result)],
+        results_failed_indicator="",
+        textfsm_platform="cisco_ios",
+        genie_platform="iosxe",
+    )
+
+    # genie output often has int keys (i.e. vlan ids) and tuple values
+    monkeypatch.setattr(cli_result, "genie_parse", lambda *args: {1: {"vlan": (1, "default")}})
+
+    cache = ParseCache()
+
+    miss = r.genie_parse(cache=cache)
+    hit = r.genie_parse(cache=cache)
+
+    assert hit == miss == {1: {"vlan": (1, "default")}}
+
+
+def test_result_spooled(tmp_path):
+    results = ["foo\n", "bär\n" * 3]
+    packed = "".join(results).encode()
+
+    spool_path = tmp_path / "spool"
+
+    with open(spool_path, "wb") as f:
+        f.write(b"preamble")
+        f.write(packed)
+
+    _inputs = [b"show foo", b"show bar"]
+
+    with open(spool_path, "rb") as f:
+        r = Result(
+            host="localhost",
+            port=22,
+            inputs=b"".join(_inputs),
+            input_lens=[len(i) for i in _inputs],
+            start_time=0,
+            splits=[1, 2],
+            result_raw_journals=b"",
+            result_raw_journal_lens=[0, 0],
+            results=b"",
+            result_lens=[len(r.encode()) for r in results],
+            results_failed_indicator="",
+            textfsm_platform="cisco_ios",
+            genie_platform="iosxe",
+            results_spool=f,
+            results_spool_offset=len(b"preamble"),
+        )
+
+        assert r.spooled is True
+        assert bytes(r.results_view(1)) == results[1].encode()
+
+        # chunk size of 2 splits the multi byte "ä"
+        assert "".join(r.iter_result_chunks(index=1, chunk_size=2)) == results[1]
+
+        assert r.results == results
+        assert r.spooled is False
+
+
+def test_result_without_raw_journals():
+    result = "foo"
+
+    r = Result(
+        host="localhost",
+        port=22,
+        inputs=["show foo"],
+        input_lens=[],
+        start_time=0,
+        splits=[1],
+        result_raw_journals=None,
+        result_raw_journal_lens=[],
+        results=result.encode(),
+        result_lens=[len(result)],
+        results_failed_indicator="",
+        textfsm_platform="cisco_ios",
+        genie_platform="iosxe",
+    )
+
+    assert r.inputs == ["show foo"]
+    assert r.result == result
+
+    with pytest.raises(ScrapliException):
+        _ = r.results_raw
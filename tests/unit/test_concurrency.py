@@ -50,3 +50,28 @@ async def test_concurrency_async(dummy_ssh_server, concurrency_cli):
             assert result.failed is False
 
     await asyncio.gather(*(_open_and_send_input() for _ in range(CONCURRENCY_COUNT)))
+
+
+def test_concurrency_fake_device(fake_device_cli):
+    def _open_and_send_input() -> None:
+        with fake_device_cli() as c:
+            result = c.send_input(input_="show version")
+
+            assert result.failed is False
+
+    with ThreadPoolExecutor(max_workers=CONCURRENCY_COUNT) as executor:
+        futures = [executor.submit(_open_and_send_input) for _ in range(CONCURRENCY_COUNT)]
+
+        for future in futures:
+            future.result()
+
+
+@pytest.mark.asyncio
+async def test_concurrency_fake_device_async(fake_device_cli):
+    async def _open_and_send_input() -> None:
+        async with fake_device_cli() as c:
+            result = await c.send_input_async(input_="show version")
+
+            assert result.failed is False
+
+    await asyncio.gather(*(_open_and_send_input() for _ in range(CONCURRENCY_COUNT)))
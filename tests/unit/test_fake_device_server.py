@@ -0,0 +1,102 @@
+import asyncio
+import importlib.resources
+import re
+from pathlib import Path
+
+import pytest
+import yaml
+from fake_device_server.prompts import derive_prompt
+from fake_device_server.server import FakeDeviceServer, Options
+
+from scrapli.helper import without_possessive_quantifiers
+
+DEFINITIONS = sorted(
+    p.stem for p in Path(f"{importlib.resources.files('scrapli.definitions')}").glob("*.yaml")
+)
+
+CONCURRENT_SESSIONS = 500
+OUTPUT_SIZE = 64
+
+
+@pytest.mark.parametrize("platform", DEFINITIONS)
+def test_derive_prompt(platform):
+    definition = yaml.safe_load(
+        Path(f"{importlib.resources.files('scrapli.definitions')}/{platform}.yaml").read_text()
+    )
+
+    for mode in definition.get("modes") or []:
+        prompt = derive_prompt(
+            pattern=mode["prompt_pattern"],
+            hostname="r1",
+            excludes=mode.get("prompt_excludes"),
+        )
+
+        assert prompt is not None
+        assert re.search(
+            without_possessive_quantifiers(mode["prompt_pattern"]), prompt, flags=re.MULTILINE
+        )
+
+
+async def _read_until(reader: asyncio.StreamReader, expected: bytes) -> bytes:
+    return await asyncio.wait_for(reader.readuntil(expected), timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_fake_device_server():
+    async with FakeDeviceServer(
+        "arista_eos",
+        options=Options(outputs={"show version": "Arista vEOS\nversion 1"}),
+    ) as server:
+        reader, writer = await asyncio.open_connection(server.host, server.port)
+
+        await _read_until(reader, b"Username: ")
+        writer.write(b"admin\n")
+        await _read_until(reader, b"Password: ")
+        writer.write(b"password\n")
+        assert (await _read_until(reader, b">")).endswith(b"\r\nr1>")
+
+        writer.write(b"enable\n")
+        await _read_until(reader, b"Password: ")
+        writer.write(b"libscrapli\n")
+        await _read_until(reader, b"r1#")
+
+        writer.write(b"show version\r\n")
+        assert (
+            await _read_until(reader, b"r1#") == b"show version\r\nArista vEOS\r\nversion 1\r\nr1#"
+        )
+
+        writer.write(b"configure terminal\n")
+        await _read_until(reader, b"r1(config)#")
+
+        writer.write(b"show run\n")
+        output = await _read_until(reader, b"r1(config)#")
+        assert len(output) == len(b"show run\r\n") + 256 + len(b"\r\nr1(config)#")
+
+        writer.write(b"end\n")
+        await _read_until(reader, b"r1#")
+
+        writer.write(b"exit\n")
+        assert await asyncio.wait_for(reader.read(), timeout=5) == b"exit"
+
+        writer.close()
+
+
+@pytest.mark.asyncio
+async def test_fake_device_server_concurrency():
+    async def _session(port: int) -> bytes:
+        reader, writer = await asyncio.open_connection("localhost", port)
+
+        await _read_until(reader, b"#")
+        writer.write(b"show version\nexit\n")
+        output = await asyncio.wait_for(reader.read(), timeout=30)
+
+        writer.close()
+
+        return output
+
+    async with FakeDeviceServer(options=Options(password=None, output_size=OUTPUT_SIZE)) as server:
+        outputs = await asyncio.gather(*(_session(server.port) for _ in range(CONCURRENT_SESSIONS)))
+
+    assert all(len(output) > OUTPUT_SIZE for output in outputs)
+    assert server.total_sessions == CONCURRENT_SESSIONS
+    assert server.active_sessions == 0
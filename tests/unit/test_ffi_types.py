@@ -0,0 +1,85 @@
+import logging
+import select
+import time
+from ctypes import c_size_t, pointer
+from queue import Queue
+
+from scrapli.ffi_types import (
+    Cancel,
+    CancelScope,
+    FFILogRecord,
+    ZigSlice,
+    ffi_logger_callback_wrapper,
+)
+
+DEADLINE_NS = 10_000_000
+DEADLINE_S = DEADLINE_NS / 1_000_000_000
+
+
+def test_ffi_logger_callback_level_gated(caplog):
+    logger = logging.getLogger("scrapli.test.ffi_logger")
+    logger.setLevel(logging.INFO)
+
+    cb = ffi_logger_callback_wrapper(logger=logger)
+
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        cb(c_size_t(0), 1, pointer(ZigSlice(content=b"debug message")))
+        cb(c_size_t(0), 2, pointer(ZigSlice(content=b"info message")))
+
+    assert [r.getMessage() for r in caplog.records] == ["info message"]
+
+
+def test_ffi_logger_callback_queue():
+    logger = logging.getLogger("scrapli.test.ffi_logger_queue")
+    logger.setLevel(logging.DEBUG)
+
+    queue = Queue()
+
+    cb = ffi_logger_callback_wrapper(logger=logger, queue=queue)
+
+    cb(c_size_t(0), 0, pointer(ZigSlice(content=b"trace message")))
+    cb(c_size_t(0), 3, pointer(ZigSlice(content="wärning".encode())))
+
+    trace_record = queue.get_nowait()
+    assert isinstance(trace_record, FFILogRecord)
+    assert trace_record.levelno == logging.DEBUG
+    assert trace_record.getMessage() == "TRACE: trace message"
+
+    warning_record = queue.get_nowait()
+    assert warning_record.levelno == logging.WARNING
+    assert warning_record.getMessage() == "wärning"
+    assert queue.empty()
+
+
+def test_cancel_scope_children():
+    with CancelScope() as scope:
+        first = scope.child()
+        second = scope.child()
+
+        second.cancel()
+
+        assert second.cancelled is True
+        assert first.cancelled is False
+        assert scope.cancelled is False
+
+        scope.cancel()
+
+        # flipped in the ffi bool itself, not only when checked from python
+        assert first._to_ffi().contents.value is True
+        assert scope.child().cancelled is True
+
+        readable, _, _ = select.select([scope.wakeup_fd], [], [], 0)
+        assert readable == [scope.wakeup_fd]
+
+
+def test_cancel_with_deadline():
+    with Cancel.with_deadline(time.monotonic_ns() + DEADLINE_NS) as scope:
+        child = scope.child()
+
+        assert child.cancelled is False
+        assert 0 < scope.remaining_s <= DEADLINE_S
+
+        time.sleep(DEADLINE_S * 2)
+
+        assert child.cancelled is True
+        assert scope.remaining_s == 0
@@ -0,0 +1,79 @@
+import asyncio
+import os
+import threading
+import time
+from ctypes import c_uint32, pointer
+
+import pytest
+
+from scrapli.exceptions import CancelledException
+from scrapli.ffi_types import CancelScope
+from scrapli.helper import (
+    WAKEUP_FD_POLL_INTERVAL_S,
+    wait_for_available_operation_result,
+    wait_for_available_operation_result_async,
+    without_possessive_quantifiers,
+)
+
+
+@pytest.fixture
+def wakeup_fd():
+    read_fd, write_fd = os.pipe()
+
+    yield read_fd
+
+    os.close(read_fd)
+    os.close(write_fd)
+
+
+def test_wait_for_available_operation_result_cancel_scope(wakeup_fd):
+    with CancelScope() as scope:
+        timer = threading.Timer(0.01, scope.cancel)
+        timer.start()
+
+        start = time.monotonic()
+
+        with pytest.raises(CancelledException):
+            wait_for_available_operation_result(
+                wakeup_fd, cancel=scope.child(), operation_id_ptr=pointer(c_uint32(1))
+            )
+
+        timer.join()
+
+    # woken by the scope rather than on the next poll
+    assert time.monotonic() - start < WAKEUP_FD_POLL_INTERVAL_S
+
+
+def test_wait_for_available_operation_result_async_cancel_scope(wakeup_fd):
+    async def main():
+        with CancelScope(deadline_ns=time.monotonic_ns() + 10_000_000) as scope:
+            waiters = [
+                wait_for_available_operation_result_async(
+                    wakeup_fd, cancel=scope.child(), operation_id_ptr=pointer(c_uint32(1))
+                )
+                for _ in range(10)
+            ]
+
+            return await asyncio.gather(*waiters, return_exceptions=True)
+
+    start = time.monotonic()
+
+    results = asyncio.run(main())
+
+    assert all(isinstance(result, CancelledException) for result in results)
+    assert time.monotonic() - start < WAKEUP_FD_POLL_INTERVAL_S
+
+
+@pytest.mark.parametrize(
+    "pattern,expected",
+    [
+        (r"^\S{1,48}#\s?+$", r"^\S{1,48}#\s?$"),
+        (r"^(?>\w++)>$", r"^(?:\w+)>$"),
+        (r"^a*+b?+c{2,}+d+?$", r"^a*b?c{2,}d+?$"),
+        (r"^[+?]+\+++\(?:x\)$", r"^[+?]+\++\(?:x\)$"),
+        (r"^(?:[]+]++)+$", r"^(?:[]+]+)+$"),
+    ],
+    ids=["possessive", "atomic-group", "quantifiers", "escapes-and-classes", "bracket-class"],
+)
+def test_without_possessive_quantifiers(pattern, expected):
+    assert without_possessive_quantifiers(pattern) == expected
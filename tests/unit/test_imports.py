@@ -0,0 +1,44 @@
+import subprocess
+import sys
+
+import pytest
+
+import scrapli
+
+
+@pytest.mark.parametrize(
+    "statement,not_imported",
+    [
+        ("import scrapli", ("scrapli.cli", "scrapli.netconf")),
+        (
+            "from scrapli import Cli",
+            ("scrapli.netconf", "scrapli.ffi_mapping_netconf", "urllib.request", "xml.etree"),
+        ),
+    ],
+    ids=["scrapli", "cli"],
+)
+def test_lazy_imports(statement, not_imported):
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys; {statement}; print(' '.join(sys.modules))",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    imported = set(proc.stdout.split())
+
+    assert imported.isdisjoint(not_imported)
+
+
+def test_lazy_exports():
+    for name in scrapli.__all__:
+        assert getattr(scrapli, name) is not None
+
+    assert set(scrapli.__all__).issubset(dir(scrapli))
+
+    with pytest.raises(AttributeError):
+        _ = scrapli.NotAnExport
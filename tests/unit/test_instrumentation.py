@@ -0,0 +1,117 @@
+import asyncio
+from time import perf_counter_ns, sleep
+
+import pytest
+
+from scrapli.exceptions import FFIException, TimeoutException
+from scrapli.instrumentation import (
+    instrument_operation,
+    instrument_operation_async,
+    operation_timings,
+    start_operation_timer,
+)
+
+BYTES_READ = 10
+PHASE_SLEEP_S = 0.01
+PHASE_SLEEP_NS = 10_000_000
+PHASES = ("submit_ns", "wait_ns", "fetch_sizes_ns", "fetch_ns", "decode_ns", "result_ns")
+
+
+class _Driver:
+    def __init__(self, callback=None):
+        self.host = "localhost"
+        self.port = 22
+        self._platform_name = "cisco_iosxe"
+        self.operation_timings_callback = callback
+
+    @instrument_operation
+    def send_input(self, input_, slow_phase=None):
+        def _phase(name):
+            if name == slow_phase:
+                sleep(PHASE_SLEEP_S)
+
+        _phase("submit_ns")
+        timer = start_operation_timer()
+        if timer is None:
+            return None
+
+        _phase("wait_ns")
+        timer.waited(operation_id=input_)
+        _phase("fetch_sizes_ns")
+        timer.fetched_sizes()
+        _phase("fetch_ns")
+        timer.fetched()
+        _phase("decode_ns")
+        timer.decoded()
+        _phase("result_ns")
+        timer.finish(bytes_written=len(str(input_)), bytes_read=BYTES_READ)
+
+        return timer.timings
+
+    @instrument_operation
+    def open(self):
+        raise FFIException(TimeoutException("timed out"))
+
+    @instrument_operation_async
+    async def send_input_async(self, input_):
+        return self.send_input.__wrapped__(self, input_)
+
+
+def test_operation_timings_disabled():
+    assert _Driver().send_input(1) is None
+
+
+def test_operation_timings_driver_callback():
+    reported = []
+
+    timings = _Driver(callback=reported.append).send_input(1)
+
+    assert reported == [timings]
+    assert timings.operation == "send_input"
+    assert timings.operation_id == 1
+    assert timings.host == "localhost"
+    assert timings.platform == "cisco_iosxe"
+    assert timings.bytes_written == 1
+    assert timings.bytes_read == BYTES_READ
+    assert timings.failed is False
+    assert timings.start_time > 0
+
+
+@pytest.mark.parametrize("slow_phase", PHASES)
+def test_operation_timings_phases(slow_phase):
+    started = perf_counter_ns()
+    timings = _Driver(callback=lambda _: None).send_input(1, slow_phase=slow_phase)
+    elapsed = perf_counter_ns() - started
+
+    # time is attributed to the phase it was spent in, and never more than the operation took
+    assert getattr(timings, slow_phase) >= PHASE_SLEEP_NS
+    assert max(PHASES, key=lambda phase: getattr(timings, phase)) == slow_phase
+    assert all(getattr(timings, phase) >= 0 for phase in PHASES)
+    assert timings.total_ns <= elapsed
+
+
+def test_operation_timings_context():
+    reported = []
+
+    with operation_timings(reported.append):
+        _Driver().send_input(1)
+        asyncio.run(_Driver().send_input_async(2))
+
+    _Driver().send_input(3)
+
+    assert [(t.operation, t.operation_id) for t in reported] == [
+        ("send_input", 1),
+        ("send_input_async", 2),
+    ]
+
+
+def test_operation_timings_failure():
+    reported = []
+
+    with pytest.raises(FFIException):
+        _Driver(callback=reported.append).open()
+
+    assert len(reported) == 1
+    assert reported[0].operation == "open"
+    assert reported[0].failed is True
+    assert reported[0].error == "timeout"
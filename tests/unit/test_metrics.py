@@ -0,0 +1,138 @@
+import threading
+
+from scrapli.instrumentation import OperationTimings
+from scrapli.metrics import MetricsRegistry
+
+BYTES_READ = 100
+BYTES_WRITTEN = 5
+OPERATIONS = 3
+THREADS = 4
+OPERATIONS_PER_THREAD = 1_000
+
+
+def _timings(operation="send_input", total_ns=20_000_000, **kwargs):
+    return OperationTimings(
+        operation=operation,
+        host="localhost",
+        port=22,
+        operation_id=1,
+        start_time=0,
+        platform="cisco_iosxe",
+        wait_ns=total_ns,
+        **kwargs,
+    )
+
+
+def test_metrics_registry_snapshot():
+    registry = MetricsRegistry(latency_buckets_s=(0.01, 0.1))
+
+    registry(_timings(bytes_written=BYTES_WRITTEN, bytes_read=BYTES_READ))
+    registry(_timings(operation="send_input_async", total_ns=5_000_000, failed_indicator=True))
+    registry(_timings(failed=True, error="timeout", total_ns=1_000_000_000))
+    registry(_timings(operation="open"))
+
+    snapshot = registry.snapshot()
+    labels = {"host": "localhost", "platform": "cisco_iosxe", "operation": "send_input"}
+
+    assert {"labels": labels, "value": OPERATIONS} in snapshot["scrapli_operations_total"]
+    assert snapshot["scrapli_operation_errors_total"] == [
+        {"labels": {**labels, "error": "timeout"}, "value": 1}
+    ]
+    assert snapshot["scrapli_operation_timeouts_total"] == [{"labels": labels, "value": 1}]
+    assert snapshot["scrapli_operation_cancellations_total"] == []
+    assert snapshot["scrapli_failed_indicator_total"] == [{"labels": labels, "value": 1}]
+    assert snapshot["scrapli_bytes_read_total"][0]["value"] == BYTES_READ
+    assert snapshot["scrapli_bytes_written_total"][0]["value"] == BYTES_WRITTEN
+
+    (histogram,) = [
+        sample
+        for sample in snapshot["scrapli_operation_duration_seconds"]
+        if sample["labels"] == labels
+    ]
+    assert histogram["buckets"] == {"0.01": 1, "0.1": 2, "+Inf": OPERATIONS}
+    assert histogram["count"] == OPERATIONS
+
+    assert snapshot["scrapli_open_duration_seconds"][0]["count"] == 1
+    assert snapshot["scrapli_close_duration_seconds"] == []
+
+
+def test_metrics_registry_threads():
+    registry = MetricsRegistry()
+
+    def record():
+        for _ in range(OPERATIONS_PER_THREAD):
+            registry(_timings())
+
+    threads = [threading.Thread(target=record) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert (
+        registry.snapshot()["scrapli_operations_total"][0]["value"]
+        == THREADS * OPERATIONS_PER_THREAD
+    )
+
+    registry.reset()
+
+    assert registry.snapshot()["scrapli_operations_total"] == []
+
+
+def test_metrics_registry_reset_mid_record():
+    registry = MetricsRegistry()
+    paused = threading.Event()
+    resume = threading.Event()
+
+    class _PausedTimings(OperationTimings):
+        @property
+        def total_ns(self):
+            # read after the counters are recorded, before the histograms are
+            paused.set()
+            resume.wait()
+
+            return super().total_ns
+
+    thread = threading.Thread(
+        target=registry,
+        args=(
+            _PausedTimings(
+                operation="send_input", host="localhost", port=22, operation_id=1, start_time=0
+            ),
+        ),
+    )
+    thread.start()
+
+    paused.wait()
+    registry.reset()
+    resume.set()
+
+    thread.join()
+
+    snapshot = registry.snapshot()
+
+    # recorded before the reset is dropped, recorded after it is kept
+    assert snapshot["scrapli_operations_total"] == []
+    assert snapshot["scrapli_operation_duration_seconds"][0]["count"] == 1
+
+
+def test_metrics_registry_to_prometheus():
+    registry = MetricsRegistry(latency_buckets_s=(0.01,))
+
+    registry(_timings(operation="close", total_ns=5_000_000))
+
+    exposition = registry.to_prometheus()
+
+    assert "# TYPE scrapli_operations_total counter\n" in exposition
+    assert (
+        'scrapli_operations_total{host="localhost",platform="cisco_iosxe",operation="close"} 1\n'
+        in exposition
+    )
+    assert (
+        'scrapli_close_duration_seconds_bucket{host="localhost",platform="cisco_iosxe",le="0.01"} 1\n'
+        in exposition
+    )
+    assert (
+        'scrapli_close_duration_seconds_count{host="localhost",platform="cisco_iosxe"} 1\n'
+        in exposition
+    )
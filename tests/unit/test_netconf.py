@@ -1,5 +1,7 @@
 from copy import copy
+from ctypes import POINTER, addressof, c_uint32, cast, memmove, pointer
 from time import sleep
+from unittest.mock import Mock
 
 import pytest
 
@@ -10,7 +12,11 @@ from scrapli import (
     TransportBinOptions,
     TransportTestOptions,
 )
-from scrapli.netconf import DatastoreType
+from scrapli.exceptions import CancelledException, NotOpenedException, OperationException
+from scrapli.ffi_options import DriverOptions
+from scrapli.ffi_types import CancelScope, OperationIdPointer, ZigSlice
+from scrapli.netconf import DatastoreType, PipelineGet, PipelineGetConfig, PipelineValidate
+from scrapli.netconf_result import Result as NetconfResult
 
 
 def test_session_id(netconf):
@@ -19,6 +25,117 @@ def test_session_id(netconf):
         assert n.session_id != 0
 
 
+HELLO_CAPABILITY_COUNT = 27
+
+
+def _recorded_hello(request, fixture):
+    with open(f"{request.node.path.parent}/fixtures/netconf/{fixture}", encoding="utf-8") as f:
+        return next(line for line in f if line.startswith("<hello")).removesuffix("]]>]]>\n")
+
+
+@pytest.mark.parametrize(
+    "capabilities_callback",
+    (None, lambda capabilities: capabilities[:1]),
+    ids=("default", "user"),
+)
+def test_open_capabilities(request, monkeypatch, capabilities_callback):
+    hello = _recorded_hello(request=request, fixture="lock")
+    options = DriverOptions()
+    returned = []
+
+    def _alloc(host, options_ptr):
+        callback = cast(options_ptr, POINTER(DriverOptions)).contents.netconf.capabilities_callback
+
+        # what libscrapli does once it has read the server hello
+        slice_ptr = callback(0, pointer(ZigSlice(content=hello.encode())))
+        returned.append(cast(slice_ptr, POINTER(ZigSlice)).contents.get_decoded_contents())
+
+        return 1
+
+    ffi_mapping = Mock()
+    ffi_mapping.shared_mapping.alloc_driver_options.return_value = addressof(options)
+    ffi_mapping.shared_mapping.get_poll_fd.return_value = 1
+    ffi_mapping.netconf_mapping.alloc.side_effect = _alloc
+
+    n = Netconf(host="localhost")
+    n.options.capabilities_callback = capabilities_callback
+
+    monkeypatch.setattr(n, "ffi_mapping", ffi_mapping)
+    monkeypatch.setattr(n, "_get_result", lambda operation_id_ptr, cancel: "opened")
+
+    assert n.capabilities is None
+    assert n.open() == "opened"
+
+    # the server capabilities, regardless of what a user callback hands back to libscrapli
+    assert len(n.capabilities) == HELLO_CAPABILITY_COUNT
+    assert "urn:ietf:params:netconf:capability:candidate:1.0" in n.capabilities
+    assert n.capabilities.revision("ietf-netconf-acm") == "2018-02-14"
+
+    assert returned[0].startswith("<capability>urn:ietf:params:netconf:base:1.0</capability>")
+    assert returned[0].count("<capability>") == (
+        1 if capabilities_callback is not None else HELLO_CAPABILITY_COUNT
+    )
+
+
+TIMINGS_INPUT = b"<lock><target><running/></target></lock>"
+TIMINGS_RESULT = b"<rpc-reply><ok/></rpc-reply>"
+TIMINGS_RESULT_RAW = b"\n#28\n<rpc-reply><ok/></rpc-reply>\n##\n"
+
+
+def _timings_netconf(monkeypatch):
+    """Netconf with the lock rpc result faked and the operation timings reported"""
+    reported = []
+
+    def _fetch_sizes(**kwargs):
+        kwargs["input_size"].contents.value = len(TIMINGS_INPUT)
+        kwargs["result_raw_size"].contents.value = len(TIMINGS_RESULT_RAW)
+        kwargs["result_size"].contents.value = len(TIMINGS_RESULT)
+
+    def _fetch(**kwargs):
+        for name, content in (
+            ("input_slice", TIMINGS_INPUT),
+            ("result_raw_slice", TIMINGS_RESULT_RAW),
+            ("result_slice", TIMINGS_RESULT),
+        ):
+            memmove(kwargs[name].contents.ptr, content, len(content))
+
+    ffi_mapping = Mock()
+    ffi_mapping.netconf_mapping.fetch_sizes.side_effect = _fetch_sizes
+    ffi_mapping.netconf_mapping.fetch.side_effect = _fetch
+
+    async def _wait_async(*args, **kwargs):
+        return None
+
+    n = Netconf(host="localhost", operation_timings_callback=reported.append)
+    n.ptr = 1
+
+    monkeypatch.setattr(n, "ffi_mapping", ffi_mapping)
+    monkeypatch.setattr("scrapli.netconf.wait_for_available_operation_result", Mock())
+    monkeypatch.setattr("scrapli.netconf.wait_for_available_operation_result_async", _wait_async)
+
+    return n, reported
+
+
+def test_operation_timings_bytes(monkeypatch):
+    n, reported = _timings_netconf(monkeypatch)
+
+    assert n.lock().result == TIMINGS_RESULT.decode()
+
+    assert reported[0].bytes_written == len(TIMINGS_INPUT)
+    # the (processed) result is fetched alongside the raw result, so both are read
+    assert reported[0].bytes_read == len(TIMINGS_RESULT) + len(TIMINGS_RESULT_RAW)
+
+
+@pytest.mark.asyncio
+async def test_operation_timings_bytes_async(monkeypatch):
+    n, reported = _timings_netconf(monkeypatch)
+
+    assert (await n.lock_async()).result == TIMINGS_RESULT.decode()
+
+    assert reported[0].bytes_written == len(TIMINGS_INPUT)
+    assert reported[0].bytes_read == len(TIMINGS_RESULT) + len(TIMINGS_RESULT_RAW)
+
+
 ACTION_ARGNAMES = ("action",)
 ACTION_ARGVALUES = (
     (
@@ -487,15 +604,13 @@ async def test_validate_async(netconf, netconf_assert_result):
 
 def test_get_next_notification(request, netconf):
     with netconf as n:
-        _ = n.raw_rpc(
-            payload="""
+        _ = n.raw_rpc(payload="""
 <create-subscription xmlns="urn:ietf:params:xml:ns:netconf:notification:1.0">
     <stream>NETCONF</stream>
     <filter type="subtree">
         <counter-update xmlns="urn:boring:counter"/>
     </filter>
-</create-subscription>"""
-        )
+</create-subscription>""")
 
         if request.config.getoption("--record"):
             # boring counter updates every 3s; only when recording fixture ofc
@@ -544,14 +659,12 @@ def test_get_next_subscription(request):
     )
 
     with netconf as n:
-        r = n.raw_rpc(
-            payload="""
+        r = n.raw_rpc(payload="""
 <establish-subscription xmlns="urn:ietf:params:xml:ns:yang:ietf-event-notifications" xmlns:yp="urn:ietf:params:xml:ns:yang:ietf-yang-push">
     <stream>yp:yang-push</stream>
     <yp:xpath-filter>/mdt-oper:mdt-oper-data/mdt-subscriptions</yp:xpath-filter>
     <yp:period>1000</yp:period>
-</establish-subscription>"""
-        )
+</establish-subscription>""")
 
         if request.config.getoption("--record"):
             # only when recording fixture ofc
@@ -565,3 +678,274 @@ def test_get_next_subscription(request):
         actual = n.get_next_subscription(subscription_id=n.get_subscription_id(r.result))
 
         assert actual is not None
+
+
+def _pipeline_netconf(monkeypatch, failures=None, submit_failure_at=None):
+    """Netconf with pipeline submits/results faked, failures maps operation id to an exception"""
+    failures = failures or {}
+
+    n = Netconf(host="localhost")
+
+    submitted = []
+    fetched = []
+
+    def _submit_pipeline_rpc(rpc, cancel):
+        if len(submitted) == submit_failure_at:
+            raise NotOpenedException
+
+        submitted.append(rpc)
+
+        return OperationIdPointer(c_uint32(len(submitted))), ()
+
+    def _fetch(operation_id_ptr, cancel):
+        operation_id = operation_id_ptr.contents.value
+        fetched.append((operation_id, cancel))
+
+        # only fails the first time, a drain after failing fetches the result
+        exc = failures.pop(operation_id, None)
+        if exc is not None:
+            raise exc
+
+        return f"result-{operation_id}"
+
+    async def _fetch_async(operation_id_ptr, cancel):
+        return _fetch(operation_id_ptr=operation_id_ptr, cancel=cancel)
+
+    monkeypatch.setattr(n, "_submit_pipeline_rpc", _submit_pipeline_rpc)
+    monkeypatch.setattr(n, "_get_result", _fetch)
+    monkeypatch.setattr(n, "_get_result_async", _fetch_async)
+
+    return n, submitted, fetched
+
+
+PIPELINE_RPCS = [PipelineGetConfig(), PipelineGet(), PipelineValidate()]
+PIPELINE_SUBMITTED_BEFORE_FAILURE = 2
+
+
+def test_pipeline_result_order(monkeypatch):
+    n, submitted, fetched = _pipeline_netconf(monkeypatch)
+
+    actual = n.pipeline(PIPELINE_RPCS)
+
+    assert submitted == PIPELINE_RPCS
+    assert actual == ["result-1", "result-2", "result-3"]
+    assert [operation_id for operation_id, _ in fetched] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_async_result_order(monkeypatch):
+    n, _, fetched = _pipeline_netconf(monkeypatch)
+
+    actual = await n.pipeline_async(PIPELINE_RPCS)
+
+    assert actual == ["result-1", "result-2", "result-3"]
+    assert [operation_id for operation_id, _ in fetched] == [1, 2, 3]
+
+
+def test_pipeline_operation_error(monkeypatch):
+    n, _, fetched = _pipeline_netconf(monkeypatch, failures={2: OperationException("boom")})
+
+    with pytest.raises(OperationException, match="boom"):
+        n.pipeline(PIPELINE_RPCS)
+
+    # the failure is raised only after every result was fetched
+    assert [operation_id for operation_id, _ in fetched] == [1, 2, 3]
+
+
+def test_pipeline_submit_failure(monkeypatch):
+    n, submitted, fetched = _pipeline_netconf(
+        monkeypatch, submit_failure_at=PIPELINE_SUBMITTED_BEFORE_FAILURE
+    )
+
+    with pytest.raises(NotOpenedException):
+        n.pipeline(PIPELINE_RPCS)
+
+    # the rpcs submitted before the failure are still fetched
+    assert len(submitted) == PIPELINE_SUBMITTED_BEFORE_FAILURE
+    assert [operation_id for operation_id, _ in fetched] == [1, 2]
+
+
+def test_pipeline_cancelled(monkeypatch):
+    n, _, fetched = _pipeline_netconf(monkeypatch, failures={2: CancelledException()})
+
+    with pytest.raises(CancelledException):
+        n.pipeline(PIPELINE_RPCS)
+
+    # the cancelled rpc and every rpc after it are drained with a bounded (deadline) cancel
+    assert [operation_id for operation_id, _ in fetched] == [1, 2, 2, 3]
+    assert all(isinstance(cancel, CancelScope) for _, cancel in fetched[2:])
+
+
+@pytest.mark.asyncio
+async def test_pipeline_async_cancelled(monkeypatch):
+    n, _, fetched = _pipeline_netconf(monkeypatch, failures={1: CancelledException()})
+
+    with pytest.raises(CancelledException):
+        await n.pipeline_async(PIPELINE_RPCS)
+
+    assert [operation_id for operation_id, _ in fetched] == [1, 1, 2, 3]
+
+
+def _transaction_result(rpc_errors=""):
+    return NetconfResult(
+        input_="",
+        host="localhost",
+        port=830,
+        start_time=0,
+        end_time=0,
+        result_raw_journal=b"",
+        _result="<ok/>" if not rpc_errors else "<rpc-error/>",
+        rpc_warnings="",
+        rpc_errors=rpc_errors,
+    )
+
+
+def _transaction_netconf(monkeypatch, fail=(), raise_on=None, abort_raises=False):
+    """
+    Netconf with the transaction rpcs faked, `fail` names steps returning an rpc-error,
+    `raise_on` a step raising an OperationException
+    """
+    n = Netconf(host="localhost")
+
+    called = []
+
+    def _step(name):
+        called.append(name)
+
+        if name == raise_on:
+            raise OperationException(f"{name} exploded")
+
+        if abort_raises and name in ("discard", "unlock"):
+            raise OperationException(f"{name} exploded too")
+
+        return _transaction_result(rpc_errors="bad" if name in fail else "")
+
+    def _pipeline(rpcs, cancel):
+        return [
+            _step("validate" if isinstance(rpc, PipelineValidate) else "edit_config")
+            for rpc in rpcs
+        ]
+
+    async def _pipeline_async(rpcs, cancel):
+        return _pipeline(rpcs=rpcs, cancel=cancel)
+
+    for name in ("lock", "commit", "discard", "unlock"):
+
+        def _sync(*args, _name=name, **kwargs):
+            return _step(_name)
+
+        async def _async(*args, _name=name, **kwargs):
+            return _step(_name)
+
+        monkeypatch.setattr(n, name, _sync)
+        monkeypatch.setattr(n, f"{name}_async", _async)
+
+    monkeypatch.setattr(n, "pipeline", _pipeline)
+    monkeypatch.setattr(n, "pipeline_async", _pipeline_async)
+
+    return n, called
+
+
+def test_transaction(monkeypatch):
+    n, called = _transaction_netconf(monkeypatch)
+
+    actual = n.transaction(["<config/>", "<config/>"])
+
+    assert actual.committed
+    assert called == ["lock", "edit_config", "edit_config", "validate", "commit", "unlock"]
+
+
+def test_transaction_operation_timeout(monkeypatch):
+    n = Netconf(host="localhost")
+    n.ptr = 1
+
+    applied = []
+
+    def _get_result(operation_id_ptr, cancel):
+        applied.append(n._operation_timeout_ns)
+
+        return _transaction_result()
+
+    monkeypatch.setattr(n, "ffi_mapping", Mock())
+    monkeypatch.setattr(n, "_get_result", _get_result)
+
+    assert n.transaction(["<config/>"], operation_timeout_ns=1).committed
+
+    # lock, edit_config, validate, commit and unlock all under the transaction timeout
+    assert applied == [1] * 5
+
+
+@pytest.mark.asyncio
+async def test_transaction_async_operation_timeout(monkeypatch):
+    n = Netconf(host="localhost")
+    n.ptr = 1
+
+    applied = []
+
+    async def _get_result_async(operation_id_ptr, cancel):
+        applied.append(n._operation_timeout_ns)
+
+        return _transaction_result()
+
+    monkeypatch.setattr(n, "ffi_mapping", Mock())
+    monkeypatch.setattr(n, "_get_result_async", _get_result_async)
+
+    assert (await n.transaction_async(["<config/>"], operation_timeout_ns=1)).committed
+
+    assert applied == [1] * 5
+
+
+def test_transaction_lock_failed(monkeypatch):
+    n, called = _transaction_netconf(monkeypatch, fail=("lock",))
+
+    actual = n.transaction("<config/>")
+
+    assert not actual.committed
+    assert actual.failed_step.name == "lock"
+    # nothing was locked, so there is nothing to abort
+    assert called == ["lock"]
+
+
+@pytest.mark.asyncio
+async def test_transaction_async_rpc_error(monkeypatch):
+    n, called = _transaction_netconf(monkeypatch, fail=("edit_config",))
+
+    actual = await n.transaction_async("<config/>")
+
+    assert not actual.committed
+    assert actual.failed_step.name == "edit_config"
+    # never committed, aborted instead
+    assert called == ["lock", "edit_config", "validate", "discard", "unlock"]
+
+
+def test_transaction_commit_failed(monkeypatch):
+    n, called = _transaction_netconf(monkeypatch, fail=("commit",))
+
+    actual = n.transaction("<config/>")
+
+    assert not actual.committed
+    assert actual.failed_step.name == "commit"
+    assert called == ["lock", "edit_config", "validate", "commit", "discard", "unlock"]
+
+
+@pytest.mark.parametrize("abort_raises", (False, True), ids=("abort-ok", "abort-raises"))
+def test_transaction_exception_aborts(monkeypatch, abort_raises):
+    n, called = _transaction_netconf(monkeypatch, raise_on="commit", abort_raises=abort_raises)
+
+    # the original exception is raised, even if aborting fails as well
+    with pytest.raises(OperationException, match="commit exploded"):
+        n.transaction("<config/>")
+
+    # unlock is tried even if discard failed
+    assert called == ["lock", "edit_config", "validate", "commit", "discard", "unlock"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("abort_raises", (False, True), ids=("abort-ok", "abort-raises"))
+async def test_transaction_async_exception_aborts(monkeypatch, abort_raises):
+    n, called = _transaction_netconf(monkeypatch, raise_on="validate", abort_raises=abort_raises)
+
+    with pytest.raises(OperationException, match="validate exploded"):
+        await n.transaction_async("<config/>")
+
+    assert called == ["lock", "edit_config", "validate", "discard", "unlock"]
@@ -0,0 +1,36 @@
+from scrapli.netconf_capabilities import Capabilities
+
+CAPABILITIES = [
+    "urn:ietf:params:netconf:base:1.0",
+    "urn:ietf:params:netconf:base:1.1",
+    "urn:ietf:params:netconf:capability:candidate:1.0",
+    "urn:ietf:params:xml:ns:yang:ietf-interfaces?module=ietf-interfaces&revision=2018-02-20"
+    "&features=arbitrary-names,pre-provisioning&deviations=vendor-deviations",
+    "urn:ietf:params:xml:ns:yang:ietf-ip?module=ietf-ip",
+]
+
+
+def test_capabilities():
+    caps = Capabilities.from_list(CAPABILITIES)
+
+    assert len(caps) == len(CAPABILITIES)
+
+    assert "urn:ietf:params:netconf:capability:candidate:1.0" in caps
+    assert caps.has_capability("urn:ietf:params:xml:ns:yang:ietf-interfaces")
+    assert not caps.has_capability("urn:ietf:params:netconf:capability:startup:1.0")
+
+    interfaces = caps.module("ietf-interfaces")
+    assert interfaces.namespace == "urn:ietf:params:xml:ns:yang:ietf-interfaces"
+    assert interfaces.deviations == frozenset({"vendor-deviations"})
+
+    assert caps.revision("ietf-interfaces") == "2018-02-20"
+    assert caps.revision("ietf-ip") is None
+    assert caps.revision("nope") is None
+
+    assert caps.has_feature("ietf-interfaces", "pre-provisioning")
+    assert not caps.has_feature("ietf-ip", "pre-provisioning")
+
+
+def test_capabilities_from_list_shared():
+    assert Capabilities.from_list(CAPABILITIES) is Capabilities.from_list(list(CAPABILITIES))
+    assert Capabilities.from_list(CAPABILITIES) is not Capabilities.from_list(CAPABILITIES[:2])
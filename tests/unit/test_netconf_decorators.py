@@ -5,6 +5,9 @@ import pytest
 from scrapli import Netconf
 from scrapli.netconf_decorators import handle_operation_timeout, handle_operation_timeout_async
 
+# applying the operation timeout and then restoring the session timeout
+TIMEOUT_SET_AND_RESTORED_CALLS = 2
+
 
 def test_handle_operation_timeout_unmodified():
     n = Netconf(
@@ -82,3 +85,70 @@ async def test_handle_operation_timeout_async_modified():
     await n.fooer(n, operation_timeout_ns=1)
 
     assert n.ffi_mapping.session_mapping.set_operation_timeout_ns.called is True
+
+
+def test_handle_operation_timeout_skips_redundant_sets():
+    n = Netconf(
+        host="localhost",
+    )
+
+    n.ffi_mapping = Mock()
+    n.ffi_mapping.session_mapping.set_operation_timeout_ns = Mock(return_value=0)
+    n.ptr = 1
+
+    @handle_operation_timeout
+    def fooer(cls, *, operation_timeout_ns: int | None = None) -> str:
+        return "foo'd"
+
+    n.fooer = fooer
+
+    n.fooer(n, operation_timeout_ns=1)
+    n.fooer(n, operation_timeout_ns=1)
+
+    assert n.ffi_mapping.session_mapping.set_operation_timeout_ns.call_count == 1
+
+    # back to the session timeout, once
+    n.fooer(n)
+    n.fooer(n)
+
+    assert (
+        n.ffi_mapping.session_mapping.set_operation_timeout_ns.call_count
+        == TIMEOUT_SET_AND_RESTORED_CALLS
+    )
+
+
+def test_handle_operation_timeout_nested():
+    n = Netconf(
+        host="localhost",
+    )
+
+    n.ffi_mapping = Mock()
+    n.ffi_mapping.session_mapping.set_operation_timeout_ns = Mock(return_value=0)
+    n.ptr = 1
+
+    applied = []
+
+    @handle_operation_timeout
+    def inner(cls, *, operation_timeout_ns: int | None = None) -> str:
+        applied.append(cls._operation_timeout_ns)
+
+        return "foo'd"
+
+    @handle_operation_timeout
+    def outer(cls, *, operation_timeout_ns: int | None = None) -> str:
+        return cls.inner(cls)
+
+    n.inner = inner
+    n.outer = outer
+
+    # the inner operation keeps the timeout of the outer one rather than the session timeout
+    n.outer(n, operation_timeout_ns=1)
+
+    assert applied == [1]
+    assert n.ffi_mapping.session_mapping.set_operation_timeout_ns.call_count == 1
+
+    # and only while nested
+    n.inner(n)
+
+    assert applied == [1, n._operation_timeout_ns]
+    assert applied[-1] != 1
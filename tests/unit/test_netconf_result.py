@@ -0,0 +1,169 @@
+import pytest
+
+from scrapli.exceptions import ParsingException
+from scrapli.netconf_result import Result, TransactionResult, TransactionStep
+
+DATA_REPLY_INTERFACE_COUNT = 2
+TRANSACTION_ELAPSED_S = 7e-06
+
+RPC_ERROR_REPLY = """<?xml version="1.0" encoding="UTF-8"?>
+<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="101">
+  <rpc-error>
+    <error-type>application</error-type>
+    <error-tag>invalid-value</error-tag>
+    <error-severity>error</error-severity>
+    <error-message xml:lang="en">bad thing</error-message>
+    <error-info><bad-element>foo</bad-element></error-info>
+  </rpc-error>
+</rpc-reply>"""
+
+DATA_REPLY = """<?xml version="1.0" encoding="UTF-8"?>
+<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="101">
+  <data>
+    <interfaces xmlns="urn:ietf:params:xml:ns:yang:ietf-interfaces">
+      <interface><name>eth0</name></interface>
+      <interface><name>eth1</name></interface>
+    </interfaces>
+  </data>
+</rpc-reply>"""
+
+
+def _result(result: str, rpc_errors: str = "", start_time: int = 0, end_time: int = 0) -> Result:
+    return Result(
+        input_="",
+        host="localhost",
+        port=830,
+        start_time=start_time,
+        end_time=end_time,
+        result_raw_journal=b"",
+        _result=result,
+        rpc_warnings="",
+        rpc_errors=rpc_errors,
+    )
+
+
+@pytest.mark.parametrize(
+    ("result", "expected"),
+    [
+        ("<rpc-reply/>", "<rpc-reply/>"),
+        ('\n <?xml version="1.0"?>\n<rpc-reply/>\n', "<rpc-reply/>\n"),
+        ('<?xml version="1.0"', '<?xml version="1.0"'),
+    ],
+    ids=["no-header", "header", "unterminated-header"],
+)
+def test_result_stripped(result, expected):
+    r = _result(result)
+
+    assert r.result == expected
+    assert r.result == expected
+
+
+def test_result_stripped_not_copied():
+    r = _result(DATA_REPLY.split("?>", maxsplit=1)[1].lstrip())
+
+    # without a header to strip the result is handed back as is, never held twice
+    assert r.result is r._result
+
+
+def test_result_xml_cached():
+    r = _result(DATA_REPLY)
+
+    assert r.result.startswith("<rpc-reply")
+    assert r.xml is r.xml
+
+
+def test_result_findall():
+    r = _result(DATA_REPLY)
+
+    names = r.findall(
+        ".//if:interface/if:name",
+        namespaces={"if": "urn:ietf:params:xml:ns:yang:ietf-interfaces"},
+    )
+
+    assert [n.text for n in names] == ["eth0", "eth1"]
+    assert len(r.findall("nc:data")) == 1
+
+
+def test_result_rpc_errors_parsed():
+    r = _result(RPC_ERROR_REPLY, rpc_errors="bad thing")
+
+    parsed = r.rpc_errors_parsed
+
+    assert len(parsed) == 1
+    assert parsed[0]["error-tag"] == "invalid-value"
+    assert parsed[0]["error-message"] == "bad thing"
+    assert "bad-element" in parsed[0]["error-info"]
+    assert r.rpc_errors_parsed is parsed
+
+
+def test_result_rpc_errors_parsed_no_errors():
+    assert not _result(DATA_REPLY).rpc_errors_parsed
+
+
+def test_result_xml_invalid():
+    with pytest.raises(ParsingException):
+        _ = _result("not xml").xml
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 65_536], ids=["1", "7", "65536"])
+def test_result_iterparse(chunk_size):
+    r = _result(DATA_REPLY)
+
+    names = [
+        el.find("{urn:ietf:params:xml:ns:yang:ietf-interfaces}name").text
+        for el in r.iterparse(tag="interface", chunk_size=chunk_size)
+    ]
+
+    assert names == ["eth0", "eth1"]
+
+
+def test_result_iterparse_clears_consumed():
+    r = _result(DATA_REPLY)
+
+    consumed = list(r.iterparse(tag="interface"))
+
+    assert len(consumed) == DATA_REPLY_INTERFACE_COUNT
+    assert all(len(el) == 0 for el in consumed)
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("interfaces/interface/name", ["eth0", "eth1"]),
+        ("/rpc-reply/data/interfaces/interface/name", ["eth0", "eth1"]),
+        ("/data/interfaces/interface/name", []),
+        ("interface/*", ["eth0", "eth1"]),
+    ],
+    ids=["relative", "anchored", "anchored_no_match", "wildcard"],
+)
+def test_result_iter_elements(path, expected):
+    r = _result(DATA_REPLY)
+
+    assert [el.text for el in r.iter_elements(path=path)] == expected
+
+
+def test_result_iterparse_invalid():
+    with pytest.raises(ParsingException):
+        list(_result("<rpc-reply><data>").iterparse(tag="data"))
+
+
+def test_transaction_result():
+    r = TransactionResult(
+        host="localhost",
+        port=830,
+        steps=[
+            TransactionStep(name="lock", result=_result("<ok/>", start_time=0, end_time=1_000)),
+            TransactionStep(
+                name="edit_config",
+                result=_result(RPC_ERROR_REPLY, "bad thing", start_time=2_000, end_time=5_000),
+            ),
+            TransactionStep(
+                name="discard", result=_result("<ok/>", start_time=6_000, end_time=7_000)
+            ),
+        ],
+    )
+
+    assert r.failed is True
+    assert r.failed_step.name == "edit_config"
+    assert r.timings == [("lock", 1e-06), ("edit_config", 3e-06), ("discard", 1e-06)]
+    assert r.elapsed_time_seconds == TRANSACTION_ELAPSED_S
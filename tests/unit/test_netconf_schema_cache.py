@@ -0,0 +1,47 @@
+from scrapli.netconf_schema_cache import SchemaCache
+
+EXPECTED_MISSES = 3
+
+
+def test_schema_cache_hit_miss(tmp_path):
+    cache = SchemaCache(path=str(tmp_path))
+
+    assert cache.get(identifier="ietf-interfaces", version="2018-02-20", format_="yang") is None
+
+    cache.set(identifier="ietf-interfaces", version="2018-02-20", format_="yang", reply="foo")
+
+    assert cache.get(identifier="ietf-interfaces", version="2018-02-20", format_="yang") == "foo"
+    assert cache.get(identifier="ietf-interfaces", version="2014-05-08", format_="yang") is None
+    assert cache.get(identifier="ietf-interfaces", version="2018-02-20", format_="yin") is None
+
+    stats = cache.stats
+    assert stats.hits == 1
+    assert stats.misses == EXPECTED_MISSES
+
+
+def test_schema_cache_disk(tmp_path):
+    SchemaCache(path=str(tmp_path)).set(
+        identifier="ietf-interfaces", version="2018-02-20", format_="yang", reply="foo"
+    )
+
+    assert (tmp_path / "yang" / "ietf-interfaces@2018-02-20.xml").read_text() == "foo"
+
+    # fresh cache (i.e. a different process/device) is served from disk
+    cache = SchemaCache(path=str(tmp_path))
+
+    assert cache.get(identifier="ietf-interfaces", version="2018-02-20", format_="yang") == "foo"
+    assert cache.stats.hits == 1
+
+
+def test_schema_cache_unsafe_name(tmp_path):
+    cache = SchemaCache(path=str(tmp_path))
+
+    cache.set(identifier="../evil", version="2018-02-20", format_="yang", reply="foo")
+
+    assert not (tmp_path.parent / "evil@2018-02-20.xml").exists()
+    assert (
+        SchemaCache(path=str(tmp_path)).get(
+            identifier="../evil", version="2018-02-20", format_="yang"
+        )
+        == "foo"
+    )
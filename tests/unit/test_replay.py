@@ -0,0 +1,70 @@
+import asyncio
+import gzip
+
+import pytest
+
+from scrapli.exceptions import OptionsException
+from scrapli.replay import Replay
+from scrapli.session_recorder import SessionRecorder
+
+CHUNK_SIZE = 8
+
+
+def test_replay_wire_speed(tmp_path):
+    recording = tmp_path / "r1.log.gz"
+    with gzip.open(recording, "wb") as f:
+        f.write(b"router#show version\nfoo\nrouter#")
+
+    replay = Replay(path=str(recording), chunk_size=CHUNK_SIZE, cache_dir=str(tmp_path / "cache"))
+
+    assert replay.compressed is True
+    assert b"".join(replay.chunks()) == b"router#show version\nfoo\nrouter#"
+    assert all(len(chunk) <= CHUNK_SIZE for chunk in replay.chunks())
+
+    plain_path = replay.materialize()
+    assert plain_path.startswith(str(tmp_path / "cache"))
+    assert replay.transport_options().f == plain_path
+    assert replay.session_options(operation_timeout_s=1).read_size == CHUNK_SIZE
+
+    with open(plain_path, "rb") as f:
+        assert f.read() == b"router#show version\nfoo\nrouter#"
+
+
+def test_replay_timed(tmp_path):
+    with SessionRecorder(path=str(tmp_path), prefix="r1", record_timings=True) as recorder:
+        recorder("foo")
+        recorder("bar")
+        recorder("baz")
+
+    (segment,) = recorder.segments()
+
+    replay = Replay(path=str(segment), speed=1_000)
+
+    timings = replay.timings
+    assert timings is not None
+    assert [offset for offset, _ in timings] == [0, 3, 6]
+
+    assert list(replay.chunks()) == [b"foo", b"bar", b"baz"]
+
+    async def _collect():
+        return [chunk async for chunk in replay.chunks_async()]
+
+    assert asyncio.run(_collect()) == [b"foo", b"bar", b"baz"]
+
+
+def test_replay_invalid_speed(tmp_path):
+    with pytest.raises(OptionsException):
+        Replay(path=str(tmp_path / "r1.log"), speed=0)
+
+
+def test_replay_materialize_corrupt(tmp_path):
+    recording = tmp_path / "r1.log.gz"
+    recording.write_bytes(gzip.compress(b"router#show version\nfoo\nrouter#")[:-8])
+
+    cache_dir = tmp_path / "cache"
+
+    with pytest.raises(EOFError):
+        Replay(path=str(recording), cache_dir=str(cache_dir)).materialize()
+
+    # neither a partial recording nor its tmp file are left behind
+    assert list(cache_dir.iterdir()) == []
@@ -0,0 +1,57 @@
+import pytest
+
+from scrapli.session_recorder import RecorderCompression, SessionRecorder, open_recording
+
+MAX_SEGMENTS = 2
+
+
+@pytest.mark.parametrize(
+    "compression",
+    [RecorderCompression.GZIP, RecorderCompression.LZMA, RecorderCompression.NONE],
+    ids=["gzip", "lzma", "none"],
+)
+def test_session_recorder(tmp_path, compression):
+    with SessionRecorder(path=str(tmp_path), prefix="r1", compression=compression) as recorder:
+        recorder("foo\n")
+        recorder("bar\n")
+
+        # still buffered
+        assert recorder.segments() == []
+
+    segments = recorder.segments()
+    assert len(segments) == 1
+    assert segments[0].name.endswith(compression.suffix)
+
+    with open_recording(str(segments[0])) as f:
+        assert f.read() == b"foo\nbar\n"
+
+
+def test_session_recorder_rotation(tmp_path):
+    recorder = SessionRecorder(
+        path=str(tmp_path),
+        prefix="r1",
+        buffer_size=1,
+        max_segment_size=10,
+        max_segments=MAX_SEGMENTS,
+    )
+
+    # unrelated hosts sharing the directory are never pruned
+    SessionRecorder(path=str(tmp_path), prefix="r1.lab", buffer_size=1)("baz\n")
+
+    for idx in range(4):
+        recorder(f"foo{idx}\n")
+        recorder(f"bar{idx}\n")
+
+    recorder("closing")
+    recorder.close()
+
+    segments = recorder.segments()
+    assert len(segments) == MAX_SEGMENTS
+
+    contents = []
+    for segment in segments:
+        with open_recording(str(segment)) as f:
+            contents.append(f.read())
+
+    assert contents == [b"foo3\nbar3\n", b"closing"]
+    assert len(list(tmp_path.glob("r1.lab.*"))) == 1